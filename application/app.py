@@ -1,13 +1,23 @@
 import http
+import logging
 import time
 from contextlib import asynccontextmanager
 from typing import Any, AsyncGenerator
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 
 from application.constants import AppConstants
 from application.providers import DependenciesProvider
-from application.routers import DomainRouterSource, domain_router
+from application.routers import (
+    AdminRouterSource,
+    DomainRouterSource,
+    JobRouterSource,
+    MetricsRouterSource,
+    admin_router,
+    domain_router,
+    job_router,
+    metrics_router,
+)
 
 
 class App:
@@ -17,7 +27,15 @@ class App:
         async def lifespan(_) -> AsyncGenerator[None, Any]:  # type: ignore
             provider.logger_hub.initialize()
             App._initialize_routers(provider)
+            await provider.source_registry.load()
+            await provider.loop_lag_monitor.start()
+            await App._start_browser(provider)
             yield
+            await provider.job_manager.shutdown()
+            await provider.loop_lag_monitor.stop()
+            await provider.browser_manager.stop()
+            await provider.db_context.close()
+            provider.logger_hub.shutdown()
 
         current_app = FastAPI(
             title=AppConstants.APP_TITLE,
@@ -26,29 +44,76 @@ class App:
         )
 
         current_app.include_router(router=domain_router)
+        current_app.include_router(router=job_router)
+        current_app.include_router(router=metrics_router)
+        current_app.include_router(router=admin_router)
 
         @current_app.middleware("http")
         async def add_process_time_header(request, call_next):  # type: ignore
-            start_time = time.time()
+            start_time = time.perf_counter()
             response = await call_next(request)
-            url = f"{request.url.path}?{request.query_params}" if request.query_params else request.url.path
-            process_time = (time.time() - start_time) * 1000
-            formatted_process_time = "{0:.2f}".format(process_time)
-            host = getattr(getattr(request, "client", None), "host", None)
-            port = getattr(getattr(request, "client", None), "port", None)
-            try:
-                status_phrase = http.HTTPStatus(response.status_code).phrase
-            except ValueError:
-                status_phrase = ""
-            provider.logger_hub.api_log.info(
-                f'{host}:{port} - "{request.method} {url}" '
-                f"{response.status_code} {status_phrase} {formatted_process_time} ms"
+            elapsed = time.perf_counter() - start_time
+            provider.metrics.http_request_seconds.observe(
+                elapsed,
+                method=request.method,
+                route=getattr(request.scope.get("route"), "path", "unmatched"),
+                status=str(response.status_code),
             )
+            process_time = elapsed * 1000
+            formatted_process_time = "{0:.2f}".format(process_time)
+            if provider.logger_hub.should_log_api(logging.INFO):
+                App._log_request(provider, request, response, process_time, formatted_process_time)
             response.headers["X-Process-Time"] = f"{formatted_process_time} ms"
             return response
 
         return current_app
 
+    @staticmethod
+    def _log_request(
+        provider: DependenciesProvider,
+        request: Request,
+        response: Response,
+        process_time: float,
+        formatted_process_time: str,
+    ) -> None:
+        url = f"{request.url.path}?{request.query_params}" if request.query_params else request.url.path
+        host = getattr(getattr(request, "client", None), "host", None)
+        port = getattr(getattr(request, "client", None), "port", None)
+        try:
+            status_phrase = http.HTTPStatus(response.status_code).phrase
+        except ValueError:
+            status_phrase = ""
+        provider.logger_hub.api_log.info(
+            '%s:%s - "%s %s" %s %s %s ms',
+            host,
+            port,
+            request.method,
+            url,
+            response.status_code,
+            status_phrase,
+            formatted_process_time,
+            extra={
+                "client": f"{host}:{port}",
+                "method": request.method,
+                "path": url,
+                "status": response.status_code,
+                "duration_ms": round(process_time, 2),
+            },
+        )
+
     @staticmethod
     def _initialize_routers(provider: DependenciesProvider) -> None:
         DomainRouterSource.set(provider=provider)
+        JobRouterSource.set(provider=provider)
+        MetricsRouterSource.set(provider=provider)
+        AdminRouterSource.set(provider=provider)
+
+    @staticmethod
+    async def _start_browser(provider: DependenciesProvider) -> None:
+        """Warms up the browser, unless crawls run in worker processes that launch their own."""
+        if provider.config.scraper.WORKERS > 0:
+            return
+        try:
+            await provider.browser_manager.start()
+        except Exception as e:
+            provider.logger_hub.service_log.error(f"browser is not started, will retry on first job: {e}")
@@ -1,5 +1,7 @@
 __all__ = [
     "JsonResponseBuilder",
+    "StreamResponseBuilder",
 ]
 
 from .json_response_builder import JsonResponseBuilder
+from .stream_response_builder import StreamResponseBuilder
@@ -1,7 +1,7 @@
 import json
 from typing import Self
 
-from fastapi import Response
+from fastapi import Response, status
 
 
 class JsonResponseBuilder:
@@ -10,6 +10,8 @@ class JsonResponseBuilder:
     def __init__(self) -> None:
         self._json: str | None = None
         self._status: int = 0
+        self._etag: str | None = None
+        self._if_none_match: str | None = None
 
     def with_json(self, json_str: str) -> Self:
         self._json = json_str
@@ -23,7 +25,28 @@ class JsonResponseBuilder:
         self._status = status
         return self
 
+    def with_etag(self, etag: str, if_none_match: str | None = None) -> Self:
+        self._etag = etag
+        self._if_none_match = if_none_match
+        return self
+
     def respond(self) -> Response:
+        if self._etag is None:
+            return Response(
+                content=self._json, media_type=JsonResponseBuilder._MEDIA_TYPE, status_code=self._status
+            )
+        headers = {"ETag": self._etag, "Cache-Control": "no-cache"}
+        if self._is_not_modified():
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
         return Response(
-            content=self._json, media_type=JsonResponseBuilder._MEDIA_TYPE, status_code=self._status
+            content=self._json,
+            media_type=JsonResponseBuilder._MEDIA_TYPE,
+            status_code=self._status,
+            headers=headers,
         )
+
+    def _is_not_modified(self) -> bool:
+        if self._if_none_match is None:
+            return False
+        tags = [tag.strip().removeprefix("W/") for tag in self._if_none_match.split(",")]
+        return "*" in tags or self._etag in tags
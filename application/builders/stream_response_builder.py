@@ -0,0 +1,37 @@
+from typing import AsyncIterator, Self
+
+from fastapi.responses import StreamingResponse
+
+
+class StreamResponseBuilder:
+    def __init__(self) -> None:
+        self._chunks: AsyncIterator[bytes] | None = None
+        self._media_type: str = "application/octet-stream"
+        self._file_name: str | None = None
+        self._status: int = 0
+
+    def with_chunks(self, chunks: AsyncIterator[bytes]) -> Self:
+        self._chunks = chunks
+        return self
+
+    def with_media_type(self, media_type: str) -> Self:
+        self._media_type = media_type
+        return self
+
+    def with_file_name(self, file_name: str) -> Self:
+        self._file_name = file_name
+        return self
+
+    def with_status(self, status: int) -> Self:
+        self._status = status
+        return self
+
+    def respond(self) -> StreamingResponse:
+        if self._chunks is None:
+            raise RuntimeError("stream response requires chunks")
+        headers = {}
+        if self._file_name:
+            headers["Content-Disposition"] = f'attachment; filename="{self._file_name}"'
+        return StreamingResponse(
+            content=self._chunks, media_type=self._media_type, status_code=self._status, headers=headers
+        )
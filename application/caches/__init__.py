@@ -0,0 +1,6 @@
+__all__ = [
+    "CachedResponse",
+    "ResponseCache",
+]
+
+from .response_cache import CachedResponse, ResponseCache
@@ -0,0 +1,58 @@
+import hashlib
+import time
+from collections import OrderedDict
+
+from pydantic import BaseModel, ConfigDict
+
+
+class CachedResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    body: str
+    etag: str
+    expires_at: float
+
+
+class ResponseCache:
+    """LRU/TTL cache of serialized responses tied to a data version.
+
+    Every committed write calls ``invalidate``, which bumps the version and drops all entries.
+    ``put`` only stores a body computed under the current version, so a read that raced a
+    write can not repopulate the cache with stale data.
+    """
+
+    def __init__(self, max_entries: int, ttl: float) -> None:
+        self._max_entries = max(1, max_entries)
+        self._ttl = ttl
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def get(self, key: str) -> CachedResponse | None:
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= time.monotonic():
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, body: str, version: int) -> CachedResponse:
+        digest = hashlib.blake2b(body.encode(), digest_size=12).hexdigest()
+        entry = CachedResponse(
+            body=body,
+            etag=f'"{version:x}-{digest}"',
+            expires_at=time.monotonic() + self._ttl,
+        )
+        if version != self._version:
+            return entry
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def invalidate(self) -> None:
+        self._version += 1
+        self._entries.clear()
@@ -1,8 +1,15 @@
 from asyncio import Queue as AsyncQueue
+from datetime import timedelta
 
 from domain.contracts.parsers import IParser
-from domain.enums import DomainSourceType, FilterType
+from domain.contracts.repositories import ICrawlCheckpointRepository
+from domain.enums import DomainSourceType, FetchEngine, FilterType
+from infrastructure.browsers import BrowserManager
 from infrastructure.parsers import GoDaddyPlaywrightParser
+from infrastructure.tools.blockers import ResourceBlocker
+from infrastructure.tools.limiters import AimdLimiter, HostRateLimiter
+from infrastructure.tools.metrics import ServiceMetrics
+from infrastructure.tools.retries import RetryLedger
 
 
 class ParserFactory:
@@ -10,35 +17,71 @@ class ParserFactory:
     def get(
         collect_size: int,
         pagination_size: int,
-        task_pool_max: int,
+        limiter: AimdLimiter,
+        host_limiter: HostRateLimiter,
+        retries: RetryLedger,
+        blocker: ResourceBlocker,
         filter_type: FilterType,
+        fetch_engine: FetchEngine,
         queue: AsyncQueue,
         source_type: DomainSourceType,
+        browser_manager: BrowserManager,
+        checkpoints: ICrawlCheckpointRepository,
+        metrics: ServiceMetrics,
     ) -> IParser:
         match source_type:
             case DomainSourceType.AUCTIONS_GO_DADDY:
                 return ParserFactory._as_godaddy_parser(
                     collect_size=collect_size,
                     pagination_size=pagination_size,
-                    task_pool_max=task_pool_max,
+                    limiter=limiter,
+                    host_limiter=host_limiter,
+                    retries=retries,
+                    blocker=blocker,
                     filter_type=filter_type,
+                    fetch_engine=fetch_engine,
                     queue=queue,
+                    browser_manager=browser_manager,
+                    checkpoints=checkpoints,
+                    metrics=metrics,
                 )
             case _:
                 raise NotImplementedError(f"can not instantiate parser for source type {source_type.value}")
 
+    @staticmethod
+    def horizon(source_type: DomainSourceType) -> timedelta:
+        match source_type:
+            case DomainSourceType.AUCTIONS_GO_DADDY:
+                return GoDaddyPlaywrightParser.WINDOW_HORIZON
+            case _:
+                raise NotImplementedError(f"no crawl horizon for source type {source_type.value}")
+
     @staticmethod
     def _as_godaddy_parser(
         collect_size: int,
         pagination_size: int,
-        task_pool_max: int,
+        limiter: AimdLimiter,
+        host_limiter: HostRateLimiter,
+        retries: RetryLedger,
+        blocker: ResourceBlocker,
         filter_type: FilterType,
+        fetch_engine: FetchEngine,
         queue: AsyncQueue,
+        browser_manager: BrowserManager,
+        checkpoints: ICrawlCheckpointRepository,
+        metrics: ServiceMetrics,
     ) -> IParser:
         return GoDaddyPlaywrightParser(
             collect_size=collect_size,
             pagination_size=pagination_size,
-            task_pool_max=task_pool_max,
+            limiter=limiter,
+            host_limiter=host_limiter,
+            retries=retries,
+            blocker=blocker,
             filter_type=filter_type,
+            fetch_engine=fetch_engine,
             queue=queue,
+            browser_manager=browser_manager,
+            checkpoints=checkpoints,
+            metrics=metrics,
         )
@@ -1,5 +1,11 @@
 __all__ = [
+    "BoundedQueueHandler",
+    "JsonFormatter",
     "LoggerHub",
+    "SamplingFilter",
 ]
 
+from .bounded_queue_handler import BoundedQueueHandler
+from .json_formatter import JsonFormatter
 from .logger_hub import LoggerHub
+from .sampling_filter import SamplingFilter
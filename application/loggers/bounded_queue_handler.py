@@ -0,0 +1,29 @@
+import logging
+import queue
+from logging.handlers import QueueHandler
+
+
+class BoundedQueueHandler(QueueHandler):
+    """Hands records to a ``QueueListener`` thread without ever blocking the caller.
+
+    The queue is bounded: when it is full the record is dropped and counted instead of
+    waiting for the writer thread. Records are enqueued as they are, so message formatting
+    happens on the listener thread rather than on the event loop.
+    """
+
+    def __init__(self, records_max: int) -> None:
+        super().__init__(queue.Queue(maxsize=max(1, records_max)))
+        self._dropped = 0
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self._dropped += 1
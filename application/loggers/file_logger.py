@@ -1,22 +1,66 @@
 import logging
 import os
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
+from logging.handlers import QueueListener, RotatingFileHandler, TimedRotatingFileHandler
+
+from application.loggers.bounded_queue_handler import BoundedQueueHandler
+from application.loggers.json_formatter import JsonFormatter
+from application.loggers.sampling_filter import SamplingFilter
 
 
 class FileLogger:
-    def __init__(self, logger_name: str, logger_lvl: int = logging.ERROR) -> None:
+    """Logger whose records go through a bounded queue to a file handler on a listener thread.
+
+    The calling thread only enqueues; formatting, disk writes and midnight rotation happen on
+    the listener, so they never stall the event loop. Sampling (``sample_rate``) is decided by
+    the caller through ``should_log`` before it builds the message and its extras.
+    """
+
+    def __init__(
+        self,
+        logger_name: str,
+        logger_lvl: int = logging.ERROR,
+        records_max: int = 10_000,
+        sample_rate: float = 1.0,
+        structured: bool = False,
+    ) -> None:
         FileLogger.check_path(logger_name)
         self.format = "%(asctime)s - %(levelname)s - %(message)s"
         self.file_name = f"logs/{logger_name}/{logger_name}.log"
         self.logger_name = logger_name
+        self._structured = structured
+        self._queue_handler = BoundedQueueHandler(records_max=records_max)
+        self._sampling = SamplingFilter(rate=sample_rate)
+        self._listener = QueueListener(
+            self._queue_handler.queue, self._set_timed_handler(), respect_handler_level=True
+        )
+        self._listener.start()
         self._logger = logging.getLogger(logger_name)
         self._logger.setLevel(logger_lvl)
-        self._logger.addHandler(self._set_timed_handler())
+        self._logger.addHandler(self._queue_handler)
 
     @property
     def get_logger(self) -> logging.Logger:
         return self._logger
 
+    @property
+    def dropped(self) -> int:
+        return self._queue_handler.dropped
+
+    @property
+    def sampled_out(self) -> int:
+        return self._sampling.sampled_out
+
+    def should_log(self, level: int) -> bool:
+        return self._logger.isEnabledFor(level) and self._sampling.keep(level)
+
+    def stop(self) -> None:
+        """Detaches the queue handler and waits for the listener to write what is already queued."""
+        self._logger.removeHandler(self._queue_handler)
+        self._listener.stop()
+
+    def _formatter(self) -> logging.Formatter:
+        return JsonFormatter() if self._structured else logging.Formatter(self.format)
+
     def _set_timed_handler(self) -> TimedRotatingFileHandler:
         handler = TimedRotatingFileHandler(
             filename=self.file_name,
@@ -24,7 +68,7 @@ class FileLogger:
             backupCount=30,
             interval=1,
         )
-        handler.setFormatter(logging.Formatter(self.format))
+        handler.setFormatter(self._formatter())
         return handler
 
     def _set_rotating_file_handler(self) -> RotatingFileHandler:
@@ -34,10 +78,9 @@ class FileLogger:
             backupCount=1,
             encoding="utf-8",
         )
-        handler.setFormatter(logging.Formatter(self.format))
+        handler.setFormatter(self._formatter())
         return handler
 
     @staticmethod
     def check_path(logger_folder: str) -> None:
-        if not os.path.exists(f"logs/{logger_folder}"):
-            os.makedirs(f"logs/{logger_folder}")
+        os.makedirs(f"logs/{logger_folder}", exist_ok=True)
@@ -11,16 +11,43 @@ class LoggerHub:
     _BOUND1: str = ">" * len(_RELEASE)
     _BOUND2: str = "<" * len(_RELEASE)
 
-    def __init__(self) -> None:
-        self.service_log = FileLogger(
-            logger_name=AppConstants.LOGGER_NAME, logger_lvl=logging.INFO
-        ).get_logger
-        self.api_log = FileLogger(logger_name="api", logger_lvl=logging.INFO).get_logger
+    def __init__(self, records_max: int, api_sample_rate: float, structured: bool) -> None:
+        self._service_logger = FileLogger(
+            logger_name=AppConstants.LOGGER_NAME,
+            logger_lvl=logging.INFO,
+            records_max=records_max,
+            structured=structured,
+        )
+        self._api_logger = FileLogger(
+            logger_name="api",
+            logger_lvl=logging.INFO,
+            records_max=records_max,
+            sample_rate=api_sample_rate,
+            structured=structured,
+        )
+        self.service_log = self._service_logger.get_logger
+        self.api_log = self._api_logger.get_logger
+
+    @property
+    def dropped(self) -> int:
+        return self._service_logger.dropped + self._api_logger.dropped
+
+    @property
+    def sampled_out(self) -> int:
+        return self._service_logger.sampled_out + self._api_logger.sampled_out
+
+    def should_log_api(self, level: int = logging.INFO) -> bool:
+        """Whether an access log record at ``level`` survives sampling; check it before building one."""
+        return self._api_logger.should_log(level)
 
     def initialize(self) -> None:
         LoggerHub.log_startup(self.service_log)
         LoggerHub.log_startup(self.api_log)
 
+    def shutdown(self) -> None:
+        self._service_logger.stop()
+        self._api_logger.stop()
+
     @staticmethod
     def log_startup(logger: logging.Logger) -> None:
         logger.info(LoggerHub._BOUND1)
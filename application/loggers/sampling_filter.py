@@ -0,0 +1,29 @@
+import logging
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps an evenly spaced ``rate`` share of records below ``WARNING``; warnings and errors always pass."""
+
+    def __init__(self, rate: float) -> None:
+        super().__init__()
+        self._rate = min(1.0, max(0.0, rate))
+        self._credit = 0.0
+        self._sampled_out = 0
+
+    @property
+    def sampled_out(self) -> int:
+        return self._sampled_out
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return self.keep(record.levelno)
+
+    def keep(self, level: int) -> bool:
+        """The sampling decision on its own, for callers that check before building a record."""
+        if level >= logging.WARNING or self._rate >= 1.0:
+            return True
+        self._credit += self._rate
+        if self._credit >= 1.0:
+            self._credit -= 1.0
+            return True
+        self._sampled_out += 1
+        return False
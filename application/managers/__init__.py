@@ -1,3 +1,9 @@
-__all__ = ["ParsingManager"]
+__all__ = [
+    "CrawlJob",
+    "JobManager",
+    "ParsingManager",
+]
 
+from .crawl_job import CrawlJob
+from .job_manager import JobManager
 from .parsing_manager import ParsingManager
@@ -0,0 +1,61 @@
+import uuid
+from datetime import datetime, timezone
+
+from application.managers.parsing_manager import ParsingManager
+from domain.entities import JobDto
+from domain.enums import FetchEngine, FilterType, JobState
+
+
+class CrawlJob:
+    def __init__(
+        self, manager: ParsingManager, filter_type: FilterType, fetch_engine: FetchEngine, collect_size: int
+    ) -> None:
+        self.id = uuid.uuid4().hex
+        self.manager = manager
+        self.state = JobState.QUEUED
+        self._filter_type = filter_type
+        self._fetch_engine = fetch_engine
+        self._collect_size = collect_size
+        self._created_at = datetime.now(tz=timezone.utc)
+        self._started_at: datetime | None = None
+        self._finished_at: datetime | None = None
+        self._error: str | None = None
+
+    @property
+    def is_finished(self) -> bool:
+        return self.state in (JobState.FINISHED, JobState.FAILED, JobState.CANCELLED)
+
+    def mark_running(self) -> None:
+        self.state = JobState.RUNNING
+        self._started_at = datetime.now(tz=timezone.utc)
+
+    def mark_finished(self, state: JobState, error: str | None = None) -> None:
+        self.state = state
+        self._error = error
+        self._finished_at = datetime.now(tz=timezone.utc)
+
+    def to_dto(self) -> JobDto:
+        parser_stats = self.manager.parser_stats
+        return JobDto(
+            id=self.id,
+            state=self.state,
+            source=self.manager.source_name,
+            filter_type=self._filter_type.value,
+            fetch_engine=self._fetch_engine.value,
+            collect_size=self._collect_size,
+            created_at=self._created_at,
+            started_at=self._started_at,
+            finished_at=self._finished_at,
+            error=self._error,
+            pages_per_sec=self._pages_per_sec(parser_stats.pages_fetched),
+            domains_inserted=self.manager.inserted,
+            domains_updated=self.manager.updated,
+            commits=self.manager.commits,
+            parser=parser_stats,
+        )
+
+    def _pages_per_sec(self, pages: int) -> float:
+        if self._started_at is None:
+            return 0.0
+        elapsed = ((self._finished_at or datetime.now(tz=timezone.utc)) - self._started_at).total_seconds()
+        return round(pages / elapsed, 2) if elapsed > 0 else 0.0
@@ -0,0 +1,70 @@
+import asyncio
+from collections import OrderedDict
+
+from application.managers.crawl_job import CrawlJob
+from domain.entities import JobDto
+from domain.enums import JobState
+
+
+class JobManager:
+    """Runs crawl jobs in the background with a global cap on concurrent jobs.
+
+    Jobs over the cap wait in FIFO order. Finished jobs stay queryable until more than
+    ``history_max`` of them accumulate, then the oldest are evicted.
+    """
+
+    def __init__(self, jobs_max: int, history_max: int) -> None:
+        self._semaphore = asyncio.Semaphore(value=max(1, jobs_max))
+        self._history_max = history_max
+        self._jobs: OrderedDict[str, CrawlJob] = OrderedDict()
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    def submit(self, job: CrawlJob) -> JobDto:
+        self._jobs[job.id] = job
+        self._tasks[job.id] = asyncio.create_task(self._run(job), name=f"crawl-job:{job.id}")
+        return job.to_dto()
+
+    def get(self, job_id: str) -> JobDto | None:
+        job = self._jobs.get(job_id)
+        return job.to_dto() if job else None
+
+    def get_all(self) -> list[JobDto]:
+        return [job.to_dto() for job in self._jobs.values()]
+
+    @property
+    def running(self) -> list[CrawlJob]:
+        return [job for job in self._jobs.values() if job.state == JobState.RUNNING]
+
+    async def cancel(self, job_id: str) -> JobDto | None:
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        task = self._tasks.get(job_id)
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        return job.to_dto()
+
+    async def shutdown(self) -> None:
+        tasks = list(self._tasks.values())
+        [t.cancel() for t in tasks]
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run(self, job: CrawlJob) -> None:
+        try:
+            async with self._semaphore:
+                job.mark_running()
+                await job.manager.run()
+            job.mark_finished(JobState.FINISHED)
+        except asyncio.CancelledError:
+            job.mark_finished(JobState.CANCELLED)
+        except Exception as e:
+            job.mark_finished(JobState.FAILED, error=str(e))
+        finally:
+            self._tasks.pop(job.id, None)
+            self._evict()
+
+    def _evict(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.is_finished]
+        for job_id in finished[: max(0, len(finished) - self._history_max)]:
+            del self._jobs[job_id]
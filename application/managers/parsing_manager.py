@@ -1,51 +1,182 @@
 import asyncio
-from asyncio import Queue as AsyncQueue
+from typing import Any
 
 from application.services.domain_service import DomainService
+from application.services.source_registry import SourceRegistry
 from domain.contracts.parsers import IParser
-from domain.entities import AddDomainDto
+from domain.contracts.repositories import ICrawlCheckpointRepository
+from domain.entities import AddDomainRow, CrawlCheckpointDto, ParserStatsDto
+from infrastructure.tools.queues import RowQueue
 
 
 class ParsingManager:
-    def __init__(self, domains_service: DomainService, parser: IParser, queue: AsyncQueue) -> None:
+    _END = object()
+
+    def __init__(
+        self,
+        domains_service: DomainService,
+        source_registry: SourceRegistry,
+        parser: IParser,
+        queue: RowQueue,
+        checkpoints: ICrawlCheckpointRepository,
+        consumers: int,
+        batch_rows: int,
+        flush_interval: float,
+    ) -> None:
         self._domains_service = domains_service
+        self._source_registry = source_registry
         self._parser = parser
         self._queue = queue
-        self._is_active = True
-        self._main_task: asyncio.Task | None = None
+        self._checkpoints = checkpoints
+        self._consumers = max(1, consumers)
+        self._batch_rows = batch_rows
+        self._flush_interval = flush_interval
         self._tasks: list[asyncio.Task] = []
+        self._inserted = 0
+        self._updated = 0
+        self._commits = 0
+        self._sequence = 0
+        self._batch_starts: dict[int, int] = {}
+        self._committed = asyncio.Condition()
+        self._write_failed = False
 
-    async def start(self) -> None:
-        self._main_task = asyncio.create_task(self._start_tasks())
+    @property
+    def source_name(self) -> str:
+        return self._parser.source_name
 
-    async def _start_tasks(self) -> None:
-        self._tasks.append(asyncio.create_task(coro=self._parser.run()))
-        self._tasks.append(asyncio.create_task(coro=self._consume()))
+    @property
+    def parser_stats(self) -> ParserStatsDto:
+        return self._parser.stats
 
-        while True:
-            if self._is_active is False:
-                await self._stop()
-                break
-            else:
-                await asyncio.sleep(1)
+    @property
+    def inserted(self) -> int:
+        return self._inserted
+
+    @property
+    def updated(self) -> int:
+        return self._updated
+
+    @property
+    def commits(self) -> int:
+        return self._commits
+
+    @property
+    def queued_rows(self) -> int:
+        return self._queue.rows
+
+    @property
+    def concurrency_limit(self) -> int:
+        concurrency = self._parser.stats.concurrency
+        return concurrency.limit if concurrency is not None else 0
+
+    @property
+    def open_pages(self) -> int:
+        page_pool = self._parser.stats.page_pool
+        return page_pool.open_pages if page_pool is not None else 0
+
+    async def run(self) -> None:
+        """Runs the parser and the writer consumers until the crawl is written or a consumer fails.
+
+        A failed consumer cancels the parser and the other consumers and drops the rows still
+        queued, so a broken writer ends the job instead of leaving the parser blocked on a full queue.
+        """
+        self._tasks = [
+            asyncio.create_task(coro=self._consume(consumer_id=i), name=f"writer:{self.source_name}:{i}")
+            for i in range(self._consumers)
+        ]
+        producer = asyncio.create_task(coro=self._produce(), name=f"parser:{self.source_name}")
+        try:
+            done, _ = await asyncio.wait([producer, *self._tasks], return_when=asyncio.FIRST_EXCEPTION)
+            writer_error = next(
+                (t.exception() for t in done if t is not producer and t.exception() is not None), None
+            )
+        finally:
+            producer.cancel()
+            await self._stop()
+            await asyncio.gather(producer, return_exceptions=True)
+            self._drain()
+
+        if writer_error is not None:
+            raise RuntimeError(f"writer failed: {writer_error!r}") from writer_error
+        parser_error = producer.result()
+        if parser_error is not None:
+            raise RuntimeError(f"parser failed: {parser_error!r}") from parser_error
 
-        print("main task finished")
+    async def _produce(self) -> Exception | None:
+        """Runs the parser, then ends every consumer; the parser error is returned, not raised."""
+        parser_error: Exception | None = None
+        try:
+            await self._parser.run()
+        except Exception as e:
+            parser_error = e
+        for _ in self._tasks:
+            await self._queue.put(ParsingManager._END)
+        return parser_error
 
     async def _stop(self) -> None:
         [t.cancel() for t in self._tasks]
-        print("all subtasks finished")
+        await asyncio.gather(*self._tasks, return_exceptions=True)
 
-    async def _consume(self) -> None:
-        while self._is_active:
-            dtos: list[AddDomainDto] = await self._read_queue()
-            if self._is_active is False:
+    def _drain(self) -> None:
+        while not self._queue.empty():
+            self._queue.get_nowait()
+
+    async def _consume(self, consumer_id: int) -> None:
+        while True:
+            rows, checkpoints, is_ended = await self._read_batch(consumer_id)
+            if len(rows) > 0:
+                result = await self._domains_service.bulk_create(
+                    rows=rows, source_name=self._parser.source_name
+                )
+                self._commits += 1
+                self._inserted += result.inserted
+                self._updated += result.updated
+                self._write_failed = self._write_failed or result.failed
+            async with self._committed:
+                self._batch_starts.pop(consumer_id, None)
+                self._committed.notify_all()
+            for sequence, checkpoint in checkpoints:
+                await self._save_checkpoint(sequence, checkpoint)
+            if is_ended:
                 return
-            await self._domains_service.bulk_create(dtos=dtos, source_name=self._parser.source_name)
 
-    async def _read_queue(self) -> list[AddDomainDto]:
-        data: list[AddDomainDto] = []
-        try:
-            data = await asyncio.wait_for(self._queue.get(), timeout=40)
-        except asyncio.TimeoutError:
-            self._is_active = False
-        return data
+    async def _save_checkpoint(self, sequence: int, checkpoint: CrawlCheckpointDto) -> None:
+        """Persists a checkpoint once every row dequeued before it has been committed by any consumer."""
+        async with self._committed:
+            await self._committed.wait_for(
+                lambda: all(start > sequence for start in self._batch_starts.values())
+            )
+        if self._write_failed:
+            return
+        source = await self._source_registry.get(self._parser.source_name)
+        if source is None:
+            return
+        await self._checkpoints.save(source.id, checkpoint)
+
+    async def _read_batch(
+        self, consumer_id: int
+    ) -> tuple[list[AddDomainRow], list[tuple[int, CrawlCheckpointDto]], bool]:
+        """Merges queued batches until the row threshold, the flush interval, a checkpoint or the end."""
+        rows: list[AddDomainRow] = []
+        item, sequence = await self._next_item()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._flush_interval
+        while True:
+            if item is ParsingManager._END:
+                return rows, [], True
+            if isinstance(item, CrawlCheckpointDto):
+                return rows, [(sequence, item)], False
+            self._batch_starts.setdefault(consumer_id, sequence)
+            rows.extend(item)
+            timeout = deadline - loop.time()
+            if len(rows) >= self._batch_rows or timeout <= 0:
+                return rows, [], False
+            try:
+                item, sequence = await asyncio.wait_for(self._next_item(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return rows, [], False
+
+    async def _next_item(self) -> tuple[Any, int]:
+        item = await self._queue.get()
+        self._sequence += 1
+        return item, self._sequence
@@ -1,15 +1,37 @@
-from asyncio import Queue as AsyncQueue
+from datetime import timedelta
 from functools import cached_property
 
+from application.caches import ResponseCache
 from application.factories import ParserFactory
 from application.loggers import LoggerHub
-from application.managers import ParsingManager
-from application.services import DomainService
+from application.managers import CrawlJob, JobManager, ParsingManager
+from application.services import DomainService, SourceRegistry
 from application.settings import Settings
-from domain.contracts.repositories import IDomainRepository, IDomainSourceRepository
-from domain.enums import DomainSourceType, FilterType
+from application.workers import CrawlWorkerPool
+from domain.contracts.exporters import IDomainExporter
+from domain.contracts.parsers import IParser
+from domain.contracts.repositories import (
+    ICrawlCheckpointRepository,
+    IDomainRepository,
+    IDomainSnapshotRepository,
+    IDomainSourceRepository,
+)
+from domain.enums import DomainSourceType, FetchEngine, FilterType
+from infrastructure.browsers import BrowserManager
 from infrastructure.database import DbContext
-from infrastructure.repositories import DomainRepository, DomainSourceRepository
+from infrastructure.exporters import ArrowDomainExporter
+from infrastructure.repositories import (
+    CrawlCheckpointRepository,
+    DomainRepository,
+    DomainSnapshotRepository,
+    DomainSourceRepository,
+)
+from infrastructure.tools.blockers import ResourceBlocker
+from infrastructure.tools.diagnostics import LoopLagMonitor, StackSampler
+from infrastructure.tools.limiters import AimdLimiter, HostRateLimiter
+from infrastructure.tools.metrics import MetricsRegistry, ServiceMetrics
+from infrastructure.tools.queues import RowQueue
+from infrastructure.tools.retries import RetryLedger
 
 
 class DependenciesProvider:
@@ -19,18 +41,71 @@ class DependenciesProvider:
 
     @cached_property
     def logger_hub(self) -> LoggerHub:
-        return LoggerHub()
+        return LoggerHub(
+            records_max=self.config.logging.QUEUE_MAX_RECORDS,
+            api_sample_rate=self.config.logging.API_SAMPLE_RATE,
+            structured=self.config.logging.STRUCTURED,
+        )
 
     @cached_property
     def db_context(self) -> DbContext:
         return DbContext(
             url=self.config.db.URL,
+            journal_mode=self.config.db.JOURNAL_MODE,
+            synchronous=self.config.db.SYNCHRONOUS,
+            busy_timeout_ms=self.config.db.BUSY_TIMEOUT_MS,
+            cache_size_kib=self.config.db.CACHE_SIZE_KIB,
+            mmap_size=self.config.db.MMAP_SIZE,
+            read_pool_size=self.config.db.READ_POOL_SIZE,
+        )
+
+    @cached_property
+    def metrics(self) -> ServiceMetrics:
+        metrics = ServiceMetrics(registry=MetricsRegistry())
+        metrics.active_jobs.set_function(lambda: len(self.job_manager.running))
+        metrics.queue_rows.set_function(
+            lambda: sum(job.manager.queued_rows for job in self.job_manager.running)
+        )
+        metrics.concurrency_limit.set_function(
+            lambda: sum(job.manager.concurrency_limit for job in self.job_manager.running)
+        )
+        metrics.open_pages.set_function(
+            lambda: sum(job.manager.open_pages for job in self.job_manager.running)
+        )
+        metrics.log_records_dropped.set_function(lambda: self.logger_hub.dropped)
+        metrics.log_records_sampled_out.set_function(lambda: self.logger_hub.sampled_out)
+        return metrics
+
+    @cached_property
+    def loop_lag_monitor(self) -> LoopLagMonitor:
+        return LoopLagMonitor(
+            interval=self.config.diagnostics.LOOP_LAG_INTERVAL_SEC,
+            threshold=self.config.diagnostics.LOOP_LAG_THRESHOLD_MS / 1000,
+            events_max=self.config.diagnostics.LOOP_LAG_EVENTS_MAX,
+            metrics=self.metrics,
         )
 
+    @cached_property
+    def stack_sampler(self) -> StackSampler:
+        return StackSampler()
+
     @property
     def domains_repository(self) -> IDomainRepository:
         return DomainRepository(
             context=self.db_context,
+            metrics=self.metrics,
+        )
+
+    @property
+    def snapshot_repository(self) -> IDomainSnapshotRepository:
+        return DomainSnapshotRepository(
+            context=self.db_context,
+        )
+
+    @property
+    def checkpoint_repository(self) -> ICrawlCheckpointRepository:
+        return CrawlCheckpointRepository(
+            context=self.db_context,
         )
 
     @property
@@ -39,30 +114,156 @@ class DependenciesProvider:
             context=self.db_context,
         )
 
+    @cached_property
+    def response_cache(self) -> ResponseCache:
+        return ResponseCache(
+            max_entries=self.config.cache.MAX_ENTRIES,
+            ttl=self.config.cache.TTL_SEC,
+        )
+
+    @cached_property
+    def source_registry(self) -> SourceRegistry:
+        return SourceRegistry(
+            source_repository=self.source_repository,
+        )
+
     @property
     def domains_service(self) -> DomainService:
         return DomainService(
             domain_repository=self.domains_repository,
-            source_repository=self.source_repository,
+            snapshot_repository=self.snapshot_repository,
+            source_registry=self.source_registry,
+            cache=self.response_cache,
+        )
+
+    @property
+    def domain_exporter(self) -> IDomainExporter:
+        return ArrowDomainExporter()
+
+    @cached_property
+    def browser_manager(self) -> BrowserManager:
+        return BrowserManager(
+            headless=self.config.scraper.HEADLESS,
+            logger=self.logger_hub.service_log,
+            metrics=self.metrics,
+        )
+
+    @cached_property
+    def job_manager(self) -> JobManager:
+        return JobManager(
+            jobs_max=self.config.scraper.JOBS_MAX,
+            history_max=self.config.scraper.JOBS_HISTORY_MAX,
+        )
+
+    @property
+    def concurrency_limiter(self) -> AimdLimiter:
+        return AimdLimiter(
+            initial=self.config.scraper.TASK_POOL_START,
+            min_limit=self.config.scraper.TASK_POOL_MIN,
+            max_limit=self.config.scraper.TASK_POOL_MAX,
+        )
+
+    @property
+    def host_rate_limiter(self) -> HostRateLimiter:
+        return HostRateLimiter(
+            rate=self.config.scraper.HOST_RATE_PER_SEC,
+            burst=self.config.scraper.HOST_BURST,
+        )
+
+    @property
+    def retry_ledger(self) -> RetryLedger:
+        return RetryLedger(
+            max_attempts=self.config.scraper.RETRY_MAX_ATTEMPTS,
+            base_delay=self.config.scraper.RETRY_BASE_DELAY_SEC,
+            max_delay=self.config.scraper.RETRY_MAX_DELAY_SEC,
         )
 
     @property
-    def async_queue(self) -> AsyncQueue:
-        return AsyncQueue(maxsize=10000)
+    def resource_blocker(self) -> ResourceBlocker:
+        return ResourceBlocker(
+            resource_types=self.config.scraper.BLOCK_RESOURCE_TYPES,
+            url_patterns=self.config.scraper.BLOCK_URL_PATTERNS,
+            allow_patterns=self.config.scraper.ALLOW_URL_PATTERNS,
+        )
+
+    @property
+    def row_queue(self) -> RowQueue:
+        return RowQueue(max_rows=self.config.scraper.QUEUE_MAX_ROWS)
 
     def parsing_manager(
-        self, collect_size: int, pagination_size: int, filter_type: FilterType, source_type: DomainSourceType
+        self,
+        collect_size: int,
+        pagination_size: int,
+        filter_type: FilterType,
+        fetch_engine: FetchEngine,
+        source_type: DomainSourceType,
     ) -> ParsingManager:
-        queue = self.async_queue
-        return ParsingManager(
-            domains_service=self.domains_service,
-            parser=ParserFactory.get(
+        queue = self.row_queue
+        checkpoints = self.checkpoint_repository
+        parser: IParser
+        if self.config.scraper.WORKERS > 0:
+            parser = CrawlWorkerPool(
+                workers=self.config.scraper.WORKERS,
                 collect_size=collect_size,
                 pagination_size=pagination_size,
+                filter_type=filter_type,
+                fetch_engine=fetch_engine,
+                source_type=source_type,
+                queue=queue,
+                checkpoints=checkpoints,
+                horizon=ParserFactory.horizon(source_type),
+                segment_span=timedelta(hours=self.config.scraper.WORKER_SEGMENT_HOURS),
+                results_max=self.config.scraper.WORKER_QUEUE_MAX_BATCHES,
                 task_pool_max=self.config.scraper.TASK_POOL_MAX,
+                host_rate_per_sec=self.config.scraper.HOST_RATE_PER_SEC,
+                host_burst=self.config.scraper.HOST_BURST,
+                logger=self.logger_hub.service_log,
+                metrics=self.metrics,
+            )
+        else:
+            parser = ParserFactory.get(
+                collect_size=collect_size,
+                pagination_size=pagination_size,
+                limiter=self.concurrency_limiter,
+                host_limiter=self.host_rate_limiter,
+                retries=self.retry_ledger,
+                blocker=self.resource_blocker,
                 filter_type=filter_type,
+                fetch_engine=fetch_engine,
                 queue=queue,
                 source_type=source_type,
-            ),
+                browser_manager=self.browser_manager,
+                checkpoints=checkpoints,
+                metrics=self.metrics,
+            )
+        return ParsingManager(
+            domains_service=self.domains_service,
+            source_registry=self.source_registry,
+            parser=parser,
             queue=queue,
+            checkpoints=checkpoints,
+            consumers=self.config.scraper.WRITER_CONSUMERS,
+            batch_rows=self.config.scraper.WRITER_BATCH_ROWS,
+            flush_interval=self.config.scraper.WRITER_FLUSH_SEC,
+        )
+
+    def crawl_job(
+        self,
+        collect_size: int,
+        pagination_size: int,
+        filter_type: FilterType,
+        fetch_engine: FetchEngine,
+        source_type: DomainSourceType,
+    ) -> CrawlJob:
+        return CrawlJob(
+            manager=self.parsing_manager(
+                collect_size=collect_size,
+                pagination_size=pagination_size,
+                filter_type=filter_type,
+                fetch_engine=fetch_engine,
+                source_type=source_type,
+            ),
+            filter_type=filter_type,
+            fetch_engine=fetch_engine,
+            collect_size=collect_size,
         )
@@ -1,6 +1,15 @@
 __all__ = [
+    "admin_router",
+    "AdminRouterSource",
     "domain_router",
     "DomainRouterSource",
+    "job_router",
+    "JobRouterSource",
+    "metrics_router",
+    "MetricsRouterSource",
 ]
 
+from .admin_router import AdminRouterSource, admin_router
 from .domain_router import DomainRouterSource, domain_router
+from .job_router import JobRouterSource, job_router
+from .metrics_router import MetricsRouterSource, metrics_router
@@ -0,0 +1,74 @@
+import asyncio
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, Depends, Query, Response, status
+
+from application.builders import JsonResponseBuilder
+from application.providers import DependenciesProvider
+from domain.entities import LoopLagStatsDto, TaskDumpDto
+from domain.exceptions import ProfilerBusyError
+from infrastructure.tools.diagnostics import TaskInspector
+
+admin_router = APIRouter(prefix="/api/admin", tags=["Admin"])
+
+
+class AdminRouterSource:
+    _provider: DependenciesProvider | None = None
+
+    @staticmethod
+    def set(provider: DependenciesProvider) -> None:
+        AdminRouterSource._provider = provider
+
+    @staticmethod
+    def get() -> DependenciesProvider:
+        if not AdminRouterSource._provider:
+            raise RuntimeError()
+        return AdminRouterSource._provider
+
+
+@admin_router.get(
+    path="/profile",
+    status_code=status.HTTP_200_OK,
+    response_class=Response,
+)
+async def profile(
+    seconds: float = Query(default=10.0, gt=0),
+    interval_ms: float = Query(default=10.0, ge=1.0, le=1000.0),
+    provider: DependenciesProvider = Depends(AdminRouterSource.get),
+) -> Response:
+    """Samples all thread stacks for ``seconds`` and returns them as a collapsed-stack file."""
+    seconds = min(seconds, provider.config.diagnostics.PROFILE_MAX_SEC)
+    try:
+        collapsed = await asyncio.to_thread(provider.stack_sampler.run, seconds, interval_ms / 1000)
+    except ProfilerBusyError as e:
+        return (
+            JsonResponseBuilder()
+            .with_dict(json_dict={"status": "error", "detail": str(e)})
+            .with_status(status.HTTP_409_CONFLICT)
+            .respond()
+        )
+    file_name = f"profile-{datetime.now(tz=timezone.utc):%Y%m%dT%H%M%SZ}.collapsed"
+    return Response(
+        content=collapsed,
+        status_code=status.HTTP_200_OK,
+        media_type="text/plain; charset=utf-8",
+        headers={"Content-Disposition": f'attachment; filename="{file_name}"'},
+    )
+
+
+@admin_router.get(
+    path="/tasks",
+    status_code=status.HTTP_200_OK,
+    response_model=list[TaskDumpDto],
+)
+async def get_tasks() -> list[TaskDumpDto]:
+    return TaskInspector.dump()
+
+
+@admin_router.get(
+    path="/loop_lag",
+    status_code=status.HTTP_200_OK,
+    response_model=LoopLagStatsDto,
+)
+async def get_loop_lag(provider: DependenciesProvider = Depends(AdminRouterSource.get)) -> LoopLagStatsDto:
+    return provider.loop_lag_monitor.stats
@@ -1,15 +1,37 @@
-from typing import Annotated
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Annotated, AsyncIterator, Awaitable, Callable
 
-from fastapi import APIRouter, Depends, Response, status
+from fastapi import APIRouter, Depends, Request, Response, status
 from fastapi.params import Query
+from pydantic import TypeAdapter
 
-from application.builders import JsonResponseBuilder
+from application.builders import JsonResponseBuilder, StreamResponseBuilder
 from application.providers import DependenciesProvider
-from domain.entities import DomainSourceDto
-from domain.enums import DomainSourceType, FilterType
+from domain.entities import DomainMoverDto, DomainPageDto, DomainQueryDto, DomainSnapshotDto, DomainSourceDto
+from domain.enums import (
+    ColumnarFormat,
+    DomainSortField,
+    DomainSourceType,
+    ExportFormat,
+    FetchEngine,
+    FilterType,
+    MoverField,
+    SortOrder,
+)
 
 domain_router = APIRouter(prefix="/api/domains", tags=["Domains"])
 
+_SOURCES_ADAPTER = TypeAdapter(list[DomainSourceDto])
+_SNAPSHOTS_ADAPTER = TypeAdapter(list[DomainSnapshotDto])
+_MOVERS_ADAPTER = TypeAdapter(list[DomainMoverDto])
+_COLUMNAR_MEDIA_TYPES = {
+    ColumnarFormat.PARQUET: "application/vnd.apache.parquet",
+    ColumnarFormat.ARROW: "application/vnd.apache.arrow.stream",
+}
+
 
 class DomainRouterSource:
     _provider: DependenciesProvider | None = None
@@ -25,20 +47,120 @@ class DomainRouterSource:
         return DomainRouterSource._provider
 
 
+def _domain_filters(
+    price_min: Annotated[int | None, Query()] = None,
+    price_max: Annotated[int | None, Query()] = None,
+    bids_min: Annotated[int | None, Query()] = None,
+    bids_max: Annotated[int | None, Query()] = None,
+    ended_after: Annotated[datetime | None, Query()] = None,
+    ended_before: Annotated[datetime | None, Query()] = None,
+    collected_since: Annotated[datetime | None, Query()] = None,
+) -> DomainQueryDto:
+    return DomainQueryDto(
+        price_min=price_min,
+        price_max=price_max,
+        bids_min=bids_min,
+        bids_max=bids_max,
+        ended_after=ended_after,
+        ended_before=ended_before,
+        collected_since=collected_since,
+    )
+
+
+@domain_router.get(
+    path="",
+    status_code=status.HTTP_200_OK,
+    response_model=DomainPageDto,
+)
+async def query_domains(
+    request: Request,
+    filters: DomainQueryDto = Depends(_domain_filters),
+    source: Annotated[DomainSourceType | None, Query()] = None,
+    sort_by: Annotated[DomainSortField, Query()] = DomainSortField.ID,
+    order: Annotated[SortOrder, Query()] = SortOrder.ASC,
+    limit: Annotated[int, Query(ge=1, le=1_000)] = 100,
+    cursor: Annotated[str | None, Query()] = None,
+    provider: DependenciesProvider = Depends(DomainRouterSource.get),
+) -> Response:
+    query = filters.model_copy(update={"sort_by": sort_by, "order": order, "limit": limit, "cursor": cursor})
+
+    async def produce() -> str:
+        page = await provider.domains_service.query(
+            query=query, source_name=source.value if source is not None else None
+        )
+        return page.model_dump_json()
+
+    try:
+        return await _respond_cached(request=request, provider=provider, produce=produce)
+    except ValueError as e:
+        return (
+            JsonResponseBuilder()
+            .with_dict(json_dict={"status": "error", "detail": str(e)})
+            .with_status(status.HTTP_400_BAD_REQUEST)
+            .respond()
+        )
+
+
 @domain_router.get(
     path="/all_names",
     status_code=status.HTTP_200_OK,
     response_model=list[str],
 )
-async def get_all_names(provider: DependenciesProvider = Depends(DomainRouterSource.get)) -> Response:
-    res = await provider.domains_service.get_all_names()
+async def get_all_names(
+    request: Request,
+    provider: DependenciesProvider = Depends(DomainRouterSource.get),
+) -> Response:
+    async def produce() -> str:
+        count = await provider.domains_service.count()
+        return json.dumps({"count": count})
+
+    return await _respond_cached(request=request, provider=provider, produce=produce)
+
+
+@domain_router.get(
+    path="/names/export",
+    status_code=status.HTTP_200_OK,
+)
+async def export_names(
+    fmt: Annotated[ExportFormat, Query()] = ExportFormat.NDJSON,
+    chunk_size: Annotated[int, Query(ge=1, le=50_000)] = 5_000,
+    provider: DependenciesProvider = Depends(DomainRouterSource.get),
+) -> Response:
+    chunks = provider.domains_service.iter_names(chunk_size=chunk_size)
+    match fmt:
+        case ExportFormat.CSV:
+            media_type, encoded = "text/csv", _names_as_csv(chunks)
+        case _:
+            media_type, encoded = "application/x-ndjson", _names_as_ndjson(chunks)
     return (
-        JsonResponseBuilder()
-        .with_dict(
-            json_dict={
-                "count": len(res),
-            }
-        )
+        StreamResponseBuilder()
+        .with_chunks(encoded)
+        .with_media_type(media_type)
+        .with_file_name(f"domain_names.{fmt.value}")
+        .with_status(status.HTTP_200_OK)
+        .respond()
+    )
+
+
+@domain_router.get(
+    path="/export.{fmt}",
+    status_code=status.HTTP_200_OK,
+)
+async def export_domains(
+    fmt: ColumnarFormat,
+    filters: DomainQueryDto = Depends(_domain_filters),
+    source: Annotated[DomainSourceType | None, Query()] = None,
+    chunk_size: Annotated[int, Query(ge=1, le=100_000)] = 10_000,
+    provider: DependenciesProvider = Depends(DomainRouterSource.get),
+) -> Response:
+    chunks = provider.domains_service.iter_columns(
+        query=filters, chunk_size=chunk_size, source_name=source.value if source is not None else None
+    )
+    return (
+        StreamResponseBuilder()
+        .with_chunks(provider.domain_exporter.export(chunks, fmt))
+        .with_media_type(_COLUMNAR_MEDIA_TYPES[fmt])
+        .with_file_name(f"domains.{fmt.value}")
         .with_status(status.HTTP_200_OK)
         .respond()
     )
@@ -50,9 +172,51 @@ async def get_all_names(provider: DependenciesProvider = Depends(DomainRouterSou
     response_model=list[DomainSourceDto],
 )
 async def get_all_sources(
+    request: Request,
+    provider: DependenciesProvider = Depends(DomainRouterSource.get),
+) -> Response:
+    async def produce() -> str:
+        sources = await provider.domains_service.get_all_sources()
+        return _SOURCES_ADAPTER.dump_json(sources).decode()
+
+    return await _respond_cached(request=request, provider=provider, produce=produce)
+
+
+@domain_router.get(
+    path="/history/{name}",
+    status_code=status.HTTP_200_OK,
+    response_model=list[DomainSnapshotDto],
+)
+async def get_history(
+    request: Request,
+    name: str,
+    limit: Annotated[int, Query(ge=1, le=10_000)] = 1_000,
     provider: DependenciesProvider = Depends(DomainRouterSource.get),
-) -> list[DomainSourceDto]:
-    return await provider.domains_service.get_all_sources()
+) -> Response:
+    async def produce() -> str:
+        history = await provider.domains_service.get_history(name=name, limit=limit)
+        return _SNAPSHOTS_ADAPTER.dump_json(history).decode()
+
+    return await _respond_cached(request=request, provider=provider, produce=produce)
+
+
+@domain_router.get(
+    path="/movers",
+    status_code=status.HTTP_200_OK,
+    response_model=list[DomainMoverDto],
+)
+async def get_movers(
+    request: Request,
+    hours: Annotated[int, Query(ge=1, le=24 * 90)] = 24,
+    by: Annotated[MoverField, Query()] = MoverField.PRICE,
+    limit: Annotated[int, Query(ge=1, le=1_000)] = 50,
+    provider: DependenciesProvider = Depends(DomainRouterSource.get),
+) -> Response:
+    async def produce() -> str:
+        movers = await provider.domains_service.get_movers(hours=hours, field=by, limit=limit)
+        return _MOVERS_ADAPTER.dump_json(movers).decode()
+
+    return await _respond_cached(request=request, provider=provider, produce=produce)
 
 
 @domain_router.get(
@@ -62,19 +226,21 @@ async def get_all_sources(
 async def fetch_from(
     source: Annotated[DomainSourceType, Query()] = DomainSourceType.AUCTIONS_GO_DADDY,
     filter_type: Annotated[FilterType, Query()] = FilterType.TIME,
+    engine: Annotated[FetchEngine, Query()] = FetchEngine.BROWSER,
     size: Annotated[int, Query()] = 100,
     provider: DependenciesProvider = Depends(DomainRouterSource.get),
 ) -> Response:
-    manager = provider.parsing_manager(
+    job = provider.crawl_job(
         collect_size=size,
         pagination_size=100,
         filter_type=filter_type,
+        fetch_engine=engine,
         source_type=source,
     )
-    await manager.start()
+    dto = provider.job_manager.submit(job)
     return (
         JsonResponseBuilder()
-        .with_dict(json_dict={"status": "ok"})
+        .with_dict(json_dict={"status": "ok", "job_id": dto.id, "state": dto.state.value})
         .with_status(status.HTTP_201_CREATED)
         .respond()
     )
@@ -92,3 +258,36 @@ async def clear_domains(provider: DependenciesProvider = Depends(DomainRouterSou
         .with_status(status.HTTP_201_CREATED)
         .respond()
     )
+
+
+async def _respond_cached(
+    request: Request,
+    provider: DependenciesProvider,
+    produce: Callable[[], Awaitable[str]],
+) -> Response:
+    cache = provider.response_cache
+    key = f"{request.url.path}?{sorted(request.query_params.multi_items())}"
+    entry = cache.get(key)
+    if entry is None:
+        version = cache.version
+        entry = cache.put(key, await produce(), version)
+    return (
+        JsonResponseBuilder()
+        .with_json(entry.body)
+        .with_etag(entry.etag, if_none_match=request.headers.get("if-none-match"))
+        .with_status(status.HTTP_200_OK)
+        .respond()
+    )
+
+
+async def _names_as_ndjson(chunks: AsyncIterator[list[str]]) -> AsyncIterator[bytes]:
+    async for names in chunks:
+        yield "".join(f"{json.dumps({'name': name})}\n" for name in names).encode()
+
+
+async def _names_as_csv(chunks: AsyncIterator[list[str]]) -> AsyncIterator[bytes]:
+    yield b"name\r\n"
+    async for names in chunks:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows([name] for name in names)
+        yield buffer.getvalue().encode()
@@ -0,0 +1,63 @@
+from fastapi import APIRouter, Depends, Response, status
+
+from application.builders import JsonResponseBuilder
+from application.providers import DependenciesProvider
+from domain.entities import JobDto
+
+job_router = APIRouter(prefix="/api/jobs", tags=["Jobs"])
+
+
+class JobRouterSource:
+    _provider: DependenciesProvider | None = None
+
+    @staticmethod
+    def set(provider: DependenciesProvider) -> None:
+        JobRouterSource._provider = provider
+
+    @staticmethod
+    def get() -> DependenciesProvider:
+        if not JobRouterSource._provider:
+            raise RuntimeError()
+        return JobRouterSource._provider
+
+
+@job_router.get(
+    path="",
+    status_code=status.HTTP_200_OK,
+    response_model=list[JobDto],
+)
+async def get_all_jobs(provider: DependenciesProvider = Depends(JobRouterSource.get)) -> list[JobDto]:
+    return provider.job_manager.get_all()
+
+
+@job_router.get(
+    path="/{job_id}",
+    status_code=status.HTTP_200_OK,
+    response_model=JobDto,
+)
+async def get_job(job_id: str, provider: DependenciesProvider = Depends(JobRouterSource.get)) -> Response:
+    job = provider.job_manager.get(job_id)
+    if job is None:
+        return _not_found(job_id)
+    return JsonResponseBuilder().with_json(job.model_dump_json()).with_status(status.HTTP_200_OK).respond()
+
+
+@job_router.delete(
+    path="/{job_id}",
+    status_code=status.HTTP_200_OK,
+    response_model=JobDto,
+)
+async def cancel_job(job_id: str, provider: DependenciesProvider = Depends(JobRouterSource.get)) -> Response:
+    job = await provider.job_manager.cancel(job_id)
+    if job is None:
+        return _not_found(job_id)
+    return JsonResponseBuilder().with_json(job.model_dump_json()).with_status(status.HTTP_200_OK).respond()
+
+
+def _not_found(job_id: str) -> Response:
+    return (
+        JsonResponseBuilder()
+        .with_dict(json_dict={"status": "error", "detail": f"job {job_id} not found"})
+        .with_status(status.HTTP_404_NOT_FOUND)
+        .respond()
+    )
@@ -0,0 +1,33 @@
+from fastapi import APIRouter, Depends, Response, status
+
+from application.providers import DependenciesProvider
+from infrastructure.tools.metrics import MetricsRegistry
+
+metrics_router = APIRouter(tags=["Metrics"])
+
+
+class MetricsRouterSource:
+    _provider: DependenciesProvider | None = None
+
+    @staticmethod
+    def set(provider: DependenciesProvider) -> None:
+        MetricsRouterSource._provider = provider
+
+    @staticmethod
+    def get() -> DependenciesProvider:
+        if not MetricsRouterSource._provider:
+            raise RuntimeError()
+        return MetricsRouterSource._provider
+
+
+@metrics_router.get(
+    path="/metrics",
+    status_code=status.HTTP_200_OK,
+    response_class=Response,
+)
+async def get_metrics(provider: DependenciesProvider = Depends(MetricsRouterSource.get)) -> Response:
+    return Response(
+        content=provider.metrics.registry.render(),
+        status_code=status.HTTP_200_OK,
+        media_type=MetricsRegistry.CONTENT_TYPE,
+    )
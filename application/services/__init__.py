@@ -1,5 +1,7 @@
 __all__ = [
     "DomainService",
+    "SourceRegistry",
 ]
 
 from .domain_service import DomainService
+from .source_registry import SourceRegistry
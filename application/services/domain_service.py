@@ -1,32 +1,90 @@
-from domain.contracts.repositories import IDomainRepository, IDomainSourceRepository
-from domain.entities import AddDomainDto, DomainSourceDto, GetDomainDto
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator
+
+from application.caches import ResponseCache
+from application.services.source_registry import SourceRegistry
+from domain.contracts.repositories import IDomainRepository, IDomainSnapshotRepository
+from domain.entities import (
+    AddDomainDto,
+    AddDomainRow,
+    BulkCreateResultDto,
+    DomainMoverDto,
+    DomainPageDto,
+    DomainQueryDto,
+    DomainSnapshotDto,
+    DomainSourceDto,
+    GetDomainDto,
+)
+from domain.enums import MoverField
 
 
 class DomainService:
-    def __init__(self, domain_repository: IDomainRepository, source_repository: IDomainSourceRepository):
+    def __init__(
+        self,
+        domain_repository: IDomainRepository,
+        snapshot_repository: IDomainSnapshotRepository,
+        source_registry: SourceRegistry,
+        cache: ResponseCache,
+    ):
         self._domain_repository = domain_repository
-        self._source_repository = source_repository
+        self._snapshot_repository = snapshot_repository
+        self._source_registry = source_registry
+        self._cache = cache
 
     async def create(self, dto: AddDomainDto, source_name: str) -> GetDomainDto | None:
-        source = await self._source_repository.get_by_name(source_name)
+        source = await self._source_registry.get(source_name)
         if source is None:
             return None
 
-        return await self._domain_repository.create(dto, source.id)
+        domain = await self._domain_repository.create(dto, source.id)
+        if domain is not None:
+            self._cache.invalidate()
+        return domain
 
-    async def bulk_create(self, dtos: list[AddDomainDto], source_name: str) -> list[GetDomainDto]:
-        source = await self._source_repository.get_by_name(source_name)
+    async def bulk_create(self, rows: list[AddDomainRow], source_name: str) -> BulkCreateResultDto:
+        source = await self._source_registry.get(source_name)
         if source is None:
-            return []
+            return BulkCreateResultDto(failed=True)
+
+        result = await self._domain_repository.bulk_create(rows, source.id)
+        if result.inserted > 0 or result.changed > 0:
+            self._cache.invalidate()
+        return result
+
+    async def query(self, query: DomainQueryDto, source_name: str | None = None) -> DomainPageDto:
+        if source_name is not None:
+            source = await self._source_registry.get(source_name)
+            if source is None:
+                return DomainPageDto(items=[])
+            query = query.model_copy(update={"source_id": source.id})
+        return await self._domain_repository.query(query)
+
+    async def count(self) -> int:
+        return await self._domain_repository.count()
+
+    def iter_names(self, chunk_size: int) -> AsyncIterator[list[str]]:
+        return self._domain_repository.iter_names(chunk_size)
+
+    async def get_history(self, name: str, limit: int) -> list[DomainSnapshotDto]:
+        return await self._snapshot_repository.get_history(name, limit)
 
-        return await self._domain_repository.bulk_create(dtos, source.id)
+    async def get_movers(self, hours: int, field: MoverField, limit: int) -> list[DomainMoverDto]:
+        since = datetime.now(tz=timezone.utc) - timedelta(hours=hours)
+        return await self._snapshot_repository.get_movers(since, field, limit)
 
-    async def get_all_names(self) -> list[str]:
-        domains = await self._domain_repository.get_all()
-        return [d.name for d in domains]
+    async def iter_columns(
+        self, query: DomainQueryDto, chunk_size: int, source_name: str | None = None
+    ) -> AsyncIterator[dict[str, list[Any]]]:
+        if source_name is not None:
+            source = await self._source_registry.get(source_name)
+            if source is None:
+                return
+            query = query.model_copy(update={"source_id": source.id})
+        async for columns in self._domain_repository.iter_columns(query, chunk_size):
+            yield columns
 
     async def get_all_sources(self) -> list[DomainSourceDto]:
-        return await self._source_repository.get_all()
+        return await self._source_registry.get_all()
 
     async def get_domain_by_id(self, domain_id: int) -> GetDomainDto | None:
         return await self._domain_repository.get_by_id(domain_id)
@@ -35,7 +93,12 @@ class DomainService:
         return await self._domain_repository.get_by_name(name)
 
     async def remove_by_id(self, domain_id: int) -> GetDomainDto | None:
-        return await self._domain_repository.remove_by_id(domain_id)
+        domain = await self._domain_repository.remove_by_id(domain_id)
+        if domain is not None:
+            self._cache.invalidate()
+        return domain
 
     async def remove_all(self) -> int:
-        return await self._domain_repository.remove_all()
+        count = await self._domain_repository.remove_all()
+        self._cache.invalidate()
+        return count
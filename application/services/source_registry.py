@@ -0,0 +1,44 @@
+import asyncio
+
+from domain.contracts.repositories import IDomainSourceRepository
+from domain.entities import DomainSourceDto
+
+
+class SourceRegistry:
+    """In-memory view of `domain_sources`, loaded once and refreshed when an unknown name is requested."""
+
+    def __init__(self, source_repository: IDomainSourceRepository) -> None:
+        self._source_repository = source_repository
+        self._by_name: dict[str, DomainSourceDto] = {}
+        self._lock = asyncio.Lock()
+        self._version = 0
+
+    async def load(self) -> None:
+        await self.refresh()
+
+    async def refresh(self) -> None:
+        async with self._lock:
+            await self._reload()
+
+    async def get(self, name: str) -> DomainSourceDto | None:
+        source = self._by_name.get(name)
+        if source is not None:
+            return source
+
+        version = self._version
+        async with self._lock:
+            if self._version == version:
+                await self._reload()
+        return self._by_name.get(name)
+
+    async def get_all(self) -> list[DomainSourceDto]:
+        if self._version == 0:
+            await self.refresh()
+        return list(self._by_name.values())
+
+    async def _reload(self) -> None:
+        sources = await self._source_repository.get_all()
+        if len(sources) == 0 and len(self._by_name) > 0:
+            return
+        self._by_name = {source.name: source for source in sources}
+        self._version += 1
@@ -11,10 +11,64 @@ class Server(BaseModel):
 
 class Scraper(BaseModel):
     TASK_POOL_MAX: int = 5
+    TASK_POOL_MIN: int = 1
+    TASK_POOL_START: int = 2
+    HOST_RATE_PER_SEC: float = 10.0
+    HOST_BURST: int = 10
+    RETRY_MAX_ATTEMPTS: int = 4
+    RETRY_BASE_DELAY_SEC: float = 1.0
+    RETRY_MAX_DELAY_SEC: float = 30.0
+    BLOCK_RESOURCE_TYPES: list[str] = ["image", "media", "font", "stylesheet"]
+    BLOCK_URL_PATTERNS: list[str] = [
+        "*google-analytics.com*",
+        "*googletagmanager.com*",
+        "*doubleclick.net*",
+        "*facebook.net*",
+        "*hotjar.com*",
+        "*newrelic.com*",
+        "*nr-data.net*",
+        "*/beacon*",
+        "*/collect?*",
+    ]
+    ALLOW_URL_PATTERNS: list[str] = ["*godaddy.com/beta/findApiProxy/*"]
+    HEADLESS: bool = True
+    JOBS_MAX: int = 1
+    QUEUE_MAX_ROWS: int = 10_000
+    WRITER_CONSUMERS: int = 1
+    WRITER_BATCH_ROWS: int = 1_000
+    WRITER_FLUSH_SEC: float = 1.0
+    JOBS_HISTORY_MAX: int = 100
+    WORKERS: int = 0
+    WORKER_SEGMENT_HOURS: float = 6.0
+    WORKER_QUEUE_MAX_BATCHES: int = 100
 
 
 class Db(BaseModel):
     URL: str = "sqlite+aiosqlite:///./scraper.db"
+    JOURNAL_MODE: str = "WAL"
+    SYNCHRONOUS: str = "NORMAL"
+    BUSY_TIMEOUT_MS: int = 5000
+    CACHE_SIZE_KIB: int = 65536
+    MMAP_SIZE: int = 268435456
+    READ_POOL_SIZE: int = 4
+
+
+class Cache(BaseModel):
+    MAX_ENTRIES: int = 1024
+    TTL_SEC: float = 30.0
+
+
+class Logging(BaseModel):
+    QUEUE_MAX_RECORDS: int = 10_000
+    API_SAMPLE_RATE: float = 1.0
+    STRUCTURED: bool = False
+
+
+class Diagnostics(BaseModel):
+    LOOP_LAG_INTERVAL_SEC: float = 0.05
+    LOOP_LAG_THRESHOLD_MS: float = 100.0
+    LOOP_LAG_EVENTS_MAX: int = 50
+    PROFILE_MAX_SEC: int = 120
 
 
 class Settings(BaseSettings):
@@ -27,3 +81,6 @@ class Settings(BaseSettings):
     server: Server = Server()
     scraper: Scraper = Scraper()
     db: Db = Db()
+    cache: Cache = Cache()
+    logging: Logging = Logging()
+    diagnostics: Diagnostics = Diagnostics()
@@ -0,0 +1,13 @@
+__all__ = [
+    "CrawlWorker",
+    "CrawlWorkerPool",
+    "CrawlWorkerSpec",
+    "ParserStatsMerger",
+    "WorkerLogHandler",
+    "run_crawl_worker",
+]
+
+from .crawl_worker import CrawlWorker, CrawlWorkerSpec, run_crawl_worker
+from .crawl_worker_pool import CrawlWorkerPool
+from .parser_stats_merger import ParserStatsMerger
+from .worker_log_handler import WorkerLogHandler
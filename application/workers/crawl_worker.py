@@ -0,0 +1,179 @@
+import asyncio
+import logging
+import multiprocessing.queues
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel
+
+from application.constants import AppConstants
+from application.factories import ParserFactory
+from application.workers.worker_log_handler import WorkerLogHandler
+from domain.contracts.fetchers import IPageFetcher
+from domain.contracts.parsers import IRangeParser
+from domain.entities import CrawlCheckpointDto
+from domain.enums import DomainSourceType, FetchEngine, FilterType
+from infrastructure.browsers import BrowserManager
+from infrastructure.tools.limiters import AimdLimiter, HostRateLimiter
+from infrastructure.tools.queues import RowQueue
+
+
+class CrawlWorkerSpec(BaseModel):
+    worker_id: int
+    collect_size: int
+    pagination_size: int
+    filter_type: FilterType
+    fetch_engine: FetchEngine
+    source_type: DomainSourceType
+    origin: datetime
+    task_pool_max: int
+    host_rate_per_sec: float
+    host_burst: int
+
+
+class CrawlWorker:
+    """Crawls the end-time segments it is handed in a worker process and streams the results back.
+
+    The worker owns its own browser, limiters and parser, built from the same settings as the
+    API process except for the concurrency and host rate budgets, which the pool splits across
+    the workers through ``spec`` so that all of them together stay within the settings. Validated
+    row batches and checkpoints go to ``results`` in the order the parser queued them, so the
+    writer in the API process keeps its checkpoint ordering guarantees. Log records travel the
+    same queue and are written by the API process, so only one process owns the log files.
+    ``SEGMENT_DONE`` and ``STOPPED`` carry the parser stats and the metric samples recorded since
+    the previous report, which the pool merges into the API process registry.
+    Messages are ``(kind, worker_id, payload)`` tuples; a ``None`` segment stops the worker, and
+    setting ``stop`` abandons the segment being crawled once the job has collected enough rows.
+    """
+
+    ROWS = "rows"
+    LOG = "log"
+    CHECKPOINT = "checkpoint"
+    SEGMENT_DONE = "segment_done"
+    STOPPED = "stopped"
+    _SEGMENT_DONE = object()
+    _END = object()
+    _STOP_POLL_SEC = 0.2
+
+    def __init__(
+        self,
+        spec: CrawlWorkerSpec,
+        segments: multiprocessing.queues.Queue,
+        results: multiprocessing.queues.Queue,
+        stop: Any,
+        provider: Any,
+    ) -> None:
+        self._spec = spec
+        self._segments = segments
+        self._results = results
+        self._stop = stop
+        self._provider = provider
+        self._queue = RowQueue(max_rows=provider.config.scraper.QUEUE_MAX_ROWS)
+        self._browser_manager = BrowserManager(
+            headless=provider.config.scraper.HEADLESS,
+            logger=CrawlWorker._logger(spec.worker_id, results),
+            metrics=provider.metrics,
+        )
+        parser = ParserFactory.get(
+            collect_size=spec.collect_size,
+            pagination_size=spec.pagination_size,
+            limiter=AimdLimiter(
+                initial=min(provider.config.scraper.TASK_POOL_START, spec.task_pool_max),
+                min_limit=min(provider.config.scraper.TASK_POOL_MIN, spec.task_pool_max),
+                max_limit=spec.task_pool_max,
+            ),
+            host_limiter=HostRateLimiter(rate=spec.host_rate_per_sec, burst=spec.host_burst),
+            retries=provider.retry_ledger,
+            blocker=provider.resource_blocker,
+            filter_type=spec.filter_type,
+            fetch_engine=spec.fetch_engine,
+            queue=self._queue,
+            source_type=spec.source_type,
+            browser_manager=self._browser_manager,
+            checkpoints=provider.checkpoint_repository,
+            metrics=provider.metrics,
+        )
+        if not isinstance(parser, IRangeParser):
+            raise NotImplementedError(f"{spec.source_type.value} parser can not crawl in worker processes")
+        self._parser = parser
+
+    async def run(self) -> None:
+        forwarder = asyncio.create_task(self._forward(), name=f"crawl-worker:{self._spec.worker_id}:forward")
+        error: str | None = None
+        try:
+            async with self._parser.open_fetcher() as fetcher:
+                await self._parser.load_checkpoints(since=self._spec.origin)
+                while (segment := await asyncio.to_thread(self._segments.get)) is not None:
+                    start, end = segment
+                    if not await self._crawl(fetcher=fetcher, start=start, end=end):
+                        break
+                    await self._queue.put(CrawlWorker._SEGMENT_DONE)
+        except Exception as e:
+            error = repr(e)
+        finally:
+            await self._queue.put(CrawlWorker._END)
+            await forwarder
+            await self._send(CrawlWorker.STOPPED, (self._parser.stats, error, self._drain_metrics()))
+            await self._browser_manager.stop()
+            await self._provider.db_context.close()
+
+    @staticmethod
+    def _logger(worker_id: int, results: multiprocessing.queues.Queue) -> logging.Logger:
+        logger = logging.getLogger(AppConstants.LOGGER_NAME)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        logger.addHandler(WorkerLogHandler(results, kind=CrawlWorker.LOG, worker_id=worker_id))
+        return logger
+
+    async def _crawl(self, fetcher: IPageFetcher, start: datetime, end: datetime) -> bool:
+        """Crawls one segment and returns ``False`` instead if ``stop`` is set before it is done."""
+        crawl = asyncio.create_task(
+            self._parser.crawl_range(fetcher=fetcher, start=start, end=end),
+            name=f"crawl-worker:{self._spec.worker_id}:segment",
+        )
+        watcher = asyncio.create_task(self._wait_stop(), name=f"crawl-worker:{self._spec.worker_id}:stop")
+        try:
+            await asyncio.wait({crawl, watcher}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            [t.cancel() for t in (crawl, watcher) if not t.done()]
+            await asyncio.gather(crawl, watcher, return_exceptions=True)
+        if not crawl.cancelled():
+            crawl.result()
+            return True
+        return False
+
+    async def _wait_stop(self) -> None:
+        while not self._stop.is_set():
+            await asyncio.sleep(CrawlWorker._STOP_POLL_SEC)
+
+    async def _forward(self) -> None:
+        while True:
+            item = await self._queue.get()
+            if item is CrawlWorker._END:
+                return
+            if item is CrawlWorker._SEGMENT_DONE:
+                await self._send(CrawlWorker.SEGMENT_DONE, (self._parser.stats, self._drain_metrics()))
+            elif isinstance(item, CrawlCheckpointDto):
+                await self._send(CrawlWorker.CHECKPOINT, item)
+            else:
+                await self._send(CrawlWorker.ROWS, item)
+
+    def _drain_metrics(self) -> dict[str, Any]:
+        return dict(self._provider.metrics.registry.drain())
+
+    async def _send(self, kind: str, payload: Any) -> None:
+        """Blocks off the loop while the bounded result queue is full, pushing back on the parser."""
+        await asyncio.to_thread(self._results.put, (kind, self._spec.worker_id, payload))
+
+
+def run_crawl_worker(
+    spec: CrawlWorkerSpec,
+    segments: multiprocessing.queues.Queue,
+    results: multiprocessing.queues.Queue,
+    stop: Any,
+) -> None:
+    """Entry point of a crawl worker process."""
+    # the provider module imports this package, so the worker resolves it only once it runs
+    from application.providers import DependenciesProvider
+
+    asyncio.run(CrawlWorker(spec, segments, results, stop, provider=DependenciesProvider()).run())
@@ -0,0 +1,219 @@
+import asyncio
+import logging
+import multiprocessing
+import multiprocessing.queues
+from datetime import datetime, timedelta, timezone
+from queue import Empty
+from typing import Any
+
+from application.workers.crawl_worker import CrawlWorker, CrawlWorkerSpec, run_crawl_worker
+from application.workers.parser_stats_merger import ParserStatsMerger
+from domain.contracts.parsers import IParser
+from domain.contracts.repositories import ICrawlCheckpointRepository
+from domain.entities import ParserStatsDto
+from domain.enums import DomainSourceType, FetchEngine, FilterType
+from infrastructure.tools.metrics import ServiceMetrics
+from infrastructure.tools.queues import RowQueue
+
+
+class CrawlWorkerPool(IParser):
+    """Runs one crawl across ``workers`` processes, each with its own browser, and feeds the local writer.
+
+    The end-time horizon is cut into ``segment_span`` segments that are handed out on demand, so
+    workers that drew the dense near-term segments do not hold the others back. Segment bounds
+    are moved past any checkpointed window that straddles them, so every known window is
+    replayed by exactly one worker. Rows and checkpoints arrive over a bounded multiprocessing
+    queue and are put into ``queue`` for ``ParsingManager`` exactly as the in-process parser
+    would. Once ``collect_size`` rows have arrived, no new segment is handed out, the workers are
+    told to abandon their current segments, and later rows and checkpoints are dropped. The concurrency
+    and host rate budgets from the settings are divided between the workers, and the metric
+    samples and parser stats they report are merged into ``metrics`` and ``stats``.
+    """
+
+    _POLL_SEC = 0.2
+    _JOIN_TIMEOUT_SEC = 10.0
+
+    def __init__(
+        self,
+        workers: int,
+        collect_size: int,
+        pagination_size: int,
+        filter_type: FilterType,
+        fetch_engine: FetchEngine,
+        source_type: DomainSourceType,
+        queue: RowQueue,
+        checkpoints: ICrawlCheckpointRepository,
+        horizon: timedelta,
+        segment_span: timedelta,
+        results_max: int,
+        task_pool_max: int,
+        host_rate_per_sec: float,
+        host_burst: int,
+        logger: logging.Logger,
+        metrics: ServiceMetrics,
+    ) -> None:
+        if filter_type != FilterType.TIME:
+            raise NotImplementedError(f"worker processes only support the {FilterType.TIME.value} filter")
+        self._workers = max(1, workers)
+        self._collect_size = collect_size
+        self._pagination_size = pagination_size
+        self._filter_type = filter_type
+        self._fetch_engine = fetch_engine
+        self._source_type = source_type
+        self._queue = queue
+        self._checkpoints = checkpoints
+        self._horizon = horizon
+        self._segment_span = segment_span
+        self._results_max = results_max
+        self._task_pool_max = task_pool_max
+        self._host_rate_per_sec = host_rate_per_sec
+        self._host_burst = host_burst
+        self._logger = logger
+        self._metrics = metrics
+        self._merger = ParserStatsMerger()
+        self._stats: dict[int, ParserStatsDto] = {}
+        self._received = 0
+
+    @property
+    def source_name(self) -> str:
+        return self._source_type.value
+
+    @property
+    def stats(self) -> ParserStatsDto:
+        """Merges the latest stats reported by each worker, updated whenever a worker finishes a segment."""
+        return self._merger.merge(list(self._stats.values()))
+
+    async def run(self) -> None:
+        origin = datetime.now(tz=timezone.utc)
+        await self._checkpoints.prune(self.source_name, before=origin)
+        known = await self._checkpoints.get_active(self.source_name, since=origin)
+        pending = CrawlWorkerPool._segments(
+            origin=origin,
+            end=origin + self._horizon,
+            span=self._segment_span,
+            known=[(checkpoint.window_start, checkpoint.window_end) for checkpoint in known],
+        )
+        context = multiprocessing.get_context("spawn")
+        segments = context.Queue()
+        results = context.Queue(maxsize=max(1, self._results_max))
+        stop = context.Event()
+        processes = {
+            worker_id: context.Process(
+                target=run_crawl_worker,
+                args=(self._spec(worker_id, origin), segments, results, stop),
+                name=f"crawl-worker-{worker_id}",
+                daemon=True,
+            )
+            for worker_id in range(self._workers)
+        }
+        for process in processes.values():
+            process.start()
+        for _ in processes:
+            segments.put(pending.pop(0) if pending else None)
+        errors: dict[int, str] = {}
+        running = set(processes)
+        try:
+            while len(running) > 0:
+                message = await asyncio.to_thread(CrawlWorkerPool._poll, results)
+                if message is None:
+                    for worker_id in [w for w in running if not processes[w].is_alive()]:
+                        running.discard(worker_id)
+                        errors[worker_id] = f"exited with code {processes[worker_id].exitcode}"
+                    continue
+                kind, worker_id, payload = message
+                if kind == CrawlWorker.STOPPED:
+                    running.discard(worker_id)
+                    self._stats[worker_id], error, samples = payload
+                    self._metrics.registry.merge(samples)
+                    if error is not None:
+                        errors[worker_id] = error
+                    continue
+                await self._handle(kind, worker_id, payload, pending, segments, stop)
+        finally:
+            await CrawlWorkerPool._stop(list(processes.values()), graceful=len(running) == 0)
+        if len(errors) > 0:
+            raise RuntimeError(
+                "; ".join(
+                    f"worker {worker_id} failed: {error}" for worker_id, error in sorted(errors.items())
+                )
+            )
+
+    async def _handle(
+        self,
+        kind: str,
+        worker_id: int,
+        payload: Any,
+        pending: list[tuple[datetime, datetime]],
+        segments: multiprocessing.queues.Queue,
+        stop: Any,
+    ) -> None:
+        match kind:
+            case CrawlWorker.ROWS:
+                rows = payload[: max(0, self._collect_size - self._received)]
+                if len(rows) > 0:
+                    self._received += len(rows)
+                    await self._queue.put(rows)
+                if self._received >= self._collect_size:
+                    stop.set()
+            case CrawlWorker.LOG:
+                self._logger.handle(payload)
+            case CrawlWorker.CHECKPOINT:
+                # a checkpoint after the quota may cover dropped rows, so the window is crawled again
+                if self._received < self._collect_size:
+                    await self._queue.put(payload)
+            case CrawlWorker.SEGMENT_DONE:
+                self._stats[worker_id], samples = payload
+                self._metrics.registry.merge(samples)
+                has_more = len(pending) > 0 and self._received < self._collect_size
+                segments.put(pending.pop(0) if has_more else None)
+
+    def _spec(self, worker_id: int, origin: datetime) -> CrawlWorkerSpec:
+        """Gives the worker its share of the concurrency and host rate budgets, at least one request."""
+        return CrawlWorkerSpec(
+            worker_id=worker_id,
+            collect_size=self._collect_size,
+            pagination_size=self._pagination_size,
+            filter_type=self._filter_type,
+            fetch_engine=self._fetch_engine,
+            source_type=self._source_type,
+            origin=origin,
+            task_pool_max=self._share(self._task_pool_max, worker_id),
+            host_rate_per_sec=self._host_rate_per_sec / self._workers,
+            host_burst=self._share(self._host_burst, worker_id),
+        )
+
+    def _share(self, total: int, worker_id: int) -> int:
+        share, remainder = divmod(total, self._workers)
+        return max(1, share + (1 if worker_id < remainder else 0))
+
+    @staticmethod
+    def _segments(
+        origin: datetime, end: datetime, span: timedelta, known: list[tuple[datetime, datetime]]
+    ) -> list[tuple[datetime, datetime]]:
+        segments: list[tuple[datetime, datetime]] = []
+        start = origin
+        while start < end:
+            bound = min(start + span, end)
+            for known_start, known_end in sorted(known):
+                if known_start < bound < known_end:
+                    bound = known_end
+            segments.append((start, bound))
+            start = bound
+        return segments
+
+    @staticmethod
+    def _poll(results: multiprocessing.queues.Queue) -> Any:
+        try:
+            return results.get(timeout=CrawlWorkerPool._POLL_SEC)
+        except Empty:
+            return None
+
+    @staticmethod
+    async def _stop(processes: list[Any], graceful: bool) -> None:
+        """Lets workers that reported their stop exit and terminates the ones still crawling (on cancel)."""
+        for process in processes:
+            if graceful and process.is_alive():
+                await asyncio.to_thread(process.join, CrawlWorkerPool._JOIN_TIMEOUT_SEC)
+            if process.is_alive():
+                process.terminate()
+                await asyncio.to_thread(process.join)
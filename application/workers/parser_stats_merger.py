@@ -0,0 +1,104 @@
+from collections import Counter
+from typing import Callable, TypeVar
+
+from domain.entities import (
+    BlockingStatsDto,
+    ConcurrencyStatsDto,
+    PagePoolStatsDto,
+    ParserStatsDto,
+    RetryStatsDto,
+)
+
+T = TypeVar("T")
+
+
+class ParserStatsMerger:
+    """Combines the parser stats reported by crawl workers into one job-level ``ParserStatsDto``.
+
+    Counters and limits are summed across workers, latencies are averaged over the workers that
+    report them, and the dead letters keep the most recent ``dead_letters_max`` entries.
+    """
+
+    def __init__(self, dead_letters_max: int = 100) -> None:
+        self._dead_letters_max = dead_letters_max
+
+    def merge(self, stats: list[ParserStatsDto]) -> ParserStatsDto:
+        return ParserStatsDto(
+            pages_fetched=sum(s.pages_fetched for s in stats),
+            pages_failed=sum(s.pages_failed for s in stats),
+            domains_collected=sum(s.domains_collected for s in stats),
+            windows_skipped=sum(s.windows_skipped for s in stats),
+            windows_resumed=sum(s.windows_resumed for s in stats),
+            page_pool=ParserStatsMerger._merge_parts(stats, lambda s: s.page_pool, self._page_pool),
+            concurrency=ParserStatsMerger._merge_parts(stats, lambda s: s.concurrency, self._concurrency),
+            retries=ParserStatsMerger._merge_parts(stats, lambda s: s.retries, self._retries),
+            blocking=ParserStatsMerger._merge_parts(stats, lambda s: s.blocking, self._blocking),
+        )
+
+    @staticmethod
+    def _merge_parts(
+        stats: list[ParserStatsDto],
+        part: Callable[[ParserStatsDto], T | None],
+        merge: Callable[[list[T]], T],
+    ) -> T | None:
+        parts = [p for p in (part(s) for s in stats) if p is not None]
+        return merge(parts) if len(parts) > 0 else None
+
+    @staticmethod
+    def _page_pool(parts: list[PagePoolStatsDto]) -> PagePoolStatsDto:
+        resets = sum(p.resets for p in parts)
+        reset_latency_ms_total = sum(p.reset_latency_ms_total for p in parts)
+        return PagePoolStatsDto(
+            size=sum(p.size for p in parts),
+            open_pages=sum(p.open_pages for p in parts),
+            hits=sum(p.hits for p in parts),
+            misses=sum(p.misses for p in parts),
+            evictions=sum(p.evictions for p in parts),
+            resets=resets,
+            reset_latency_ms_total=round(reset_latency_ms_total, 2),
+            reset_latency_ms_avg=round(reset_latency_ms_total / resets, 2) if resets else 0.0,
+        )
+
+    @staticmethod
+    def _concurrency(parts: list[ConcurrencyStatsDto]) -> ConcurrencyStatsDto:
+        backoff_events: Counter[str] = Counter()
+        for p in parts:
+            backoff_events.update(p.backoff_events)
+        return ConcurrencyStatsDto(
+            limit=sum(p.limit for p in parts),
+            min_limit=sum(p.min_limit for p in parts),
+            max_limit=sum(p.max_limit for p in parts),
+            in_flight=sum(p.in_flight for p in parts),
+            latency_ewma_ms=ParserStatsMerger._mean([p.latency_ewma_ms for p in parts]),
+            latency_baseline_ms=ParserStatsMerger._mean([p.latency_baseline_ms for p in parts]),
+            increases=sum(p.increases for p in parts),
+            decreases=sum(p.decreases for p in parts),
+            backoff_events=dict(backoff_events),
+        )
+
+    def _retries(self, parts: list[RetryStatsDto]) -> RetryStatsDto:
+        dead_letters = [letter for p in parts for letter in p.dead_letters]
+        return RetryStatsDto(
+            retries=sum(p.retries for p in parts),
+            recovered=sum(p.recovered for p in parts),
+            pending=sum(p.pending for p in parts),
+            dead_letters_total=sum(p.dead_letters_total for p in parts),
+            dead_letters=dead_letters[-self._dead_letters_max :],
+        )
+
+    @staticmethod
+    def _blocking(parts: list[BlockingStatsDto]) -> BlockingStatsDto:
+        blocked_by_type: Counter[str] = Counter()
+        for p in parts:
+            blocked_by_type.update(p.blocked_by_type)
+        return BlockingStatsDto(
+            passed=sum(p.passed for p in parts),
+            blocked=sum(p.blocked for p in parts),
+            blocked_by_type=dict(blocked_by_type),
+            estimated_bytes_saved=sum(p.estimated_bytes_saved for p in parts),
+        )
+
+    @staticmethod
+    def _mean(values: list[float]) -> float:
+        reported = [value for value in values if value > 0]
+        return round(sum(reported) / len(reported), 2) if reported else 0.0
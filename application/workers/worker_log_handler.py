@@ -0,0 +1,35 @@
+import logging
+import multiprocessing.queues
+import queue
+from logging.handlers import QueueHandler
+
+
+class WorkerLogHandler(QueueHandler):
+    """Sends a crawl worker's log records to the API process over the worker's result queue.
+
+    Records go out as ``(kind, worker_id, record)`` messages, already formatted and stripped of
+    arguments and tracebacks so they pickle, and are written by the API process's own handlers.
+    The result queue is bounded and shared with row batches: when it is full the record is
+    dropped and counted rather than stalling the worker's event loop.
+    """
+
+    def __init__(self, results: multiprocessing.queues.Queue, kind: str, worker_id: int) -> None:
+        super().__init__(results)
+        self._kind = kind
+        self._worker_id = worker_id
+        self._dropped = 0
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = super().prepare(record)
+        record.msg = f"[crawl-worker-{self._worker_id}] {record.msg}"
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait((self._kind, self._worker_id, record))
+        except queue.Full:
+            self._dropped += 1
@@ -0,0 +1,188 @@
+"""Local stand-in for the GoDaddy ``find/auction/recommend`` endpoint.
+
+Serves synthetic (or recorded) auctions filtered by ``endTimeAfter``/``endTimeBefore`` and paged
+by ``paginationStart``/``paginationSize``, with configurable latency and error rates.
+Run it on its own from the repository root::
+
+    python -m benchmarks.fake_godaddy_api --port 8700 --items 20000 --latency-ms 40
+"""
+
+import argparse
+import asyncio
+import bisect
+import json
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+ENDPOINT = "/beta/findApiProxy/v4/aftermarket/find/auction/recommend"
+
+
+class FakeAuctionCatalogue:
+    def __init__(self, items: list[dict[str, Any]]) -> None:
+        self._items = sorted(items, key=lambda item: FakeAuctionCatalogue.parse_time(item["end_time"]))
+        self._end_times = [FakeAuctionCatalogue.parse_time(item["end_time"]) for item in self._items]
+
+    @staticmethod
+    def synthetic(count: int, seed: int, mean_hours: float = 40.0) -> "FakeAuctionCatalogue":
+        """Auction end times are exponentially distributed, so the near future is dense."""
+        rnd = random.Random(seed)
+        now = datetime.now(tz=timezone.utc)
+        items = [
+            {
+                "fqdn": f"auction-{i}.com",
+                "auction_price": rnd.randint(5, 5_000),
+                "bids": rnd.randint(0, 60),
+                "domain_create_date": "2015-06-01T00:00:00.000Z",
+                "end_time": FakeAuctionCatalogue.time_repr(
+                    now + timedelta(hours=rnd.expovariate(1 / mean_hours))
+                ),
+                "listing_id": i,
+                "is_adult": False,
+                "traffic": {"visitors": rnd.randint(0, 300)},
+            }
+            for i in range(count)
+        ]
+        return FakeAuctionCatalogue(items)
+
+    @staticmethod
+    def recorded(path: str) -> "FakeAuctionCatalogue":
+        """Loads a JSON list of ``results`` items or of whole recorded pages."""
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+        items: list[dict[str, Any]] = []
+        for entry in data:
+            items.extend(entry.get("results", []) if "results" in entry else [entry])
+        return FakeAuctionCatalogue(items)
+
+    def page(self, query: dict[str, str]) -> dict[str, Any]:
+        after = FakeAuctionCatalogue.parse_time(query["endTimeAfter"])
+        before = FakeAuctionCatalogue.parse_time(query["endTimeBefore"])
+        first = bisect.bisect_left(self._end_times, after)
+        last = bisect.bisect_left(self._end_times, before)
+        start = first + int(query.get("paginationStart", 0))
+        size = int(query.get("paginationSize", 100))
+        return {
+            "pagination": {"total": last - first, "start": start - first, "size": size},
+            "results": self._items[start : min(last, start + size)],
+        }
+
+    @staticmethod
+    def parse_time(value: str) -> datetime:
+        return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%fZ").replace(tzinfo=timezone.utc)
+
+    @staticmethod
+    def time_repr(value: datetime) -> str:
+        return value.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+class FakeGoDaddyApi:
+    def __init__(
+        self,
+        catalogue: FakeAuctionCatalogue,
+        latency_ms: float,
+        jitter_ms: float,
+        error_rate: float,
+        throttle_rate: float,
+        seed: int,
+    ) -> None:
+        self._catalogue = catalogue
+        self._latency = latency_ms / 1000
+        self._jitter = jitter_ms / 1000
+        self._error_rate = error_rate
+        self._throttle_rate = throttle_rate
+        self._random = random.Random(seed)
+        self._server: asyncio.Server | None = None
+
+    @property
+    def port(self) -> int:
+        if self._server is None:
+            raise RuntimeError("server is not started")
+        return int(self._server.sockets[0].getsockname()[1])
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        self._server = await asyncio.start_server(self._handle, host=host, port=port)
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = (await reader.readline()).decode()
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                continue
+            status, body = await self._respond(request_line)
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode()
+                + body
+            )
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _respond(self, request_line: str) -> tuple[str, bytes]:
+        parts = request_line.split(" ")
+        if len(parts) < 2:
+            return "400 Bad Request", b"{}"
+        target = urlsplit(parts[1])
+        if target.path != ENDPOINT:
+            return "404 Not Found", b"{}"
+        await asyncio.sleep(max(0.0, self._latency + self._random.uniform(-self._jitter, self._jitter)))
+        roll = self._random.random()
+        if roll < self._throttle_rate:
+            return "429 Too Many Requests", b"{}"
+        if roll < self._throttle_rate + self._error_rate:
+            return "500 Internal Server Error", b"{}"
+        query = {key: values[0] for key, values in parse_qs(target.query).items()}
+        try:
+            page = self._catalogue.page(query)
+        except (KeyError, ValueError):
+            return "400 Bad Request", b"{}"
+        return "200 OK", json.dumps(page).encode()
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--items", type=int, default=20_000, help="synthetic auctions to serve")
+    parser.add_argument("--recorded", default=None, help="JSON file with recorded results or pages")
+    parser.add_argument("--latency-ms", type=float, default=30.0)
+    parser.add_argument("--jitter-ms", type=float, default=10.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of 500 responses")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="share of 429 responses")
+    parser.add_argument("--seed", type=int, default=1)
+
+
+def create_api(args: argparse.Namespace) -> FakeGoDaddyApi:
+    catalogue = (
+        FakeAuctionCatalogue.recorded(args.recorded)
+        if args.recorded
+        else FakeAuctionCatalogue.synthetic(args.items, seed=args.seed)
+    )
+    return FakeGoDaddyApi(
+        catalogue=catalogue,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        seed=args.seed,
+    )
+
+
+async def serve(args: argparse.Namespace) -> None:
+    api = create_api(args)
+    await api.start(port=args.port)
+    print(f"serving http://127.0.0.1:{api.port}{ENDPOINT}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await api.stop()
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--port", type=int, default=8700)
+    add_arguments(arg_parser)
+    asyncio.run(serve(arg_parser.parse_args()))
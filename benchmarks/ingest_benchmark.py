@@ -0,0 +1,311 @@
+"""Offline crawl-to-SQLite benchmark against the local fake GoDaddy API.
+
+Drives ``GoDaddyPlaywrightParser.crawl`` -> ``ParsingManager`` -> ``DomainRepository.bulk_create``
+on a fresh, migrated SQLite file, with the fake API running in a child process. Reports pages/sec,
+rows/sec, per-stage latency percentiles and peak RSS, and writes them as JSON. Run from the
+repository root::
+
+    python -m benchmarks.ingest_benchmark --items 20000 --latency-ms 30 --error-rate 0.02
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import resource
+import subprocess
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, TypeVar
+from urllib.parse import urlsplit
+
+from alembic import command
+from alembic.config import Config
+
+from application.caches import ResponseCache
+from application.managers import ParsingManager
+from application.services import DomainService, SourceRegistry
+from application.settings import Settings
+from benchmarks.fake_godaddy_api import add_arguments, create_api
+from domain.contracts.fetchers import IPageFetcher
+from domain.contracts.parsers import IParser
+from domain.entities import AddDomainRow, BulkCreateResultDto, ParserStatsDto
+from domain.enums import FetchEngine, FilterType
+from domain.exceptions import PageFetchError
+from infrastructure.browsers import BrowserManager
+from infrastructure.database import DbContext
+from infrastructure.parsers import GoDaddyPlaywrightParser
+from infrastructure.repositories import (
+    CrawlCheckpointRepository,
+    DomainRepository,
+    DomainSnapshotRepository,
+    DomainSourceRepository,
+)
+from infrastructure.tools.blockers import ResourceBlocker
+from infrastructure.tools.limiters import AimdLimiter, HostRateLimiter
+from infrastructure.tools.metrics import MetricsRegistry, ServiceMetrics
+from infrastructure.tools.queues import RowQueue
+from infrastructure.tools.retries import RetryLedger
+from infrastructure.tools.validators import DomainRowValidator
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+T = TypeVar("T")
+
+
+class StageTimings:
+    def __init__(self) -> None:
+        self._samples: dict[str, list[float]] = defaultdict(list)
+
+    def add(self, stage: str, seconds: float) -> None:
+        self._samples[stage].append(seconds)
+
+    async def measure(self, stage: str, call: Callable[[], Awaitable[T]]) -> T:
+        start_time = time.perf_counter()
+        try:
+            return await call()
+        finally:
+            self.add(stage, time.perf_counter() - start_time)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        return {stage: StageTimings._percentiles(samples) for stage, samples in sorted(self._samples.items())}
+
+    @staticmethod
+    def _percentiles(samples: list[float]) -> dict[str, float]:
+        ordered = sorted(samples)
+
+        def at(share: float) -> float:
+            return round(ordered[min(len(ordered) - 1, int(share * len(ordered)))] * 1000, 3)
+
+        return {
+            "count": len(ordered),
+            "p50_ms": at(0.5),
+            "p90_ms": at(0.9),
+            "p99_ms": at(0.99),
+            "max_ms": at(1.0),
+        }
+
+
+class LocalApiFetcher(IPageFetcher):
+    """Sends the parser's GoDaddy URLs to the local fake API over plain HTTP/1.1."""
+
+    _TIMEOUT_SEC = 30.0
+
+    def __init__(self, port: int, timings: StageTimings) -> None:
+        self._port = port
+        self._timings = timings
+
+    async def fetch(self, url: str) -> dict[str, Any]:
+        return await self._timings.measure("fetch", lambda: self._get(url))
+
+    async def close(self) -> None:
+        pass
+
+    async def _get(self, url: str) -> dict[str, Any]:
+        parts = urlsplit(url)
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection("127.0.0.1", self._port), LocalApiFetcher._TIMEOUT_SEC
+            )
+            try:
+                writer.write(f"GET {parts.path}?{parts.query} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+                await writer.drain()
+                raw = await asyncio.wait_for(reader.read(), LocalApiFetcher._TIMEOUT_SEC)
+            finally:
+                writer.close()
+        except asyncio.TimeoutError as e:
+            raise PageFetchError(url=url, reason="timeout", timed_out=True) from e
+        except OSError as e:
+            raise PageFetchError(url=url, reason=str(e)) from e
+        head, _, body = raw.partition(b"\r\n\r\n")
+        status = int(head.split(b" ", 2)[1])
+        if status != 200:
+            raise PageFetchError(url=url, status=status, reason=head.split(b"\r\n", 1)[0].decode())
+        return dict(json.loads(body))
+
+
+class TimedDomainService(DomainService):
+    timings: StageTimings
+
+    async def bulk_create(self, rows: list[AddDomainRow], source_name: str) -> BulkCreateResultDto:
+        return await self.timings.measure(
+            "write", lambda: super(TimedDomainService, self).bulk_create(rows, source_name)
+        )
+
+
+class CrawlOnlyParser(IParser):
+    """Skips the browser context set-up of ``run`` and crawls through the given fetcher."""
+
+    def __init__(self, parser: GoDaddyPlaywrightParser, fetcher: IPageFetcher) -> None:
+        self._parser = parser
+        self._fetcher = fetcher
+
+    @property
+    def source_name(self) -> str:
+        return self._parser.source_name
+
+    @property
+    def stats(self) -> ParserStatsDto:
+        return self._parser.stats
+
+    async def run(self) -> None:
+        await self._parser.crawl(fetcher=self._fetcher)
+
+
+def _time_validation(timings: StageTimings) -> None:
+    validate = DomainRowValidator.validate
+
+    def timed(items: list[dict[str, Any]]) -> list[AddDomainRow]:
+        start_time = time.perf_counter()
+        try:
+            return validate(items)
+        finally:
+            timings.add("validate", time.perf_counter() - start_time)
+
+    DomainRowValidator.validate = staticmethod(timed)  # type: ignore[method-assign]
+
+
+def _serve(args: argparse.Namespace, ports: "multiprocessing.Queue[int]") -> None:
+    async def main() -> None:
+        api = create_api(args)
+        await api.start()
+        ports.put(api.port)
+        await asyncio.Event().wait()
+
+    asyncio.run(main())
+
+
+def _migrate(db_path: str) -> None:
+    os.environ["DB__URL"] = db_path
+    config = Config(os.path.join(_ROOT, "alembic.ini"))
+    command.upgrade(config, "head")
+
+
+def _git_revision() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=_ROOT, capture_output=True, text=True
+        )
+    except OSError:
+        return None
+    return out.stdout.strip() or None
+
+
+async def _crawl(args: argparse.Namespace, port: int, db_path: str, timings: StageTimings) -> dict[str, Any]:
+    settings = Settings()
+    context = DbContext(url=db_path)
+    metrics = ServiceMetrics(registry=MetricsRegistry())
+    registry = SourceRegistry(source_repository=DomainSourceRepository(context=context))
+    await registry.load()
+    service = TimedDomainService(
+        domain_repository=DomainRepository(context=context, metrics=metrics),
+        snapshot_repository=DomainSnapshotRepository(context=context),
+        source_registry=registry,
+        cache=ResponseCache(max_entries=1, ttl=0),
+    )
+    service.timings = timings
+    queue = RowQueue(max_rows=settings.scraper.QUEUE_MAX_ROWS)
+    checkpoints = CrawlCheckpointRepository(context=context)
+    parser = GoDaddyPlaywrightParser(
+        collect_size=args.collect_size,
+        pagination_size=args.page_size,
+        limiter=AimdLimiter(
+            initial=settings.scraper.TASK_POOL_START,
+            min_limit=settings.scraper.TASK_POOL_MIN,
+            max_limit=args.concurrency,
+        ),
+        host_limiter=HostRateLimiter(rate=args.rate, burst=max(1, int(args.rate))),
+        retries=RetryLedger(max_attempts=args.retry_attempts, base_delay=args.retry_delay, max_delay=1.0),
+        blocker=ResourceBlocker(resource_types=[], url_patterns=[], allow_patterns=[]),
+        filter_type=FilterType.TIME,
+        fetch_engine=FetchEngine.API,
+        queue=queue,
+        browser_manager=BrowserManager(headless=True, logger=logging.getLogger(__name__), metrics=metrics),
+        checkpoints=checkpoints,
+        metrics=metrics,
+    )
+    manager = ParsingManager(
+        domains_service=service,
+        source_registry=registry,
+        parser=CrawlOnlyParser(parser=parser, fetcher=LocalApiFetcher(port=port, timings=timings)),
+        queue=queue,
+        checkpoints=checkpoints,
+        consumers=args.consumers or settings.scraper.WRITER_CONSUMERS,
+        batch_rows=settings.scraper.WRITER_BATCH_ROWS,
+        flush_interval=settings.scraper.WRITER_FLUSH_SEC,
+    )
+    start_time = time.perf_counter()
+    try:
+        await manager.run()
+    finally:
+        elapsed = time.perf_counter() - start_time
+        await context.close()
+    stats = manager.parser_stats
+    rows = manager.inserted + manager.updated
+    return {
+        "elapsed_sec": round(elapsed, 3),
+        "pages": stats.pages_fetched,
+        "pages_failed": stats.pages_failed,
+        "rows": rows,
+        "pages_per_sec": round(stats.pages_fetched / elapsed, 2),
+        "rows_per_sec": round(rows / elapsed, 2),
+        "commits": manager.commits,
+        "parser": stats.model_dump(mode="json"),
+    }
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    ports: "multiprocessing.Queue[int]" = multiprocessing.Queue()
+    server = multiprocessing.Process(target=_serve, args=(args, ports), daemon=True)
+    server.start()
+    timings = StageTimings()
+    _time_validation(timings)
+    try:
+        port = ports.get(timeout=60)
+        with tempfile.TemporaryDirectory() as folder:
+            db_path = os.path.join(folder, "benchmark.db")
+            _migrate(db_path)
+            totals = asyncio.run(_crawl(args, port, db_path, timings))
+    finally:
+        server.terminate()
+        server.join()
+    return {
+        "benchmark": "ingest",
+        "created_at": datetime.now(tz=timezone.utc).isoformat(),
+        "git_revision": _git_revision(),
+        "config": {key: value for key, value in vars(args).items() if key != "out"},
+        **totals,
+        "stages": timings.summary(),
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    parser.add_argument("--collect-size", type=int, default=1_000_000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=8, help="upper bound of the AIMD limiter")
+    parser.add_argument("--rate", type=float, default=1_000.0, help="host rate limit, requests/sec")
+    parser.add_argument("--retry-attempts", type=int, default=4)
+    parser.add_argument("--retry-delay", type=float, default=0.05)
+    parser.add_argument("--consumers", type=int, default=0, help="writer consumers, 0 uses the settings")
+    parser.add_argument("--out", default=None, help="result file, defaults to benchmarks/results/")
+    arguments = parser.parse_args()
+
+    result = run(arguments)
+    out = arguments.out or os.path.join(
+        _ROOT, "benchmarks", "results", f"ingest-{datetime.now(tz=timezone.utc):%Y%m%dT%H%M%SZ}.json"
+    )
+    os.makedirs(os.path.dirname(out), exist_ok=True)
+    with open(out, "w", encoding="utf-8") as file:
+        json.dump(result, file, indent=2)
+    print(
+        json.dumps(
+            {key: result[key] for key in ("pages_per_sec", "rows_per_sec", "stages", "peak_rss_mb")}, indent=2
+        )
+    )
+    print(f"results written to {out}")
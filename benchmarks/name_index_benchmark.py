@@ -0,0 +1,59 @@
+"""Per-batch de-duplication cost against a growing table of known names.
+
+Run from the repository root::
+
+    python -m benchmarks.name_index_benchmark
+"""
+
+import argparse
+import time
+from typing import Callable
+
+from infrastructure.tools.indexes import NameIndex
+
+
+def _names(start: int, count: int) -> list[str]:
+    return [f"domain-{i}.com" for i in range(start, start + count)]
+
+
+def _list_scan(known: list[str], batch: list[str]) -> list[str]:
+    selected: list[str] = []
+    for name in batch:
+        if name not in known:
+            known.append(name)
+            selected.append(name)
+    return selected
+
+
+def _measure(fn: Callable[[list[str]], object], batches: list[list[str]]) -> float:
+    best = float("inf")
+    for batch in batches:
+        start_time = time.perf_counter()
+        fn(batch)
+        best = min(best, time.perf_counter() - start_time)
+    return best * 1000
+
+
+def run(sizes: list[int], batch_size: int, repeats: int, with_list: bool) -> None:
+    print(f"{'table size':>12} {'name index, ms':>16} {'list scan, ms':>16}")
+    for size in sizes:
+        stored = _names(0, size)
+        # every batch is half already stored names, half new ones
+        batches = [_names(size - batch_size // 2 + r * batch_size, batch_size) for r in range(repeats)]
+        index = NameIndex(max_size=size + batch_size * repeats)
+        index.add_many(stored)
+        index_ms = _measure(lambda batch: index.select_new(batch, key=str), batches)
+        list_cell = "-"
+        if with_list:
+            list_cell = f"{_measure(lambda batch: _list_scan(stored, batch), batches):.3f}"
+        print(f"{size:>12} {index_ms:>16.3f} {list_cell:>16}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 500_000])
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--skip-list", action="store_true", help="do not measure the list scan baseline")
+    args = parser.parse_args()
+    run(sizes=args.sizes, batch_size=args.batch_size, repeats=args.repeats, with_list=not args.skip_list)
@@ -0,0 +1,92 @@
+"""Rows/sec from a raw ``results`` array to insert rows, per-item DTOs versus one list validation.
+
+Run from the repository root::
+
+    python -m benchmarks.row_validation_benchmark
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+from domain.entities import AddDomainDto
+from infrastructure.tools.mappers import DomainMapper
+from infrastructure.tools.validators import DomainRowValidator
+
+_COLLECTED_AT = datetime.now(tz=timezone.utc)
+
+
+def _results(count: int, invalid_every: int) -> list[dict[str, Any]]:
+    now = datetime.now(tz=timezone.utc)
+    items: list[dict[str, Any]] = []
+    for i in range(count):
+        item: dict[str, Any] = {
+            "fqdn": f"domain-{i}.com",
+            "auction_price": i % 5_000,
+            "bids": i % 40,
+            "domain_create_date": "2015-06-01T00:00:00.000Z",
+            "end_time": (now + timedelta(minutes=i)).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z",
+            "listing_id": i,
+            "is_adult": False,
+            "traffic": {"visitors": i % 300, "valuation": i * 3},
+        }
+        if invalid_every > 0 and i % invalid_every == 0:
+            del item["end_time"]
+        items.append(item)
+    return items
+
+
+def _per_item(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    dtos: list[AddDomainDto] = []
+    for item in items:
+        try:
+            dtos.append(AddDomainDto(**item))
+        except Exception:
+            continue
+    return [
+        {
+            "name": dto.name,
+            "price": dto.price,
+            "bids": dto.bids,
+            "collected_at": _COLLECTED_AT,
+            "domain_created_at": dto.domain_created_at,
+            "auction_ended_at": dto.auction_ended_at,
+            "domain_source_id": 1,
+        }
+        for dto in dtos
+    ]
+
+
+def _bulk(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return DomainMapper.to_row_list(DomainRowValidator.validate(items), 1, collected_at=_COLLECTED_AT)
+
+
+def _rows_per_sec(
+    fn: Callable[[list[dict[str, Any]]], list[dict[str, Any]]], items: list[dict[str, Any]], repeats: int
+) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        fn(items)
+        best = min(best, time.perf_counter() - start_time)
+    return len(items) / best
+
+
+def run(page_sizes: list[int], invalid_every: int, repeats: int) -> None:
+    print(f"{'page size':>10} {'per-item, rows/s':>18} {'bulk, rows/s':>14} {'speedup':>8}")
+    for size in page_sizes:
+        items = _results(size, invalid_every)
+        assert _per_item(items) == _bulk(items)
+        before = _rows_per_sec(_per_item, items, repeats)
+        after = _rows_per_sec(_bulk, items, repeats)
+        print(f"{size:>10} {before:>18,.0f} {after:>14,.0f} {after / before:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[100, 1_000, 10_000])
+    parser.add_argument("--invalid-every", type=int, default=0, help="drop end_time from every n-th item")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+    run(page_sizes=args.page_sizes, invalid_every=args.invalid_every, repeats=args.repeats)
@@ -0,0 +1,55 @@
+import argparse
+import asyncio
+from datetime import datetime
+
+from application.providers import DependenciesProvider
+from domain.entities import DomainQueryDto
+from domain.enums import ColumnarFormat, DomainSourceType
+
+
+async def export_domains(args: argparse.Namespace) -> None:
+    provider = DependenciesProvider()
+    query = DomainQueryDto(
+        price_min=args.price_min,
+        price_max=args.price_max,
+        bids_min=args.bids_min,
+        bids_max=args.bids_max,
+        ended_after=args.ended_after,
+        ended_before=args.ended_before,
+        collected_since=args.collected_since,
+    )
+    chunks = provider.domains_service.iter_columns(
+        query=query, chunk_size=args.chunk_size, source_name=args.source.value if args.source else None
+    )
+    try:
+        with open(args.out, "wb") as file:
+            async for data in provider.domain_exporter.export(chunks, args.format):
+                file.write(data)
+    finally:
+        await provider.db_context.close()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="domain parser service tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser("export", help="export the domains table as Parquet or an Arrow stream")
+    export.add_argument("--out", required=True)
+    export.add_argument("--format", type=ColumnarFormat, default=ColumnarFormat.PARQUET)
+    export.add_argument("--chunk-size", type=int, default=10_000)
+    export.add_argument("--source", type=DomainSourceType, default=None)
+    export.add_argument("--price-min", type=int, default=None)
+    export.add_argument("--price-max", type=int, default=None)
+    export.add_argument("--bids-min", type=int, default=None)
+    export.add_argument("--bids-max", type=int, default=None)
+    export.add_argument("--ended-after", type=datetime.fromisoformat, default=None)
+    export.add_argument("--ended-before", type=datetime.fromisoformat, default=None)
+    export.add_argument("--collected-since", type=datetime.fromisoformat, default=None)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    arguments = parse_args()
+    match arguments.command:
+        case "export":
+            asyncio.run(export_domains(arguments))
@@ -0,0 +1,3 @@
+__all__ = ["IDomainExporter"]
+
+from .i_domain_exporter import IDomainExporter
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator
+
+from domain.enums import ColumnarFormat
+
+
+class IDomainExporter(ABC):
+    @abstractmethod
+    def export(
+        self, chunks: AsyncIterator[dict[str, list[Any]]], fmt: ColumnarFormat
+    ) -> AsyncIterator[bytes]:
+        """"""
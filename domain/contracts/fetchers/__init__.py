@@ -0,0 +1,3 @@
+__all__ = ["IPageFetcher"]
+
+from .i_page_fetcher import IPageFetcher
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class IPageFetcher(ABC):
+    @abstractmethod
+    async def fetch(self, url: str) -> dict[str, Any]:
+        """"""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """"""
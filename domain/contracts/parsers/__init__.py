@@ -1,3 +1,4 @@
-__all__ = ["IParser"]
+__all__ = ["IParser", "IRangeParser"]
 
 from .i_parser import IParser
+from .i_range_parser import IRangeParser
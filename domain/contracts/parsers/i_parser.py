@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+from domain.entities import ParserStatsDto
+
 
 class IParser(ABC):
     @property
@@ -7,6 +9,11 @@ class IParser(ABC):
     def source_name(self) -> str:
         """"""
 
+    @property
+    @abstractmethod
+    def stats(self) -> ParserStatsDto:
+        """"""
+
     @abstractmethod
     async def run(self) -> None:
         """"""
@@ -0,0 +1,20 @@
+from abc import abstractmethod
+from contextlib import AbstractAsyncContextManager
+from datetime import datetime
+
+from domain.contracts.fetchers import IPageFetcher
+from domain.contracts.parsers.i_parser import IParser
+
+
+class IRangeParser(IParser):
+    @abstractmethod
+    def open_fetcher(self) -> AbstractAsyncContextManager[IPageFetcher]:
+        """"""
+
+    @abstractmethod
+    async def load_checkpoints(self, since: datetime) -> None:
+        """"""
+
+    @abstractmethod
+    async def crawl_range(self, fetcher: IPageFetcher, start: datetime, end: datetime) -> None:
+        """"""
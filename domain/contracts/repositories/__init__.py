@@ -1,7 +1,11 @@
 __all__ = [
+    "ICrawlCheckpointRepository",
     "IDomainRepository",
+    "IDomainSnapshotRepository",
     "IDomainSourceRepository",
 ]
 
+from .i_crawl_checkpoint_repository import ICrawlCheckpointRepository
 from .i_domain_repository import IDomainRepository
+from .i_domain_snapshot_repository import IDomainSnapshotRepository
 from .i_domain_source_repository import IDomainSourceRepository
@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from domain.entities import CrawlCheckpointDto
+
+
+class ICrawlCheckpointRepository(ABC):
+    @abstractmethod
+    async def get_active(self, source_name: str, since: datetime) -> list[CrawlCheckpointDto]:
+        """"""
+
+    @abstractmethod
+    async def save(self, source_id: int, checkpoint: CrawlCheckpointDto) -> None:
+        """"""
+
+    @abstractmethod
+    async def prune(self, source_name: str, before: datetime) -> int:
+        """"""
@@ -1,6 +1,14 @@
 from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator
 
-from domain.entities import AddDomainDto, GetDomainDto
+from domain.entities import (
+    AddDomainDto,
+    AddDomainRow,
+    BulkCreateResultDto,
+    DomainPageDto,
+    DomainQueryDto,
+    GetDomainDto,
+)
 
 
 class IDomainRepository(ABC):
@@ -9,13 +17,29 @@ class IDomainRepository(ABC):
         """"""
 
     @abstractmethod
-    async def bulk_create(self, dtos: list[AddDomainDto], source_id: int) -> list[GetDomainDto]:
+    async def bulk_create(self, rows: list[AddDomainRow], source_id: int) -> BulkCreateResultDto:
         """"""
 
     @abstractmethod
     async def get_all(self) -> list[GetDomainDto]:
         """"""
 
+    @abstractmethod
+    async def query(self, query: DomainQueryDto) -> DomainPageDto:
+        """"""
+
+    @abstractmethod
+    async def count(self) -> int:
+        """"""
+
+    @abstractmethod
+    def iter_names(self, chunk_size: int) -> AsyncIterator[list[str]]:
+        """"""
+
+    @abstractmethod
+    def iter_columns(self, query: DomainQueryDto, chunk_size: int) -> AsyncIterator[dict[str, list[Any]]]:
+        """"""
+
     @abstractmethod
     async def get_by_id(self, domain_id: int) -> GetDomainDto | None:
         """"""
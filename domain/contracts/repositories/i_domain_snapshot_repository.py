@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from domain.entities import DomainMoverDto, DomainSnapshotDto
+from domain.enums import MoverField
+
+
+class IDomainSnapshotRepository(ABC):
+    @abstractmethod
+    async def get_history(self, name: str, limit: int) -> list[DomainSnapshotDto]:
+        """"""
+
+    @abstractmethod
+    async def get_movers(self, since: datetime, field: MoverField, limit: int) -> list[DomainMoverDto]:
+        """"""
@@ -1,15 +1,47 @@
 __all__ = [
     "DomainSourceDto",
     "AddDomainDto",
+    "AddDomainRow",
+    "BulkCreateResultDto",
     "GetDomainDto",
     "DomainSourceDtoWithDomains",
     "DomainDtoWithParent",
+    "BlockingStatsDto",
+    "ConcurrencyStatsDto",
+    "DeadLetterDto",
+    "RetryStatsDto",
+    "PagePoolStatsDto",
+    "ParserStatsDto",
+    "JobDto",
+    "DomainQueryDto",
+    "DomainPageDto",
+    "DomainSnapshotDto",
+    "DomainMoverDto",
+    "CrawlCheckpointDto",
+    "SlowCallbackDto",
+    "LoopLagStatsDto",
+    "TaskDumpDto",
 ]
 
+from .checkpoints import CrawlCheckpointDto
+from .diagnostics import LoopLagStatsDto, SlowCallbackDto, TaskDumpDto
 from .domains import (
     AddDomainDto,
+    AddDomainRow,
+    BulkCreateResultDto,
     DomainDtoWithParent,
     DomainSourceDto,
     DomainSourceDtoWithDomains,
     GetDomainDto,
 )
+from .jobs import JobDto
+from .queries import DomainPageDto, DomainQueryDto
+from .snapshots import DomainMoverDto, DomainSnapshotDto
+from .stats import (
+    BlockingStatsDto,
+    ConcurrencyStatsDto,
+    DeadLetterDto,
+    PagePoolStatsDto,
+    ParserStatsDto,
+    RetryStatsDto,
+)
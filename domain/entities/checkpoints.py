@@ -0,0 +1,12 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class CrawlCheckpointDto(BaseModel):
+    window_start: datetime
+    window_end: datetime
+    total: int
+    next_offset: int
+    completed: bool
+    high_watermark: datetime | None = None
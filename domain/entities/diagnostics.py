@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class SlowCallbackDto(BaseModel):
+    at: datetime
+    lag_ms: float
+    stack: list[str]
+
+
+class LoopLagStatsDto(BaseModel):
+    running: bool
+    interval_ms: float
+    threshold_ms: float
+    samples: int
+    slow_total: int
+    last_lag_ms: float
+    max_lag_ms: float
+    slow_callbacks: list[SlowCallbackDto]
+
+
+class TaskDumpDto(BaseModel):
+    name: str
+    coroutine: str
+    done: bool
+    cancelling: bool
+    stack: list[str]
@@ -1,6 +1,8 @@
 from datetime import datetime
+from typing import Annotated
 
 from pydantic import BaseModel, Field
+from typing_extensions import NotRequired, TypedDict
 
 
 class DomainSourceDto(BaseModel):
@@ -16,6 +18,23 @@ class AddDomainDto(BaseModel):
     auction_ended_at: datetime = Field(validation_alias="end_time")
 
 
+class AddDomainRow(TypedDict):
+    """Validated insert row for bulk ingest; the lean counterpart of AddDomainDto."""
+
+    name: Annotated[str, Field(validation_alias="fqdn")]
+    price: NotRequired[Annotated[int, Field(validation_alias="auction_price")]]
+    bids: int
+    domain_created_at: NotRequired[Annotated[datetime | None, Field(validation_alias="domain_create_date")]]
+    auction_ended_at: Annotated[datetime, Field(validation_alias="end_time")]
+
+
+class BulkCreateResultDto(BaseModel):
+    inserted: int = 0
+    updated: int = 0
+    changed: int = 0
+    failed: bool = False
+
+
 class GetDomainDto(BaseModel):
     id: int
     name: str
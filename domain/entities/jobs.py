@@ -0,0 +1,24 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from domain.entities.stats import ParserStatsDto
+from domain.enums import JobState
+
+
+class JobDto(BaseModel):
+    id: str
+    state: JobState
+    source: str
+    filter_type: str
+    fetch_engine: str
+    collect_size: int
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    error: str | None = None
+    pages_per_sec: float = 0.0
+    domains_inserted: int = 0
+    domains_updated: int = 0
+    commits: int = 0
+    parser: ParserStatsDto = ParserStatsDto()
@@ -0,0 +1,26 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from domain.entities.domains import GetDomainDto
+from domain.enums import DomainSortField, SortOrder
+
+
+class DomainQueryDto(BaseModel):
+    price_min: int | None = None
+    price_max: int | None = None
+    bids_min: int | None = None
+    bids_max: int | None = None
+    ended_after: datetime | None = None
+    ended_before: datetime | None = None
+    source_id: int | None = None
+    collected_since: datetime | None = None
+    sort_by: DomainSortField = DomainSortField.ID
+    order: SortOrder = SortOrder.ASC
+    limit: int = 100
+    cursor: str | None = None
+
+
+class DomainPageDto(BaseModel):
+    items: list[GetDomainDto]
+    next_cursor: str | None = None
@@ -0,0 +1,18 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class DomainSnapshotDto(BaseModel):
+    price: int
+    bids: int
+    captured_at: datetime
+
+
+class DomainMoverDto(BaseModel):
+    id: int
+    name: str
+    price: int
+    bids: int
+    price_change: int
+    bids_change: int
@@ -0,0 +1,58 @@
+from pydantic import BaseModel
+
+
+class PagePoolStatsDto(BaseModel):
+    size: int
+    open_pages: int
+    hits: int
+    misses: int
+    evictions: int
+    resets: int
+    reset_latency_ms_total: float
+    reset_latency_ms_avg: float
+
+
+class ConcurrencyStatsDto(BaseModel):
+    limit: int
+    min_limit: int
+    max_limit: int
+    in_flight: int
+    latency_ewma_ms: float
+    latency_baseline_ms: float
+    increases: int
+    decreases: int
+    backoff_events: dict[str, int]
+
+
+class DeadLetterDto(BaseModel):
+    url: str
+    attempts: int
+    status: int | None
+    reason: str
+
+
+class RetryStatsDto(BaseModel):
+    retries: int
+    recovered: int
+    pending: int
+    dead_letters_total: int
+    dead_letters: list[DeadLetterDto]
+
+
+class BlockingStatsDto(BaseModel):
+    passed: int
+    blocked: int
+    blocked_by_type: dict[str, int]
+    estimated_bytes_saved: int
+
+
+class ParserStatsDto(BaseModel):
+    pages_fetched: int = 0
+    pages_failed: int = 0
+    domains_collected: int = 0
+    windows_skipped: int = 0
+    windows_resumed: int = 0
+    page_pool: PagePoolStatsDto | None = None
+    concurrency: ConcurrencyStatsDto | None = None
+    retries: RetryStatsDto | None = None
+    blocking: BlockingStatsDto | None = None
@@ -1,6 +1,23 @@
 __all__ = [
+    "ColumnarFormat",
+    "DomainSortField",
     "DomainSourceType",
+    "ExportFormat",
+    "FetchEngine",
     "FilterType",
+    "JobState",
+    "MoverField",
+    "SortOrder",
 ]
 
-from .domain_enums import DomainSourceType, FilterType
+from .domain_enums import (
+    ColumnarFormat,
+    DomainSortField,
+    DomainSourceType,
+    ExportFormat,
+    FetchEngine,
+    FilterType,
+    JobState,
+    MoverField,
+    SortOrder,
+)
@@ -9,3 +9,44 @@ class DomainSourceType(Enum):
 class FilterType(Enum):
     PRICE = "FILTER BY PRICE"
     TIME = "FILTER BY TIME"
+
+
+class FetchEngine(Enum):
+    BROWSER = "browser"
+    API = "api"
+
+
+class ExportFormat(Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class ColumnarFormat(Enum):
+    PARQUET = "parquet"
+    ARROW = "arrow"
+
+
+class DomainSortField(Enum):
+    ID = "id"
+    PRICE = "price"
+    BIDS = "bids"
+    AUCTION_ENDED_AT = "auction_ended_at"
+    COLLECTED_AT = "collected_at"
+
+
+class MoverField(Enum):
+    PRICE = "price"
+    BIDS = "bids"
+
+
+class SortOrder(Enum):
+    ASC = "asc"
+    DESC = "desc"
+
+
+class JobState(Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    FINISHED = "finished"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
@@ -0,0 +1,7 @@
+__all__ = [
+    "PageFetchError",
+    "ProfilerBusyError",
+]
+
+from .diagnostics_exceptions import ProfilerBusyError
+from .fetch_exceptions import PageFetchError
@@ -0,0 +1,3 @@
+class ProfilerBusyError(Exception):
+    def __init__(self) -> None:
+        super().__init__("a profiling session is already running")
@@ -0,0 +1,9 @@
+class PageFetchError(Exception):
+    def __init__(
+        self, url: str, status: int | None = None, reason: str = "", timed_out: bool = False
+    ) -> None:
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.timed_out = timed_out
+        super().__init__(f"failed to fetch {url}: status={status} {reason}".strip())
@@ -0,0 +1,5 @@
+__all__ = [
+    "BrowserManager",
+]
+
+from .browser_manager import BrowserManager
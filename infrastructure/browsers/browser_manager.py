@@ -0,0 +1,136 @@
+import asyncio
+import logging
+import time
+from typing import Any
+
+from playwright.async_api import Browser, BrowserContext, Playwright, StorageState, async_playwright
+
+from infrastructure.tools.metrics import ServiceMetrics
+
+
+class BrowserManager:
+    """Keeps one Chromium instance warm for the whole application lifetime.
+
+    Every job gets its own isolated BrowserContext. A browser that crashed or disconnected is
+    relaunched on the next request for a context. Storage state (cookies, local storage) of a
+    warmed-up session can be cached per key so later contexts skip the warm-up navigation.
+    """
+
+    _STATE_TTL_SEC = 30 * 60
+    _LAUNCH_ARGS = [
+        "--disable-blink-features=AutomationControlled",
+        "--disable-dev-shm-usage",
+        "--no-default-browser-check",
+        "--no-first-run",
+        "--disable-default-apps",
+        "--disable-popup-blocking",
+        "--disable-background-networking",
+        "--disable-sync",
+        "--disable-translate",
+        "--disable-web-resource",
+        "--disable-client-side-phishing-detection",
+        "--disable-component-update",
+        "--disable-hang-monitor",
+        "--disable-prompt-on-repost",
+        "--disable-domain-reliability",
+        "--disable-breakpad",
+        "--disable-backgrounding-occluded-windows",
+        "--disable-renderer-backgrounding",
+        "--disable-ipc-flooding-protection",
+        "--disable-background-timer-throttling",
+        "--disable-features=IsolateOrigins,site-per-process",
+        "--disable-site-isolation-trials",
+        "--enable-automation",
+        "--password-store=basic",
+        "--use-mock-keychain",
+    ]
+
+    def __init__(self, headless: bool, logger: logging.Logger, metrics: ServiceMetrics) -> None:
+        self._headless = headless
+        self._logger = logger
+        self._metrics = metrics
+        self._playwright: Playwright | None = None
+        self._browser: Browser | None = None
+        self._lock = asyncio.Lock()
+        self._states: dict[str, tuple[float, StorageState]] = {}
+        self._restarts = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._browser is not None and self._browser.is_connected()
+
+    @property
+    def restarts(self) -> int:
+        return self._restarts
+
+    async def start(self) -> None:
+        async with self._lock:
+            await self._ensure_browser()
+
+    async def stop(self) -> None:
+        async with self._lock:
+            browser, self._browser = self._browser, None
+            if browser is not None and browser.is_connected():
+                await browser.close()
+            await self._stop_playwright()
+
+    async def new_context(self, options: dict[str, Any], state_key: str | None = None) -> BrowserContext:
+        async with self._lock:
+            browser = await self._ensure_browser()
+        state = self.get_state(state_key) if state_key else None
+        if state is not None:
+            return await browser.new_context(storage_state=state, **options)
+        return await browser.new_context(**options)
+
+    def get_state(self, state_key: str) -> StorageState | None:
+        cached = self._states.get(state_key)
+        if cached is None:
+            return None
+        saved_at, state = cached
+        if time.monotonic() - saved_at > BrowserManager._STATE_TTL_SEC:
+            del self._states[state_key]
+            return None
+        return state
+
+    async def save_state(self, state_key: str, context: BrowserContext) -> None:
+        self._states[state_key] = (time.monotonic(), await context.storage_state())
+
+    def drop_state(self, state_key: str) -> None:
+        self._states.pop(state_key, None)
+
+    async def _ensure_browser(self) -> Browser:
+        if self._browser is not None and self._browser.is_connected():
+            return self._browser
+        if self._browser is not None:
+            self._restarts += 1
+            self._metrics.browser_restarts.inc()
+            self._states.clear()
+        try:
+            self._browser = await self._launch()
+        except Exception:
+            # the driver itself may be gone, so start a fresh one once before giving up
+            await self._stop_playwright()
+            self._browser = await self._launch()
+        self._browser.on("disconnected", self._on_disconnected)
+        return self._browser
+
+    async def _launch(self) -> Browser:
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        return await self._playwright.chromium.launch(
+            headless=self._headless,
+            args=BrowserManager._LAUNCH_ARGS,
+        )
+
+    async def _stop_playwright(self) -> None:
+        playwright, self._playwright = self._playwright, None
+        if playwright is not None:
+            try:
+                await playwright.stop()
+            except Exception:
+                pass
+
+    def _on_disconnected(self, browser: Browser) -> None:
+        self._logger.warning(
+            "browser disconnected, will relaunch on next context request (headless=%s)", self._headless
+        )
@@ -1,9 +1,11 @@
 __all__ = [
+    "CrawlCheckpoint",
     "DbContext",
     "DomainParserBase",
     "Domain",
+    "DomainSnapshot",
     "DomainSource",
 ]
 
 from .db_context import DbContext
-from .tables import Domain, DomainParserBase, DomainSource
+from .tables import CrawlCheckpoint, Domain, DomainParserBase, DomainSnapshot, DomainSource
@@ -1,15 +1,77 @@
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 
 class DbContext:
-    def __init__(self, url: str) -> None:
-        self._engine = create_async_engine(url=f"sqlite+aiosqlite:///{url}", echo=False)
-        self._session_factory = async_sessionmaker(
-            bind=self._engine,
+    """Single-writer / multi-reader access to a SQLite file.
+
+    Writes share one connection and are serialized by a lock, reads use a separate pool of
+    query-only connections, so API reads proceed from the WAL snapshot while a crawl commits.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        journal_mode: str = "WAL",
+        synchronous: str = "NORMAL",
+        busy_timeout_ms: int = 5000,
+        cache_size_kib: int = 65536,
+        mmap_size: int = 268435456,
+        read_pool_size: int = 4,
+    ) -> None:
+        self._pragmas = [
+            f"PRAGMA journal_mode={journal_mode}",
+            f"PRAGMA synchronous={synchronous}",
+            f"PRAGMA busy_timeout={busy_timeout_ms}",
+            f"PRAGMA cache_size=-{cache_size_kib}",
+            f"PRAGMA mmap_size={mmap_size}",
+        ]
+        self._write_engine = self._create_engine(url, pool_size=1)
+        self._read_engine = self._create_engine(url, pool_size=read_pool_size, query_only=True)
+        self._write_session_factory = self._create_session_factory(self._write_engine)
+        self._read_session_factory = self._create_session_factory(self._read_engine)
+        self._write_lock = asyncio.Lock()
+
+    def session(self) -> AsyncSession:
+        return self._read_session_factory()
+
+    @asynccontextmanager
+    async def writer(self) -> AsyncIterator[AsyncSession]:
+        async with self._write_lock:
+            async with self._write_session_factory() as session:
+                yield session
+
+    async def close(self) -> None:
+        await self._write_engine.dispose()
+        await self._read_engine.dispose()
+
+    def _create_engine(self, url: str, pool_size: int, query_only: bool = False) -> AsyncEngine:
+        engine = create_async_engine(
+            url=f"sqlite+aiosqlite:///{url}",
+            echo=False,
+            pool_size=pool_size,
+            max_overflow=0,
+        )
+        pragmas = self._pragmas + (["PRAGMA query_only=ON"] if query_only else [])
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def _apply_pragmas(dbapi_connection: Any, _: Any) -> None:
+            cursor = dbapi_connection.cursor()
+            for pragma in pragmas:
+                cursor.execute(pragma)
+            cursor.close()
+
+        return engine
+
+    @staticmethod
+    def _create_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+        return async_sessionmaker(
+            bind=engine,
             autoflush=False,
             autocommit=False,
             expire_on_commit=False,
         )
-
-    def session(self) -> AsyncSession:
-        return self._session_factory()
@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -17,6 +17,11 @@ class DomainSource(DomainParserBase):
 
 class Domain(DomainParserBase):
     __tablename__ = "domains"
+    __table_args__ = (
+        Index("ix_domains_auction_ended_at_price", "auction_ended_at", "price"),
+        Index("ix_domains_domain_source_id_collected_at", "domain_source_id", "collected_at"),
+        Index("ix_domains_bids", "bids"),
+    )
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String, unique=True, nullable=False)
     price: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -29,3 +34,39 @@ class Domain(DomainParserBase):
     domain_source_id: Mapped[int] = mapped_column(Integer, ForeignKey("domain_sources.id"), nullable=False)
 
     source = relationship("DomainSource", back_populates="domains")
+
+
+class DomainSnapshot(DomainParserBase):
+    __tablename__ = "domain_snapshots"
+    __table_args__ = (
+        Index("ix_domain_snapshots_domain_id_captured_at", "domain_id", "captured_at"),
+        Index("ix_domain_snapshots_captured_at", "captured_at"),
+    )
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    domain_id: Mapped[int] = mapped_column(Integer, ForeignKey("domains.id"), nullable=False)
+    price: Mapped[int] = mapped_column(Integer, nullable=False)
+    bids: Mapped[int] = mapped_column(Integer, nullable=False)
+    captured_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+
+class CrawlCheckpoint(DomainParserBase):
+    __tablename__ = "crawl_checkpoints"
+    __table_args__ = (
+        Index(
+            "ix_crawl_checkpoints_source_window",
+            "domain_source_id",
+            "window_start",
+            "window_end",
+            unique=True,
+        ),
+        Index("ix_crawl_checkpoints_domain_source_id_window_end", "domain_source_id", "window_end"),
+    )
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    domain_source_id: Mapped[int] = mapped_column(Integer, ForeignKey("domain_sources.id"), nullable=False)
+    window_start: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    window_end: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    total: Mapped[int] = mapped_column(Integer, nullable=False)
+    next_offset: Mapped[int] = mapped_column(Integer, nullable=False)
+    completed: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    high_watermark: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
@@ -0,0 +1,3 @@
+__all__ = ["ArrowDomainExporter"]
+
+from .arrow_domain_exporter import ArrowDomainExporter
@@ -0,0 +1,68 @@
+import asyncio
+import io
+from typing import Any, AsyncIterator
+
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+
+from domain.contracts.exporters import IDomainExporter
+from domain.enums import ColumnarFormat
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file object whose written bytes are drained after every record batch."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._parts: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self._parts.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data, self._parts = b"".join(self._parts), []
+        return data
+
+
+class ArrowDomainExporter(IDomainExporter):
+    """Encodes column chunks as Parquet row groups or an Arrow IPC stream, one record batch per chunk."""
+
+    SCHEMA = pa.schema(
+        [
+            pa.field("id", pa.int64(), nullable=False),
+            pa.field("name", pa.string(), nullable=False),
+            pa.field("price", pa.int64(), nullable=False),
+            pa.field("bids", pa.int64(), nullable=False),
+            pa.field("collected_at", pa.timestamp("us", tz="UTC"), nullable=False),
+            pa.field("domain_created_at", pa.timestamp("us", tz="UTC")),
+            pa.field("auction_ended_at", pa.timestamp("us", tz="UTC"), nullable=False),
+            pa.field("source", pa.dictionary(pa.int32(), pa.string()), nullable=False),
+        ]
+    )
+
+    async def export(
+        self, chunks: AsyncIterator[dict[str, list[Any]]], fmt: ColumnarFormat
+    ) -> AsyncIterator[bytes]:
+        sink = _ChunkSink()
+        writer = self._open_writer(sink, fmt)
+        try:
+            async for columns in chunks:
+                batch = pa.RecordBatch.from_pydict(columns, schema=ArrowDomainExporter.SCHEMA)
+                await asyncio.to_thread(writer.write_batch, batch)
+                yield sink.drain()
+        finally:
+            writer.close()
+        yield sink.drain()
+
+    @staticmethod
+    def _open_writer(sink: _ChunkSink, fmt: ColumnarFormat) -> Any:
+        match fmt:
+            case ColumnarFormat.ARROW:
+                return ipc.new_stream(sink, ArrowDomainExporter.SCHEMA)
+            case _:
+                return pq.ParquetWriter(sink, ArrowDomainExporter.SCHEMA, compression="zstd")
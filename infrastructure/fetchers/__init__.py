@@ -0,0 +1,7 @@
+__all__ = [
+    "ApiPageFetcher",
+    "BrowserPageFetcher",
+]
+
+from .api_page_fetcher import ApiPageFetcher
+from .browser_page_fetcher import BrowserPageFetcher
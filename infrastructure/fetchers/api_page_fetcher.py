@@ -0,0 +1,46 @@
+from typing import Any
+
+from playwright.async_api import BrowserContext
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from domain.contracts.fetchers import IPageFetcher
+from domain.exceptions import PageFetchError
+
+
+class ApiPageFetcher(IPageFetcher):
+    """Calls the JSON endpoint through the context's APIRequestContext.
+
+    The request context shares the cookie jar, user agent and locale of the warmed-up
+    browser context, so no page, DOM or human-like pause is needed per request.
+    """
+
+    _TIMEOUT_MS = 30_000
+
+    def __init__(self, context: BrowserContext, referer: str) -> None:
+        self._context = context
+        self._headers = {
+            "accept": "application/json",
+            "referer": referer,
+        }
+
+    async def fetch(self, url: str) -> dict[str, Any]:
+        try:
+            response = await self._context.request.get(
+                url, headers=self._headers, timeout=ApiPageFetcher._TIMEOUT_MS
+            )
+        except PlaywrightTimeoutError as e:
+            raise PageFetchError(url=url, reason=str(e), timed_out=True) from e
+        except Exception as e:
+            raise PageFetchError(url=url, reason=str(e)) from e
+        try:
+            if not response.ok:
+                raise PageFetchError(url=url, status=response.status, reason=response.status_text)
+            try:
+                return dict(await response.json())
+            except Exception as e:
+                raise PageFetchError(url=url, status=response.status, reason=str(e)) from e
+        finally:
+            await response.dispose()
+
+    async def close(self) -> None:
+        pass
@@ -0,0 +1,50 @@
+import asyncio
+import json
+import random
+from typing import Any
+
+from playwright.async_api import BrowserContext, Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from domain.contracts.fetchers import IPageFetcher
+from domain.entities import PagePoolStatsDto
+from domain.exceptions import PageFetchError
+from infrastructure.tools.pools import PagePool
+
+
+class BrowserPageFetcher(IPageFetcher):
+    _CONTENT_SELECTOR = "body pre"
+
+    def __init__(self, context: BrowserContext, pool_size: int) -> None:
+        self._pool = PagePool(context=context, size=pool_size)
+
+    @property
+    def pool_stats(self) -> PagePoolStatsDto:
+        return self._pool.stats
+
+    async def fetch(self, url: str) -> dict[str, Any]:
+        async with self._pool.lease() as page:
+            try:
+                response = await page.goto(url)
+                if response is not None and not response.ok:
+                    self._pool.mark_broken(page)
+                    raise PageFetchError(url=url, status=response.status, reason=response.status_text)
+                await page.wait_for_selector(selector=BrowserPageFetcher._CONTENT_SELECTOR)
+                await BrowserPageFetcher.interact_human_like(page)
+                return dict(json.loads(await page.inner_text(selector=BrowserPageFetcher._CONTENT_SELECTOR)))
+            except PageFetchError:
+                raise
+            except PlaywrightTimeoutError as e:
+                raise PageFetchError(url=url, reason=str(e), timed_out=True) from e
+            except Exception as e:
+                raise PageFetchError(url=url, reason=str(e)) from e
+
+    async def close(self) -> None:
+        await self._pool.close()
+
+    @staticmethod
+    async def interact_human_like(page: Page) -> None:
+        await page.mouse.move(random.randint(100, 500), random.randint(100, 300), steps=random.randint(5, 20))
+        scroll_amount = random.randint(200, 800)
+        await page.evaluate(f"window.scrollBy(0, {scroll_amount})")
+        await asyncio.sleep(random.uniform(0.2, 1.0))
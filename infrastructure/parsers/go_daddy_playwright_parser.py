@@ -1,25 +1,31 @@
 import asyncio
-import json
-import random
+import time
 from asyncio import Queue as AsyncQueue
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
-from typing import Any
-
-from playwright.async_api import (
-    Browser,
-    BrowserContext,
-    Page,
-    Playwright,
-    async_playwright,
-)
-
-from domain.contracts.parsers import IParser
-from domain.entities.domains import AddDomainDto
-from domain.enums import DomainSourceType, FilterType
+from typing import Any, AsyncIterator
+
+from playwright.async_api import BrowserContext
+
+from domain.contracts.fetchers import IPageFetcher
+from domain.contracts.parsers import IRangeParser
+from domain.contracts.repositories import ICrawlCheckpointRepository
+from domain.entities import AddDomainRow, CrawlCheckpointDto, ParserStatsDto
+from domain.enums import DomainSourceType, FetchEngine, FilterType
+from domain.exceptions import PageFetchError
+from infrastructure.browsers import BrowserManager
+from infrastructure.fetchers import ApiPageFetcher, BrowserPageFetcher
+from infrastructure.tools.blockers import ResourceBlocker
+from infrastructure.tools.indexes import NameIndex
 from infrastructure.tools.iterators import GoDaddyIterator
+from infrastructure.tools.limiters import AimdLimiter, HostRateLimiter
+from infrastructure.tools.metrics import ServiceMetrics
+from infrastructure.tools.planners import TimeWindow, TimeWindowPlanner
+from infrastructure.tools.retries import RetryLedger
+from infrastructure.tools.validators import DomainRowValidator
 
 
-class GoDaddyPlaywrightParser(IParser):
+class GoDaddyPlaywrightParser(IRangeParser):
     _SOURCE_NAME = DomainSourceType.AUCTIONS_GO_DADDY.value
     _INIT_URL = "https://auctions.godaddy.com/beta/"
     _WIDTH = 1368
@@ -28,208 +34,383 @@ class GoDaddyPlaywrightParser(IParser):
         "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
         "(KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36Browser"
     )
+    _WINDOWS_IN_FLIGHT = 3
+    _WINDOW_TARGET_PAGES = 10
+    _WINDOW_INITIAL_SPAN = timedelta(hours=3)
+    _WINDOW_MIN_SPAN = timedelta(minutes=5)
+    _WINDOW_MAX_SPAN = timedelta(days=2)
+    WINDOW_HORIZON = timedelta(days=30)
+    _THROTTLE_STATUSES = (403, 429)
+    _CHECKPOINT_EVERY_PAGES = 5
+    _VALIDATE_IN_THREAD_FROM = 500
 
     def __init__(
         self,
         collect_size: int,
         pagination_size: int,
-        task_pool_max: int,
+        limiter: AimdLimiter,
+        host_limiter: HostRateLimiter,
+        retries: RetryLedger,
+        blocker: ResourceBlocker,
         filter_type: FilterType,
+        fetch_engine: FetchEngine,
         queue: AsyncQueue,
+        browser_manager: BrowserManager,
+        checkpoints: ICrawlCheckpointRepository,
+        metrics: ServiceMetrics,
     ) -> None:
         self._collect_size = collect_size
         self._pagination_size = pagination_size
-        self._task_pool_max = task_pool_max
+        self._limiter = limiter
+        self._host_limiter = host_limiter
+        self._retries = retries
+        self._blocker = blocker
         self._filter_type = filter_type
+        self._fetch_engine = fetch_engine
         self._queue = queue
-        self._playwright: Playwright | None = None
+        self._browser_manager = browser_manager
+        self._checkpoints = checkpoints
+        self._metrics = metrics
+        self._known_windows: dict[TimeWindow, CrawlCheckpointDto] = {}
+        self._fetcher: IPageFetcher | None = None
         self._collected = 0
-        self._names: list[str] = []
+        self._pages_fetched = 0
+        self._pages_failed = 0
+        self._windows_skipped = 0
+        self._windows_resumed = 0
+        self._names = NameIndex()
 
     @property
     def source_name(self) -> str:
         return GoDaddyPlaywrightParser._SOURCE_NAME
 
+    @property
+    def stats(self) -> ParserStatsDto:
+        return ParserStatsDto(
+            pages_fetched=self._pages_fetched,
+            pages_failed=self._pages_failed,
+            domains_collected=self._collected,
+            windows_skipped=self._windows_skipped,
+            windows_resumed=self._windows_resumed,
+            page_pool=self._fetcher.pool_stats if isinstance(self._fetcher, BrowserPageFetcher) else None,
+            concurrency=self._limiter.stats,
+            retries=self._retries.stats,
+            blocking=self._blocker.stats,
+        )
+
     async def run(self) -> None:
-        async with async_playwright() as self._playwright:
-            await self._proceed_with_browser()
+        async with self.open_fetcher() as fetcher:
+            await self.crawl(fetcher=fetcher)
 
-    async def _proceed_with_browser(self) -> None:
-        if not self._playwright:
-            return
+    @asynccontextmanager
+    async def open_fetcher(self) -> AsyncIterator[IPageFetcher]:
+        """Opens a warmed-up browser context and yields the configured fetcher over it."""
+        context = await self._browser_manager.new_context(
+            options=GoDaddyPlaywrightParser._context_options(),
+            state_key=self.source_name,
+        )
+        try:
+            await self._blocker.attach(context)
+            if self._browser_manager.get_state(self.source_name) is None:
+                await self._warm_up(context=context)
+                await self._browser_manager.save_state(self.source_name, context)
 
-        browser = await GoDaddyPlaywrightParser._create_browser(p=self._playwright)
-        context = await GoDaddyPlaywrightParser._create_context(browser=browser)
-        page = await context.new_page()
-        await page.goto(GoDaddyPlaywrightParser._INIT_URL)
-        await page.wait_for_selector(selector="table tbody tr")
-        await GoDaddyPlaywrightParser._interact_human_like(page)
+            fetcher = self._create_fetcher(context=context)
+            try:
+                yield fetcher
+            finally:
+                await fetcher.close()
+        finally:
+            await context.close()
 
+    async def crawl(self, fetcher: IPageFetcher) -> None:
+        """Runs the configured filter against an already prepared fetcher."""
         match self._filter_type:
             case FilterType.TIME:
-                await self._use_time_filter(context=context)
+                now = datetime.now(tz=timezone.utc)
+                await self._checkpoints.prune(self.source_name, before=now)
+                await self.load_checkpoints(since=now)
+                await self.crawl_range(
+                    fetcher=fetcher, start=now, end=now + GoDaddyPlaywrightParser.WINDOW_HORIZON
+                )
 
-        await context.close()
-        await browser.close()
+    async def load_checkpoints(self, since: datetime) -> None:
+        self._known_windows = {
+            TimeWindow(start=checkpoint.window_start, end=checkpoint.window_end): checkpoint
+            for checkpoint in await self._checkpoints.get_active(self.source_name, since=since)
+        }
 
-    async def _use_time_filter(self, context: BrowserContext) -> None:
-        semaphore = asyncio.Semaphore(value=self._task_pool_max)
-        shift_time = datetime.now(tz=timezone.utc)
-        while self._collected < self._collect_size:
-            try:
-                init_time = shift_time
-                shift_time = GoDaddyPlaywrightParser._time_shift(init_time, hours=3)
-                iterator = GoDaddyIterator(size=self._pagination_size)
-                iterator.time_after = GoDaddyPlaywrightParser._time_repr(init_time)
-                iterator.set_filter(
-                    this_filter=f"endTimeBefore={GoDaddyPlaywrightParser._time_repr(shift_time)}"
-                )
-                tasks: list[asyncio.Task] = []
-                content = await GoDaddyPlaywrightParser._extract_page_content(
-                    context=context,
-                    url=iterator.url,
-                )
-                total_items = GoDaddyPlaywrightParser._get_total_tems(
-                    pagination=content.get("pagination", {})
-                )
-                if total_items == 0:
-                    continue
+    async def crawl_range(self, fetcher: IPageFetcher, start: datetime, end: datetime) -> None:
+        """Crawls the auctions ending in ``[start, end)``, replaying the known windows that overlap it."""
+        self._fetcher = fetcher
+        await self._use_time_filter(fetcher=fetcher, start=start, end=end)
 
-                items: list[dict] = content.get("results", [])
-                domains = GoDaddyPlaywrightParser._parse_result_dict(items)
-                if len(domains) == 0:
-                    continue
-                await self._handle_items(domains)
-                to_collect = self._collect_size - self._collected
-                iterator.items_max = to_collect if to_collect < total_items else total_items
-                for step in iterator:
-                    tasks.append(
+    @staticmethod
+    async def _warm_up(context: BrowserContext) -> None:
+        page = await context.new_page()
+        try:
+            await page.goto(GoDaddyPlaywrightParser._INIT_URL)
+            await page.wait_for_selector(selector="table tbody tr")
+            await BrowserPageFetcher.interact_human_like(page)
+        finally:
+            await page.close()
+
+    def _create_fetcher(self, context: BrowserContext) -> IPageFetcher:
+        match self._fetch_engine:
+            case FetchEngine.API:
+                return ApiPageFetcher(context=context, referer=GoDaddyPlaywrightParser._INIT_URL)
+            case _:
+                return BrowserPageFetcher(context=context, pool_size=self._limiter.max_limit)
+
+    async def _use_time_filter(self, fetcher: IPageFetcher, start: datetime, end: datetime) -> None:
+        planner = TimeWindowPlanner(
+            start=start,
+            page_size=self._pagination_size,
+            target_pages=GoDaddyPlaywrightParser._WINDOW_TARGET_PAGES,
+            initial_span=GoDaddyPlaywrightParser._WINDOW_INITIAL_SPAN,
+            min_span=GoDaddyPlaywrightParser._WINDOW_MIN_SPAN,
+            max_span=GoDaddyPlaywrightParser._WINDOW_MAX_SPAN,
+            horizon=end - start,
+            known=[window for window in self._known_windows if window.start < end and window.end > start],
+        )
+        pending: list[TimeWindow] = []
+        in_flight: set[asyncio.Task] = set()
+        try:
+            while self._collected < self._collect_size:
+                while len(in_flight) < GoDaddyPlaywrightParser._WINDOWS_IN_FLIGHT:
+                    window = pending.pop(0) if pending else planner.next_window()
+                    if window is None:
+                        break
+                    in_flight.add(
                         asyncio.create_task(
-                            coro=self._extract_with_provided_url(
-                                context=context,
-                                url=step,
-                                semaphore=semaphore,
-                            )
+                            coro=self._crawl_window(fetcher=fetcher, planner=planner, window=window),
+                            name=f"window:{window.start:%Y-%m-%dT%H:%M}..{window.end:%Y-%m-%dT%H:%M}",
                         )
                     )
-                await asyncio.gather(*tasks)
-            except Exception:
-                return
+                if len(in_flight) == 0:
+                    break
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        self._metrics.windows_failed.inc(source=self.source_name)
+                        continue
+                    pending.extend(task.result())
+        finally:
+            [t.cancel() for t in in_flight]
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+    async def _crawl_window(
+        self,
+        fetcher: IPageFetcher,
+        planner: TimeWindowPlanner,
+        window: TimeWindow,
+    ) -> list[TimeWindow]:
+        iterator = GoDaddyIterator(size=self._pagination_size)
+        iterator.time_after = GoDaddyPlaywrightParser._time_repr(window.start)
+        iterator.set_filter(this_filter=f"endTimeBefore={GoDaddyPlaywrightParser._time_repr(window.end)}")
+        content = await self._extract_page_content(fetcher=fetcher, url=iterator.url)
+        if len(content) == 0:
+            return []
+        total_items = GoDaddyPlaywrightParser._get_total_tems(pagination=content.get("pagination", {}))
+        sub_windows = planner.observe(window, total_items)
+        if total_items == 0:
+            await self._checkpoint(window, total=0, next_offset=0, high_watermark=None)
+            return []
+
+        items: list[dict] = content.get("results", [])
+        domains = await self._parse_result_dict(items)
+        await self._handle_items(domains)
+        if len(sub_windows) > 0 or len(domains) == 0:
+            return sub_windows
+
+        next_offset = min(self._pagination_size, total_items)
+        high_watermark = GoDaddyPlaywrightParser._latest_end(domains, None)
+        known = self._known_windows.get(window)
+        if known is not None and known.total == total_items:
+            if known.completed and not GoDaddyPlaywrightParser._is_later(
+                high_watermark, known.high_watermark
+            ):
+                self._windows_skipped += 1
+                return []
+            if not known.completed and known.next_offset > next_offset:
+                self._windows_resumed += 1
+                next_offset = known.next_offset
+                high_watermark = GoDaddyPlaywrightParser._later_of(high_watermark, known.high_watermark)
+
+        to_collect = self._collect_size - self._collected
+        items_max = min(total_items, next_offset + max(0, to_collect))
+        iterator.items_max = items_max
+        iterator.seek(next_offset)
+        tasks = [
+            asyncio.create_task(
+                coro=self._crawl_page(fetcher=fetcher, url=url, offset=offset),
+                name=f"page:{window.start:%Y-%m-%dT%H:%M}+{offset}",
+            )
+            for offset, url in zip(range(next_offset, items_max, self._pagination_size), iterator)
+        ]
+        done_offsets: set[int] = set()
+        saved_offset = next_offset
+        try:
+            for task in asyncio.as_completed(tasks):
+                offset, page_end = await task
+                if offset is None:
+                    continue
+                done_offsets.add(offset)
+                high_watermark = GoDaddyPlaywrightParser._later_of(high_watermark, page_end)
+                while next_offset in done_offsets:
+                    next_offset = min(next_offset + self._pagination_size, items_max)
+                if (
+                    next_offset - saved_offset
+                    >= self._pagination_size * GoDaddyPlaywrightParser._CHECKPOINT_EVERY_PAGES
+                ):
+                    saved_offset = next_offset
+                    await self._checkpoint(
+                        window, total=total_items, next_offset=next_offset, high_watermark=high_watermark
+                    )
+        finally:
+            [t.cancel() for t in tasks if not t.done()]
+            await asyncio.gather(*tasks, return_exceptions=True)
+        await self._checkpoint(
+            window, total=total_items, next_offset=next_offset, high_watermark=high_watermark
+        )
+        return []
+
+    async def _crawl_page(
+        self, fetcher: IPageFetcher, url: str, offset: int
+    ) -> tuple[int | None, datetime | None]:
+        content = await self._extract_page_content(fetcher=fetcher, url=url)
+        if len(content) == 0:
+            return None, None
+        items: list[dict] = content.get("results", [])
+        domains = await self._parse_result_dict(items)
+        await self._handle_items(domains)
+        return offset, GoDaddyPlaywrightParser._latest_end(domains, None)
 
-    async def _extract_with_provided_url(
-        self, context: BrowserContext, url: str, semaphore: asyncio.Semaphore
+    async def _checkpoint(
+        self,
+        window: TimeWindow,
+        total: int,
+        next_offset: int,
+        high_watermark: datetime | None,
     ) -> None:
-        async with semaphore:
-            content = await GoDaddyPlaywrightParser._extract_page_content(context=context, url=url)
-            if len(content) == 0:
-                return
-            items: list[dict] = content.get("results", [])
-            domains = GoDaddyPlaywrightParser._parse_result_dict(items)
-            await self._handle_items(domains)
-
-    async def _handle_items(self, domains: list[AddDomainDto]) -> None:
-        domains_to_add: list[AddDomainDto] = []
-        for domain in domains:
-            if domain.name not in self._names:
-                self._names.append(domain.name)
-                domains_to_add.append(domain)
+        """Queues the window's progress behind its rows, so it is only persisted once they are written."""
+        await self._queue.put(
+            CrawlCheckpointDto(
+                window_start=window.start,
+                window_end=window.end,
+                total=total,
+                next_offset=next_offset,
+                completed=next_offset >= total,
+                high_watermark=high_watermark,
+            )
+        )
+
+    async def _handle_items(self, domains: list[AddDomainRow]) -> None:
+        domains_to_add = self._names.select_new(domains, key=lambda d: d["name"])
         this_length = len(domains_to_add)
+        if this_length < len(domains):
+            self._metrics.rows_deduplicated.inc(len(domains) - this_length, source=self.source_name)
         if this_length > 0:
             self._collected += this_length
             await self._queue.put(domains_to_add)
 
-    @staticmethod
-    async def _extract_page_content(context: BrowserContext, url: str) -> dict[str, Any]:
-        result = {}
-        page = await context.new_page()
-        try:
-            print(f"load url: {url}")
-            await page.goto(url)
-            await page.wait_for_selector(selector="body pre")
-            await GoDaddyPlaywrightParser._interact_human_like(page)
-            result = json.loads(await page.inner_text(selector="body pre"))
-        except Exception as e:
-            print(e)
-        await page.close()
+    async def _extract_page_content(self, fetcher: IPageFetcher, url: str) -> dict[str, Any]:
+        while True:
+            try:
+                result = await self._fetch_page(fetcher=fetcher, url=url)
+            except PageFetchError as e:
+                delay = self._retries.on_failure(url, e)
+                if delay is None:
+                    return {}
+                await asyncio.sleep(delay)
+                continue
+            self._retries.on_success(url)
+            return result
+
+    async def _fetch_page(self, fetcher: IPageFetcher, url: str) -> dict[str, Any]:
+        async with self._limiter:
+            await self._host_limiter.acquire(url)
+            start_time = time.perf_counter()
+            try:
+                result = await fetcher.fetch(url)
+            except PageFetchError as e:
+                self._pages_failed += 1
+                self._metrics.pages_failed.inc(
+                    source=self.source_name, reason=GoDaddyPlaywrightParser._reason(e)
+                )
+                self._signal_failure(e)
+                raise
+            latency = time.perf_counter() - start_time
+        total_items = GoDaddyPlaywrightParser._get_total_tems(pagination=result.get("pagination", {}))
+        if total_items > 0 and len(result.get("results", [])) == 0:
+            self._pages_failed += 1
+            self._metrics.pages_failed.inc(source=self.source_name, reason="empty_results")
+            self._backoff("empty_results")
+            raise PageFetchError(url=url, reason="empty results")
+        self._pages_fetched += 1
+        self._metrics.pages_fetched.inc(source=self.source_name)
+        self._metrics.page_fetch_seconds.observe(latency, source=self.source_name)
+        self._limiter.on_success(latency)
         return result
 
-    @staticmethod
-    def _parse_result_dict(items: list[dict[str, Any]]) -> list[AddDomainDto]:
+    def _signal_failure(self, error: PageFetchError) -> None:
+        if error.timed_out:
+            self._backoff("timeout")
+        elif error.status in GoDaddyPlaywrightParser._THROTTLE_STATUSES:
+            self._backoff(f"status_{error.status}")
+
+    def _backoff(self, reason: str) -> None:
+        self._metrics.concurrency_backoffs.inc(source=self.source_name, reason=reason)
+        self._limiter.on_backoff(reason)
+
+    async def _parse_result_dict(self, items: list[dict[str, Any]]) -> list[AddDomainRow]:
         if len(items) == 0:
             return []
-        domains: list[AddDomainDto] = []
-        for item in items:
-            try:
-                domains.append(AddDomainDto(**item))
-            except Exception as e:  # noqa
-                continue
+        if len(items) < GoDaddyPlaywrightParser._VALIDATE_IN_THREAD_FROM:
+            rows = DomainRowValidator.validate(items)
+        else:
+            rows = await asyncio.to_thread(DomainRowValidator.validate, items)
+        self._metrics.domains_parsed.inc(len(rows), source=self.source_name)
+        if len(rows) < len(items):
+            self._metrics.validation_rejects.inc(len(items) - len(rows), source=self.source_name)
+        return rows
 
-        return domains
+    @staticmethod
+    def _reason(error: PageFetchError) -> str:
+        if error.timed_out:
+            return "timeout"
+        return f"status_{error.status}" if error.status is not None else "error"
 
     @staticmethod
-    def _get_total_tems(pagination: dict[str, Any]) -> int:
-        if len(pagination) == 0:
-            return 0
-        return int(pagination.get("total", 0))
+    def _latest_end(domains: list[AddDomainRow], default: datetime | None) -> datetime | None:
+        return max((domain["auction_ended_at"] for domain in domains), default=default)
 
     @staticmethod
-    async def _create_browser(p: Playwright) -> Browser:
-        return await p.chromium.launch(
-            headless=False,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--disable-dev-shm-usage",
-                "--no-default-browser-check",
-                "--no-first-run",
-                "--disable-default-apps",
-                "--disable-popup-blocking",
-                "--disable-background-networking",
-                "--disable-sync",
-                "--disable-translate",
-                "--disable-web-resource",
-                "--disable-client-side-phishing-detection",
-                "--disable-component-update",
-                "--disable-default-apps",
-                "--disable-dev-shm-usage",
-                "--disable-hang-monitor",
-                "--disable-prompt-on-repost",
-                "--disable-domain-reliability",
-                "--disable-breakpad",
-                "--disable-backgrounding-occluded-windows",
-                "--disable-renderer-backgrounding",
-                "--disable-ipc-flooding-protection",
-                "--disable-background-timer-throttling",
-                "--disable-backgrounding-occluded-windows",
-                "--disable-renderer-backgrounding",
-                "--disable-features=IsolateOrigins,site-per-process",
-                "--disable-site-isolation-trials",
-                "--enable-automation",
-                "--password-store=basic",
-                "--use-mock-keychain",
-            ],
-        )
+    def _is_later(value: datetime | None, than: datetime | None) -> bool:
+        if value is None:
+            return False
+        return than is None or value > than
 
     @staticmethod
-    async def _create_context(browser: Browser) -> BrowserContext:
-        return await browser.new_context(
-            viewport={"width": GoDaddyPlaywrightParser._WIDTH, "height": GoDaddyPlaywrightParser._HEIGHT},
-            user_agent=GoDaddyPlaywrightParser._USER_AGENT,
-            locale="en-US",
-            java_script_enabled=True,
-            bypass_csp=True,
-        )
+    def _later_of(first: datetime | None, second: datetime | None) -> datetime | None:
+        return first if GoDaddyPlaywrightParser._is_later(first, second) or second is None else second
 
     @staticmethod
-    async def _interact_human_like(page: Page) -> None:
-        await page.mouse.move(random.randint(100, 500), random.randint(100, 300), steps=random.randint(5, 20))
-        scroll_amount = random.randint(200, 800)
-        await page.evaluate(f"window.scrollBy(0, {scroll_amount})")
-        await asyncio.sleep(random.uniform(0.2, 1.0))
+    def _get_total_tems(pagination: dict[str, Any]) -> int:
+        if len(pagination) == 0:
+            return 0
+        return int(pagination.get("total", 0))
 
     @staticmethod
-    def _time_repr(date: datetime) -> str:
-        return date.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+    def _context_options() -> dict[str, Any]:
+        return {
+            "viewport": {"width": GoDaddyPlaywrightParser._WIDTH, "height": GoDaddyPlaywrightParser._HEIGHT},
+            "user_agent": GoDaddyPlaywrightParser._USER_AGENT,
+            "locale": "en-US",
+            "java_script_enabled": True,
+            "bypass_csp": True,
+        }
 
     @staticmethod
-    def _time_shift(date: datetime, hours: int) -> datetime:
-        return date + timedelta(hours=hours)
+    def _time_repr(date: datetime) -> str:
+        return date.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
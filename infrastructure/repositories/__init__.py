@@ -1,7 +1,11 @@
 __all__ = [
+    "CrawlCheckpointRepository",
     "DomainRepository",
+    "DomainSnapshotRepository",
     "DomainSourceRepository",
 ]
 
+from .crawl_checkpoint_repository import CrawlCheckpointRepository
 from .domain_repository import DomainRepository
+from .domain_snapshot_repository import DomainSnapshotRepository
 from .domain_source_repository import DomainSourceRepository
@@ -0,0 +1,70 @@
+from datetime import datetime, timezone
+
+import sqlalchemy.exc
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.sqlite import insert
+
+from domain.contracts.repositories import ICrawlCheckpointRepository
+from domain.entities import CrawlCheckpointDto
+from infrastructure.database import CrawlCheckpoint, DbContext, DomainSource
+from infrastructure.tools.mappers import CrawlCheckpointMapper
+
+
+class CrawlCheckpointRepository(ICrawlCheckpointRepository):
+    def __init__(self, context: DbContext) -> None:
+        self._context = context
+
+    async def get_active(self, source_name: str, since: datetime) -> list[CrawlCheckpointDto]:
+        statement = (
+            select(CrawlCheckpoint)
+            .join(DomainSource, DomainSource.id == CrawlCheckpoint.domain_source_id)
+            .where(DomainSource.name == source_name, CrawlCheckpoint.window_end > since)
+            .order_by(CrawlCheckpoint.window_start)
+        )
+        try:
+            async with self._context.session() as session:
+                res = await session.execute(statement=statement)
+                return CrawlCheckpointMapper.to_dto_list(list(res.scalars().all()))
+        except (OSError, sqlalchemy.exc.InterfaceError):
+            return []
+
+    async def save(self, source_id: int, checkpoint: CrawlCheckpointDto) -> None:
+        try:
+            async with self._context.writer() as session:
+                row = CrawlCheckpointMapper.to_row(
+                    checkpoint, source_id, updated_at=datetime.now(tz=timezone.utc)
+                )
+                statement = insert(CrawlCheckpoint).values(row)
+                statement = statement.on_conflict_do_update(
+                    index_elements=[
+                        CrawlCheckpoint.domain_source_id,
+                        CrawlCheckpoint.window_start,
+                        CrawlCheckpoint.window_end,
+                    ],
+                    set_={
+                        CrawlCheckpoint.total: statement.excluded.total,
+                        CrawlCheckpoint.next_offset: statement.excluded.next_offset,
+                        CrawlCheckpoint.completed: statement.excluded.completed,
+                        CrawlCheckpoint.high_watermark: statement.excluded.high_watermark,
+                        CrawlCheckpoint.updated_at: statement.excluded.updated_at,
+                    },
+                )
+                await session.execute(statement=statement)
+                await session.commit()
+        except (OSError, sqlalchemy.exc.InterfaceError, sqlalchemy.exc.IntegrityError):
+            return
+
+    async def prune(self, source_name: str, before: datetime) -> int:
+        source_ids = select(DomainSource.id).where(DomainSource.name == source_name).scalar_subquery()
+        try:
+            async with self._context.writer() as session:
+                res = await session.execute(
+                    statement=delete(CrawlCheckpoint).where(
+                        CrawlCheckpoint.domain_source_id == source_ids,
+                        CrawlCheckpoint.window_end <= before,
+                    )
+                )
+                await session.commit()
+                return int(res.rowcount)
+        except (OSError, sqlalchemy.exc.InterfaceError, sqlalchemy.exc.IntegrityError):
+            return 0
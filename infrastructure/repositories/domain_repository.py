@@ -1,61 +1,172 @@
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator
+
 import sqlalchemy.exc
-from sqlalchemy import delete, select
+from sqlalchemy import and_, delete, func, select
+from sqlalchemy.dialects.sqlite import insert
 
 from domain.contracts.repositories import IDomainRepository
-from domain.entities import AddDomainDto, GetDomainDto
-from infrastructure.database import DbContext, Domain
-from infrastructure.tools.mappers import DomainMapper
+from domain.entities import (
+    AddDomainDto,
+    AddDomainRow,
+    BulkCreateResultDto,
+    DomainPageDto,
+    DomainQueryDto,
+    GetDomainDto,
+)
+from infrastructure.database import DbContext, Domain, DomainSnapshot, DomainSource
+from infrastructure.tools.mappers import DomainMapper, DomainSnapshotMapper
+from infrastructure.tools.metrics import ServiceMetrics
+from infrastructure.tools.queries import DomainQueryBuilder
 
 
 class DomainRepository(IDomainRepository):
-    def __init__(self, context: DbContext):
+    def __init__(self, context: DbContext, metrics: ServiceMetrics):
         self._context = context
-        self._names: list[str] = []
+        self._metrics = metrics
 
     async def create(self, dto: AddDomainDto, source_id: int) -> GetDomainDto | None:
         try:
             domain = DomainMapper.from_dto(dto, source_id)
-            async with self._context.session() as session:
+            async with self._context.writer() as session:
                 session.add(domain)
+                await session.flush()
+                session.add(
+                    DomainSnapshot(
+                        domain_id=domain.id,
+                        price=domain.price,
+                        bids=domain.bids,
+                        captured_at=datetime.now(tz=timezone.utc),
+                    )
+                )
                 await session.commit()
                 await session.refresh(domain)
                 return DomainMapper.to_dto(domain)
         except (OSError, sqlalchemy.exc.InterfaceError, sqlalchemy.exc.IntegrityError):
             return None
 
-    async def bulk_create(self, dtos: list[AddDomainDto], source_id: int) -> list[GetDomainDto]:
-        if len(self._names) == 0:
-            self._names = [d.name for d in await self.get_all()]
-        dto_to_add: list[AddDomainDto] = []
-        for dto in dtos:
-            if dto.name in self._names:
-                continue
-            dto_to_add.append(dto)
-            self._names.append(dto.name)
-        if len(dto_to_add) == 0:
-            return []
+    async def bulk_create(self, rows: list[AddDomainRow], source_id: int) -> BulkCreateResultDto:
+        values = DomainMapper.to_row_list(rows, source_id, collected_at=datetime.now(tz=timezone.utc))
+        if len(values) == 0:
+            return BulkCreateResultDto()
+        names = [row["name"] for row in values]
+        upsert = insert(Domain)
+        statement = upsert.on_conflict_do_update(
+            index_elements=[Domain.name],
+            set_={
+                Domain.price: upsert.excluded.price,
+                Domain.bids: upsert.excluded.bids,
+            },
+        ).returning(Domain.id, Domain.name)
         try:
-            domains = DomainMapper.from_dto_list(dto_to_add, source_id)
-            async with self._context.session() as session:
-                session.add_all(domains)
-                await session.commit()
-                print(f"total in db: {len(self._names)}")
-                print(f"tried to insert to db: {len(dtos)}")
-                print(f"inserted in db: {len(domains)}")
-                return DomainMapper.to_dto_list(domains)
+            async with self._context.writer() as session:
+                with self._metrics.db_commit_seconds.time():
+                    res = await session.execute(
+                        statement=select(Domain.name, Domain.price, Domain.bids).where(Domain.name.in_(names))
+                    )
+                    known = {row.name: (row.price, row.bids) for row in res.all()}
+                    res = await session.execute(statement, values)
+                    ids = {row.name: row.id for row in res.all()}
+                    snapshots = [
+                        DomainSnapshotMapper.to_row(ids[row["name"]], row)
+                        for row in values
+                        if known.get(row["name"]) != (row["price"], row["bids"])
+                    ]
+                    if len(snapshots) > 0:
+                        await session.execute(insert(DomainSnapshot), snapshots)
+                    await session.commit()
+            self._metrics.rows_inserted.inc(len(values) - len(known))
+            self._metrics.rows_updated.inc(len(known))
+            return BulkCreateResultDto(
+                inserted=len(values) - len(known), updated=len(known), changed=len(snapshots)
+            )
         except (OSError, sqlalchemy.exc.InterfaceError, sqlalchemy.exc.IntegrityError):
-            return []
+            return BulkCreateResultDto(failed=True)
 
     async def get_all(self) -> list[GetDomainDto]:
         try:
             async with self._context.session() as session:
                 res = await session.execute(statement=select(Domain))
                 domains = res.scalars().all()
-                print(f"current size is: {len(domains)}")
                 return DomainMapper.to_dto_list(list(domains))
         except (OSError, sqlalchemy.exc.InterfaceError, sqlalchemy.exc.IntegrityError):
             return []
 
+    async def query(self, query: DomainQueryDto) -> DomainPageDto:
+        statement = DomainQueryBuilder.page(query, limit=query.limit + 1)
+        try:
+            async with self._context.session() as session:
+                res = await session.execute(statement=statement)
+                domains = list(res.scalars().all())
+        except (OSError, sqlalchemy.exc.InterfaceError):
+            return DomainPageDto(items=[])
+        next_cursor = None
+        if len(domains) > query.limit:
+            domains = domains[: query.limit]
+            next_cursor = DomainQueryBuilder.encode_cursor(domains[-1], query.sort_by)
+        return DomainPageDto(items=DomainMapper.to_dto_list(domains), next_cursor=next_cursor)
+
+    async def count(self) -> int:
+        try:
+            async with self._context.session() as session:
+                res = await session.execute(statement=select(func.count()).select_from(Domain))
+                return int(res.scalar_one())
+        except (OSError, sqlalchemy.exc.InterfaceError):
+            return 0
+
+    async def iter_names(self, chunk_size: int) -> AsyncIterator[list[str]]:
+        last_id = 0
+        while True:
+            try:
+                async with self._context.session() as session:
+                    res = await session.execute(
+                        statement=select(Domain.id, Domain.name)
+                        .where(Domain.id > last_id)
+                        .order_by(Domain.id)
+                        .limit(chunk_size)
+                    )
+                    rows = res.all()
+            except (OSError, sqlalchemy.exc.InterfaceError):
+                return
+            if len(rows) == 0:
+                return
+            last_id = rows[-1].id
+            yield [row.name for row in rows]
+
+    async def iter_columns(
+        self, query: DomainQueryDto, chunk_size: int
+    ) -> AsyncIterator[dict[str, list[Any]]]:
+        columns = (
+            Domain.id,
+            Domain.name,
+            Domain.price,
+            Domain.bids,
+            Domain.collected_at,
+            Domain.domain_created_at,
+            Domain.auction_ended_at,
+            DomainSource.name.label("source"),
+        )
+        statement = (
+            select(*columns)
+            .join(DomainSource, DomainSource.id == Domain.domain_source_id)
+            .where(and_(True, *DomainQueryBuilder.filters(query)))
+            .order_by(Domain.id)
+            .limit(chunk_size)
+        )
+        keys = [column.key for column in columns]
+        last_id = 0
+        while True:
+            try:
+                async with self._context.session() as session:
+                    res = await session.execute(statement=statement.where(Domain.id > last_id))
+                    rows = res.all()
+            except (OSError, sqlalchemy.exc.InterfaceError):
+                return
+            if len(rows) == 0:
+                return
+            last_id = rows[-1].id
+            yield dict(zip(keys, (list(values) for values in zip(*rows))))
+
     async def get_by_id(self, domain_id: int) -> GetDomainDto | None:
         try:
             async with self._context.session() as session:
@@ -80,12 +191,15 @@ class DomainRepository(IDomainRepository):
 
     async def remove_by_id(self, domain_id: int) -> GetDomainDto | None:
         try:
-            async with self._context.session() as session:
+            async with self._context.writer() as session:
                 res = await session.execute(statement=select(Domain).filter(Domain.id == domain_id))
                 domain = res.scalars().first()
                 if not domain:
                     return None
                 dto = DomainMapper.to_dto(domain)
+                await session.execute(
+                    statement=delete(DomainSnapshot).where(DomainSnapshot.domain_id == domain_id)
+                )
                 await session.delete(domain)
                 await session.commit()
                 return dto
@@ -94,7 +208,8 @@ class DomainRepository(IDomainRepository):
 
     async def remove_all(self) -> int:
         try:
-            async with self._context.session() as session:
+            async with self._context.writer() as session:
+                await session.execute(statement=delete(DomainSnapshot))
                 res = await session.execute(statement=delete(Domain))
                 count = res.rowcount
                 await session.commit()
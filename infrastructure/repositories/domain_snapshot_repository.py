@@ -0,0 +1,91 @@
+from datetime import datetime
+
+import sqlalchemy.exc
+from sqlalchemy import func, select
+
+from domain.contracts.repositories import IDomainSnapshotRepository
+from domain.entities import DomainMoverDto, DomainSnapshotDto
+from domain.enums import MoverField
+from infrastructure.database import DbContext, Domain, DomainSnapshot
+from infrastructure.tools.mappers import DomainSnapshotMapper
+
+
+class DomainSnapshotRepository(IDomainSnapshotRepository):
+    def __init__(self, context: DbContext) -> None:
+        self._context = context
+
+    async def get_history(self, name: str, limit: int) -> list[DomainSnapshotDto]:
+        statement = (
+            select(DomainSnapshot)
+            .join(Domain, Domain.id == DomainSnapshot.domain_id)
+            .where(Domain.name == name)
+            .order_by(DomainSnapshot.captured_at.desc(), DomainSnapshot.id.desc())
+            .limit(limit)
+        )
+        try:
+            async with self._context.session() as session:
+                res = await session.execute(statement=statement)
+                return DomainSnapshotMapper.to_dto_list(list(res.scalars().all()))
+        except (OSError, sqlalchemy.exc.InterfaceError):
+            return []
+
+    async def get_movers(self, since: datetime, field: MoverField, limit: int) -> list[DomainMoverDto]:
+        """Ranks domains by the net change since `since`, measured against the last value seen before it.
+
+        Each snapshot is diffed against its predecessor with LAG; summing the in-window diffs telescopes to
+        `latest - baseline`, so a single change inside the window still counts against older history.
+        """
+        moved = select(DomainSnapshot.domain_id).where(DomainSnapshot.captured_at >= since).distinct()
+        diffs = (
+            select(
+                DomainSnapshot.domain_id,
+                DomainSnapshot.captured_at,
+                (
+                    DomainSnapshot.price
+                    - func.lag(DomainSnapshot.price).over(
+                        partition_by=DomainSnapshot.domain_id,
+                        order_by=(DomainSnapshot.captured_at, DomainSnapshot.id),
+                    )
+                ).label("price_diff"),
+                (
+                    DomainSnapshot.bids
+                    - func.lag(DomainSnapshot.bids).over(
+                        partition_by=DomainSnapshot.domain_id,
+                        order_by=(DomainSnapshot.captured_at, DomainSnapshot.id),
+                    )
+                ).label("bids_diff"),
+            )
+            .where(DomainSnapshot.domain_id.in_(moved))
+            .subquery()
+        )
+        changes = (
+            select(
+                diffs.c.domain_id,
+                func.sum(diffs.c.price_diff).label("price_change"),
+                func.sum(diffs.c.bids_diff).label("bids_change"),
+            )
+            .where(diffs.c.captured_at >= since, diffs.c.price_diff.is_not(None))
+            .group_by(diffs.c.domain_id)
+            .subquery()
+        )
+        change = changes.c.price_change if field == MoverField.PRICE else changes.c.bids_change
+        statement = (
+            select(
+                Domain.id,
+                Domain.name,
+                Domain.price,
+                Domain.bids,
+                changes.c.price_change,
+                changes.c.bids_change,
+            )
+            .join(changes, changes.c.domain_id == Domain.id)
+            .where(change != 0)
+            .order_by(func.abs(change).desc(), Domain.id)
+            .limit(limit)
+        )
+        try:
+            async with self._context.session() as session:
+                res = await session.execute(statement=statement)
+                return [DomainSnapshotMapper.to_mover_dto(row) for row in res.all()]
+        except (OSError, sqlalchemy.exc.InterfaceError):
+            return []
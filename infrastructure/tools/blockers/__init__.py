@@ -0,0 +1,5 @@
+__all__ = [
+    "ResourceBlocker",
+]
+
+from .resource_blocker import ResourceBlocker
@@ -0,0 +1,72 @@
+import fnmatch
+import re
+
+from playwright.async_api import BrowserContext, Route
+
+from domain.entities import BlockingStatsDto
+
+
+class ResourceBlocker:
+    """Aborts unneeded requests of a browser context by resource type and URL glob.
+
+    URLs matching an allow pattern are always let through. Aborted requests never reach the
+    network, so their size is unknown; bytes saved are estimated from typical sizes per type.
+    """
+
+    _ESTIMATED_BYTES = {
+        "image": 40_000,
+        "media": 250_000,
+        "font": 35_000,
+        "stylesheet": 25_000,
+        "script": 60_000,
+    }
+    _DEFAULT_ESTIMATED_BYTES = 5_000
+
+    def __init__(self, resource_types: list[str], url_patterns: list[str], allow_patterns: list[str]) -> None:
+        self._resource_types = frozenset(resource_types)
+        self._blocked_urls = ResourceBlocker._compile(url_patterns)
+        self._allowed_urls = ResourceBlocker._compile(allow_patterns)
+        self._passed = 0
+        self._blocked = 0
+        self._blocked_by_type: dict[str, int] = {}
+        self._bytes_saved = 0
+
+    @property
+    def stats(self) -> BlockingStatsDto:
+        return BlockingStatsDto(
+            passed=self._passed,
+            blocked=self._blocked,
+            blocked_by_type=dict(self._blocked_by_type),
+            estimated_bytes_saved=self._bytes_saved,
+        )
+
+    async def attach(self, context: BrowserContext) -> None:
+        if len(self._resource_types) == 0 and self._blocked_urls is None:
+            return
+        await context.route("**/*", self._handle)
+
+    async def _handle(self, route: Route) -> None:
+        resource_type = route.request.resource_type
+        if self._should_block(url=route.request.url, resource_type=resource_type):
+            self._blocked += 1
+            self._blocked_by_type[resource_type] = self._blocked_by_type.get(resource_type, 0) + 1
+            self._bytes_saved += ResourceBlocker._ESTIMATED_BYTES.get(
+                resource_type, ResourceBlocker._DEFAULT_ESTIMATED_BYTES
+            )
+            await route.abort()
+            return
+        self._passed += 1
+        await route.continue_()
+
+    def _should_block(self, url: str, resource_type: str) -> bool:
+        if self._allowed_urls is not None and self._allowed_urls.match(url):
+            return False
+        if resource_type in self._resource_types:
+            return True
+        return self._blocked_urls is not None and self._blocked_urls.match(url) is not None
+
+    @staticmethod
+    def _compile(patterns: list[str]) -> re.Pattern[str] | None:
+        if len(patterns) == 0:
+            return None
+        return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns), flags=re.IGNORECASE)
@@ -0,0 +1,9 @@
+__all__ = [
+    "LoopLagMonitor",
+    "StackSampler",
+    "TaskInspector",
+]
+
+from .loop_lag_monitor import LoopLagMonitor
+from .stack_sampler import StackSampler
+from .task_inspector import TaskInspector
@@ -0,0 +1,97 @@
+import asyncio
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+
+from domain.entities import LoopLagStatsDto, SlowCallbackDto
+from infrastructure.tools.diagnostics.stack_sampler import StackSampler
+from infrastructure.tools.metrics import ServiceMetrics
+
+
+class LoopLagMonitor:
+    """Measures event-loop lag continuously and records what blocked the loop when it is slow.
+
+    A heartbeat task sleeps ``interval`` and measures how late it wakes up. A watchdog thread
+    notices a heartbeat that is overdue by more than ``threshold`` and captures the loop
+    thread's stack while it is still stuck, so each slow callback is reported with the code
+    that was running (JSON parsing, validation, SQLite, ...), not just its duration.
+    """
+
+    def __init__(self, interval: float, threshold: float, events_max: int, metrics: ServiceMetrics) -> None:
+        self._interval = interval
+        self._threshold = threshold
+        self._metrics = metrics
+        self._events: deque[SlowCallbackDto] = deque(maxlen=max(1, events_max))
+        self._task: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopped = threading.Event()
+        self._loop_thread = 0
+        self._beat = time.monotonic()
+        self._blocked_stack: list[str] | None = None
+        self._samples = 0
+        self._slow_total = 0
+        self._last_lag = 0.0
+        self._max_lag = 0.0
+
+    @property
+    def stats(self) -> LoopLagStatsDto:
+        return LoopLagStatsDto(
+            running=self._task is not None and not self._task.done(),
+            interval_ms=self._interval * 1000,
+            threshold_ms=self._threshold * 1000,
+            samples=self._samples,
+            slow_total=self._slow_total,
+            last_lag_ms=round(self._last_lag * 1000, 3),
+            max_lag_ms=round(self._max_lag * 1000, 3),
+            slow_callbacks=list(reversed(self._events)),
+        )
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._loop_thread = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stopped.clear()
+        self._task = asyncio.create_task(self._heartbeat(), name="loop-lag-monitor")
+        self._watchdog = threading.Thread(target=self._watch, name="loop-lag-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._watchdog is not None:
+            await asyncio.to_thread(self._watchdog.join)
+            self._watchdog = None
+
+    async def _heartbeat(self) -> None:
+        while True:
+            expected = time.monotonic() + self._interval
+            await asyncio.sleep(self._interval)
+            self._beat = time.monotonic()
+            self._record(max(0.0, self._beat - expected))
+
+    def _record(self, lag: float) -> None:
+        self._samples += 1
+        self._last_lag = lag
+        self._max_lag = max(self._max_lag, lag)
+        self._metrics.loop_lag_seconds.observe(lag)
+        stack, self._blocked_stack = self._blocked_stack, None
+        if lag < self._threshold:
+            return
+        self._slow_total += 1
+        self._events.append(
+            SlowCallbackDto(at=datetime.now(tz=timezone.utc), lag_ms=round(lag * 1000, 3), stack=stack or [])
+        )
+
+    def _watch(self) -> None:
+        while not self._stopped.wait(self._interval):
+            overdue = time.monotonic() - self._beat - self._interval
+            if overdue < self._threshold or self._blocked_stack is not None:
+                continue
+            frame = sys._current_frames().get(self._loop_thread)
+            self._blocked_stack = list(reversed(StackSampler.describe(frame)))
@@ -0,0 +1,57 @@
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+
+from domain.exceptions import ProfilerBusyError
+
+
+class StackSampler:
+    """Wall-clock sampling profiler over the Python stacks of every thread.
+
+    Each sample reads ``sys._current_frames`` from the calling thread, so the profiled code
+    needs no instrumentation. The result is in the collapsed format (``thread;outer;inner count``
+    per line) read by flamegraph.pl, speedscope and inferno. One session runs at a time.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        return self._lock.locked()
+
+    def run(self, seconds: float, interval: float) -> str:
+        """Blocks for ``seconds``, so it is meant to be called through ``asyncio.to_thread``."""
+        if not self._lock.acquire(blocking=False):
+            raise ProfilerBusyError()
+        try:
+            stacks: Counter[str] = Counter()
+            own = threading.get_ident()
+            deadline = time.monotonic() + seconds
+            while time.monotonic() < deadline:
+                names = {thread.ident: thread.name for thread in threading.enumerate()}
+                for ident, frame in sys._current_frames().items():
+                    if ident == own:
+                        continue
+                    frames = StackSampler.describe(frame, with_line=False)
+                    stacks[";".join([names.get(ident, str(ident)), *reversed(frames)])] += 1
+                time.sleep(interval)
+        finally:
+            self._lock.release()
+        return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+
+    @staticmethod
+    def describe(frame: FrameType | None, with_line: bool = True) -> list[str]:
+        """Names the frames from the innermost one outwards."""
+        frames: list[str] = []
+        while frame is not None:
+            frames.append(StackSampler.frame_name(frame, with_line))
+            frame = frame.f_back
+        return frames
+
+    @staticmethod
+    def frame_name(frame: FrameType, with_line: bool = True) -> str:
+        name = f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_qualname}"
+        return f"{name}:{frame.f_lineno}" if with_line else name
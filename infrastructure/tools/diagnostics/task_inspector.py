@@ -0,0 +1,44 @@
+import asyncio
+from typing import Any
+
+from domain.entities import TaskDumpDto
+from infrastructure.tools.diagnostics.stack_sampler import StackSampler
+
+
+class TaskInspector:
+    """Describes the live tasks of the running loop with the full chain of awaits they are suspended in.
+
+    ``Task.get_stack`` only returns the outermost frame of a suspended coroutine, so the chain is
+    followed through ``cr_await``/``gi_yieldfrom`` down to the future the task is waiting on.
+    """
+
+    @staticmethod
+    def dump() -> list[TaskDumpDto]:
+        return [
+            TaskInspector._describe(task)
+            for task in sorted(asyncio.all_tasks(), key=lambda task: task.get_name())
+        ]
+
+    @staticmethod
+    def _describe(task: asyncio.Task) -> TaskDumpDto:
+        coro = task.get_coro()
+        return TaskDumpDto(
+            name=task.get_name(),
+            coroutine=getattr(coro, "__qualname__", repr(coro)),
+            done=task.done(),
+            cancelling=task.cancelling() > 0,
+            stack=TaskInspector._await_chain(coro),
+        )
+
+    @staticmethod
+    def _await_chain(awaitable: Any) -> list[str]:
+        frames: list[str] = []
+        while awaitable is not None:
+            frame = getattr(awaitable, "cr_frame", None) or getattr(awaitable, "gi_frame", None)
+            if frame is None:
+                if isinstance(awaitable, asyncio.Future):
+                    frames.append(f"<awaiting {type(awaitable).__name__}>")
+                break
+            frames.append(StackSampler.frame_name(frame))
+            awaitable = getattr(awaitable, "cr_await", None) or getattr(awaitable, "gi_yieldfrom", None)
+        return frames
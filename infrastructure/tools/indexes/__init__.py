@@ -0,0 +1,5 @@
+__all__ = [
+    "NameIndex",
+]
+
+from .name_index import NameIndex
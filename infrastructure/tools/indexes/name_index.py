@@ -0,0 +1,47 @@
+from collections import deque
+from typing import Callable, Iterable, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+class NameIndex:
+    """Hash-set index of domain names with a bounded footprint.
+
+    Membership tests for a whole batch are a single set difference. Once ``max_size`` names are
+    held the oldest ones are forgotten first, so a forgotten name is only ever reported as new
+    again, never the other way round.
+    """
+
+    def __init__(self, max_size: int = 1_000_000) -> None:
+        self._max_size = max(1, max_size)
+        self._names: set[str] = set()
+        self._order: deque[str] = deque()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add_many(self, names: Iterable[str]) -> None:
+        for name in names:
+            if name not in self._names:
+                self._names.add(name)
+                self._order.append(name)
+        self._shrink()
+
+    def select_new(self, items: Sequence[T], key: Callable[[T], str]) -> list[T]:
+        keys = [key(item) for item in items]
+        unseen = set(keys).difference(self._names)
+        if len(unseen) == 0:
+            return []
+        selected: list[T] = []
+        for item, name in zip(items, keys):
+            if name in unseen:
+                unseen.discard(name)
+                selected.append(item)
+                self._names.add(name)
+                self._order.append(name)
+        self._shrink()
+        return selected
+
+    def _shrink(self) -> None:
+        while len(self._order) > self._max_size:
+            self._names.discard(self._order.popleft())
@@ -50,6 +50,10 @@ class GoDaddyIterator:
     def set_filter(self, this_filter: str) -> None:
         self._filter = this_filter
 
+    def seek(self, offset: int) -> None:
+        """Makes the next iteration step start at ``offset``."""
+        self._start = offset - self._size
+
     def __iter__(self) -> Self:
         return self
 
@@ -0,0 +1,8 @@
+__all__ = [
+    "AimdLimiter",
+    "HostRateLimiter",
+    "TokenBucket",
+]
+
+from .aimd_limiter import AimdLimiter
+from .host_rate_limiter import HostRateLimiter, TokenBucket
@@ -0,0 +1,111 @@
+import asyncio
+import time
+from types import TracebackType
+
+from domain.entities import ConcurrencyStatsDto
+
+
+class AimdLimiter:
+    """Concurrency limit tuned by additive increase / multiplicative decrease.
+
+    Used as ``async with limiter:`` around each request. After a full window of successes (as many
+    as the current limit) the limit grows by one, as long as the latency EWMA stays within
+    ``latency_tolerance`` of the best baseline seen. A backoff signal (timeout, throttling status,
+    empty results) multiplies the limit by ``decrease_factor``; during the cooldown that follows,
+    further signals are only counted and the limit does not grow, so one burst halves it once.
+    """
+
+    _EWMA_ALPHA = 0.2
+    _BASELINE_DRIFT = 0.01
+
+    def __init__(
+        self,
+        initial: int,
+        min_limit: int,
+        max_limit: int,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 1.5,
+    ) -> None:
+        self._min = max(1, min_limit)
+        self._max = max(self._min, max_limit)
+        self._limit = self._clamp(initial)
+        self._decrease_factor = decrease_factor
+        self._latency_tolerance = latency_tolerance
+        self._condition = asyncio.Condition()
+        self._in_flight = 0
+        self._successes = 0
+        self._latency_ewma: float | None = None
+        self._latency_baseline: float | None = None
+        self._last_backoff = float("-inf")
+        self._increases = 0
+        self._decreases = 0
+        self._backoff_events: dict[str, int] = {}
+
+    @property
+    def max_limit(self) -> int:
+        return self._max
+
+    @property
+    def stats(self) -> ConcurrencyStatsDto:
+        return ConcurrencyStatsDto(
+            limit=self._limit,
+            min_limit=self._min,
+            max_limit=self._max,
+            in_flight=self._in_flight,
+            latency_ewma_ms=round((self._latency_ewma or 0.0) * 1000, 2),
+            latency_baseline_ms=round((self._latency_baseline or 0.0) * 1000, 2),
+            increases=self._increases,
+            decreases=self._decreases,
+            backoff_events=dict(self._backoff_events),
+        )
+
+    async def __aenter__(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self._limit)
+            self._in_flight += 1
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def on_success(self, latency: float) -> None:
+        if self._latency_ewma is None:
+            self._latency_ewma = latency
+        else:
+            self._latency_ewma += AimdLimiter._EWMA_ALPHA * (latency - self._latency_ewma)
+        if self._latency_baseline is None or self._latency_ewma < self._latency_baseline:
+            self._latency_baseline = self._latency_ewma
+        else:
+            drift = self._latency_ewma - self._latency_baseline
+            self._latency_baseline += AimdLimiter._BASELINE_DRIFT * drift
+
+        self._successes += 1
+        if self._successes < self._limit or self._limit >= self._max or self._cooling_down():
+            return
+        self._successes = 0
+        if self._latency_ewma <= self._latency_baseline * self._latency_tolerance:
+            self._limit += 1
+            self._increases += 1
+
+    def on_backoff(self, reason: str) -> None:
+        self._backoff_events[reason] = self._backoff_events.get(reason, 0) + 1
+        if self._cooling_down():
+            return
+        self._last_backoff = time.monotonic()
+        self._successes = 0
+        decreased = self._clamp(int(self._limit * self._decrease_factor))
+        if decreased < self._limit:
+            self._limit = decreased
+            self._decreases += 1
+
+    def _cooling_down(self) -> bool:
+        return time.monotonic() - self._last_backoff < max(1.0, 2 * (self._latency_ewma or 0.0))
+
+    def _clamp(self, value: int) -> int:
+        return max(self._min, min(self._max, value))
@@ -0,0 +1,47 @@
+import asyncio
+import time
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: int) -> None:
+        self._rate = rate
+        self._capacity = max(1, capacity)
+        self._tokens = float(self._capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> float:
+        """Takes one token, waiting for a refill if needed, and returns the seconds waited."""
+        async with self._lock:
+            self._refill()
+            waited = 0.0
+            if self._tokens < 1:
+                waited = (1 - self._tokens) / self._rate
+                await asyncio.sleep(waited)
+                self._refill()
+            self._tokens -= 1
+            return waited
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+
+class HostRateLimiter:
+    """One token bucket per host, so retries cannot burst past the host's request rate."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._buckets: dict[str, TokenBucket] = {}
+
+    async def acquire(self, url: str) -> float:
+        if self._rate <= 0:
+            return 0.0
+        host = urlsplit(url).netloc
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = TokenBucket(rate=self._rate, capacity=self._burst)
+        return await bucket.acquire()
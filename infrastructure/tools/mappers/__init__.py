@@ -1,6 +1,8 @@
 __all__ = [
+    "CrawlCheckpointMapper",
     "DomainMapper",
+    "DomainSnapshotMapper",
     "DomainSourceMapper",
 ]
 
-from .domain_mapper import DomainMapper, DomainSourceMapper
+from .domain_mapper import CrawlCheckpointMapper, DomainMapper, DomainSnapshotMapper, DomainSourceMapper
@@ -1,5 +1,17 @@
-from domain.entities import AddDomainDto, DomainSourceDto, DomainSourceDtoWithDomains, GetDomainDto
-from infrastructure.database import Domain, DomainSource
+from datetime import datetime, timezone
+from typing import Any
+
+from domain.entities import (
+    AddDomainDto,
+    AddDomainRow,
+    CrawlCheckpointDto,
+    DomainMoverDto,
+    DomainSnapshotDto,
+    DomainSourceDto,
+    DomainSourceDtoWithDomains,
+    GetDomainDto,
+)
+from infrastructure.database import CrawlCheckpoint, Domain, DomainSnapshot, DomainSource
 
 
 class DomainMapper:
@@ -7,6 +19,11 @@ class DomainMapper:
     def from_dto_list(dtos: list[AddDomainDto], source_id: int) -> list[Domain]:
         return [DomainMapper.from_dto(dto, source_id) for dto in dtos]
 
+    @staticmethod
+    def to_row_list(rows: list[AddDomainRow], source_id: int, collected_at: datetime) -> list[dict[str, Any]]:
+        unique = {row["name"]: DomainMapper.to_row(row, source_id, collected_at) for row in rows}
+        return list(unique.values())
+
     @staticmethod
     def to_dto_list(domains: list[Domain]) -> list[GetDomainDto]:
         return [DomainMapper.to_dto(domain) for domain in domains]
@@ -22,6 +39,18 @@ class DomainMapper:
             domain_source_id=source_id,
         )
 
+    @staticmethod
+    def to_row(row: AddDomainRow, source_id: int, collected_at: datetime) -> dict[str, Any]:
+        return {
+            "name": row["name"],
+            "price": row.get("price", 0),
+            "bids": row["bids"],
+            "collected_at": collected_at,
+            "domain_created_at": row.get("domain_created_at"),
+            "auction_ended_at": row["auction_ended_at"],
+            "domain_source_id": source_id,
+        }
+
     @staticmethod
     def to_dto(domain: Domain) -> GetDomainDto:
         return GetDomainDto(
@@ -60,3 +89,75 @@ class DomainSourceMapper:
             name=source.name,
             domains=DomainMapper.to_dto_list(source.domains),
         )
+
+
+class DomainSnapshotMapper:
+    @staticmethod
+    def to_row(domain_id: int, row: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "domain_id": domain_id,
+            "price": row["price"],
+            "bids": row["bids"],
+            "captured_at": row["collected_at"],
+        }
+
+    @staticmethod
+    def to_dto_list(snapshots: list[DomainSnapshot]) -> list[DomainSnapshotDto]:
+        return [DomainSnapshotMapper.to_dto(snapshot) for snapshot in snapshots]
+
+    @staticmethod
+    def to_dto(snapshot: DomainSnapshot) -> DomainSnapshotDto:
+        return DomainSnapshotDto(
+            price=snapshot.price,
+            bids=snapshot.bids,
+            captured_at=snapshot.captured_at,
+        )
+
+    @staticmethod
+    def to_mover_dto(row: Any) -> DomainMoverDto:
+        return DomainMoverDto(
+            id=row.id,
+            name=row.name,
+            price=row.price,
+            bids=row.bids,
+            price_change=row.price_change,
+            bids_change=row.bids_change,
+        )
+
+
+class CrawlCheckpointMapper:
+    @staticmethod
+    def to_row(checkpoint: CrawlCheckpointDto, source_id: int, updated_at: datetime) -> dict[str, Any]:
+        return {
+            "domain_source_id": source_id,
+            "window_start": checkpoint.window_start,
+            "window_end": checkpoint.window_end,
+            "total": checkpoint.total,
+            "next_offset": checkpoint.next_offset,
+            "completed": checkpoint.completed,
+            "high_watermark": checkpoint.high_watermark,
+            "updated_at": updated_at,
+        }
+
+    @staticmethod
+    def to_dto_list(checkpoints: list[CrawlCheckpoint]) -> list[CrawlCheckpointDto]:
+        return [CrawlCheckpointMapper.to_dto(checkpoint) for checkpoint in checkpoints]
+
+    @staticmethod
+    def to_dto(checkpoint: CrawlCheckpoint) -> CrawlCheckpointDto:
+        return CrawlCheckpointDto(
+            window_start=CrawlCheckpointMapper._as_utc(checkpoint.window_start),
+            window_end=CrawlCheckpointMapper._as_utc(checkpoint.window_end),
+            total=checkpoint.total,
+            next_offset=checkpoint.next_offset,
+            completed=checkpoint.completed,
+            high_watermark=(
+                CrawlCheckpointMapper._as_utc(checkpoint.high_watermark)
+                if checkpoint.high_watermark is not None
+                else None
+            ),
+        )
+
+    @staticmethod
+    def _as_utc(value: datetime) -> datetime:
+        return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
@@ -0,0 +1,12 @@
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "Metric",
+    "MetricsRegistry",
+    "ServiceMetrics",
+]
+
+from .metric_instruments import Counter, Gauge, Histogram, Metric
+from .metrics_registry import MetricsRegistry
+from .service_metrics import ServiceMetrics
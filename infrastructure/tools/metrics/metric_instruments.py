@@ -0,0 +1,157 @@
+import bisect
+import math
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+Sample = tuple[str, dict[str, str], float]
+
+
+class Metric:
+    """Base of the in-process instruments; values are keyed by label values in ``label_names`` order."""
+
+    TYPE = "untyped"
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+
+    def collect(self) -> list[Sample]:
+        return []
+
+    def drain(self) -> dict[tuple[str, ...], Any]:
+        """Returns what was recorded since the last drain and forgets it; gauges have nothing to ship."""
+        return {}
+
+    def merge(self, values: dict[tuple[str, ...], Any]) -> None:
+        """Adds values drained from the same instrument in another process."""
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        if labels.keys() != set(self.label_names):
+            raise ValueError(f"{self.name} expects labels {self.label_names}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def _labels(self, key: tuple[str, ...]) -> dict[str, str]:
+        return dict(zip(self.label_names, key))
+
+
+class Counter(Metric):
+    TYPE = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, label_names)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        if amount < 0:
+            raise ValueError(f"{self.name} can only increase")
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def collect(self) -> list[Sample]:
+        return [(self.name, self._labels(key), value) for key, value in self._values.items()]
+
+    def drain(self) -> dict[tuple[str, ...], Any]:
+        values, self._values = self._values, {}
+        return values
+
+    def merge(self, values: dict[tuple[str, ...], Any]) -> None:
+        for key, value in values.items():
+            self._values[key] = self._values.get(key, 0.0) + value
+
+
+class Gauge(Metric):
+    """A value that is either set directly or read from ``function`` at collection time."""
+
+    TYPE = "gauge"
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, label_names)
+        self._values: dict[tuple[str, ...], float] = {}
+        self._function: Callable[[], float] | None = None
+
+    def set(self, value: float, **labels: str) -> None:
+        self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        if len(self.label_names) > 0:
+            raise ValueError(f"{self.name} has labels and can not be read from a function")
+        self._function = function
+
+    def collect(self) -> list[Sample]:
+        if self._function is not None:
+            return [(self.name, {}, float(self._function()))]
+        return [(self.name, self._labels(key), value) for key, value in self._values.items()]
+
+
+class Histogram(Metric):
+    TYPE = "histogram"
+    DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, label_names)
+        self._buckets = tuple(sorted(buckets))
+        self._counts: dict[tuple[str, ...], list[int]] = {}
+        self._sums: dict[tuple[str, ...], float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        counts = self._counts.get(key)
+        if counts is None:
+            counts = self._counts[key] = [0] * (len(self._buckets) + 1)
+            self._sums[key] = 0.0
+        counts[bisect.bisect_left(self._buckets, value)] += 1
+        self._sums[key] += value
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start_time, **labels)
+
+    def collect(self) -> list[Sample]:
+        samples: list[Sample] = []
+        for key, counts in self._counts.items():
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, count in zip((*self._buckets, math.inf), counts):
+                cumulative += count
+                samples.append((f"{self.name}_bucket", {**labels, "le": Histogram._bound(bound)}, cumulative))
+            samples.append((f"{self.name}_sum", labels, self._sums[key]))
+            samples.append((f"{self.name}_count", labels, cumulative))
+        return samples
+
+    def drain(self) -> dict[tuple[str, ...], Any]:
+        drained = {key: (counts, self._sums[key]) for key, counts in self._counts.items()}
+        self._counts, self._sums = {}, {}
+        return drained
+
+    def merge(self, values: dict[tuple[str, ...], Any]) -> None:
+        for key, (counts, total) in values.items():
+            merged = self._counts.setdefault(key, [0] * (len(self._buckets) + 1))
+            for i, count in enumerate(counts):
+                merged[i] += count
+            self._sums[key] = self._sums.get(key, 0.0) + total
+
+    @staticmethod
+    def _bound(bound: float) -> str:
+        return "+Inf" if math.isinf(bound) else repr(bound)
@@ -0,0 +1,87 @@
+from typing import Any, TypeVar
+
+from infrastructure.tools.metrics.metric_instruments import Counter, Gauge, Histogram, Metric
+
+M = TypeVar("M", bound=Metric)
+
+
+class MetricsRegistry:
+    """In-process registry rendered in the Prometheus text exposition format (version 0.0.4).
+
+    Instruments are only touched from the event loop, so updates are plain attribute writes.
+    """
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+
+    def counter(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, documentation, label_names))
+
+    def gauge(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, label_names))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = Histogram.DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, label_names, buckets))
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {MetricsRegistry._escape_help(metric.documentation)}")
+            lines.append(f"# TYPE {metric.name} {metric.TYPE}")
+            for name, labels, value in metric.collect():
+                lines.append(
+                    f"{name}{MetricsRegistry._format_labels(labels)} {MetricsRegistry._format(value)}"
+                )
+        return "\n".join(lines) + "\n"
+
+    def drain(self) -> dict[str, dict[tuple[str, ...], Any]]:
+        """Counter and histogram samples recorded since the last drain, keyed by metric name.
+
+        Used by crawl worker processes, whose registries are never rendered, to ship their samples
+        to the API process registry through ``merge``.
+        """
+        drained = {name: metric.drain() for name, metric in self._metrics.items()}
+        return {name: values for name, values in drained.items() if len(values) > 0}
+
+    def merge(self, samples: dict[str, dict[tuple[str, ...], Any]]) -> None:
+        for name, values in samples.items():
+            metric = self._metrics.get(name)
+            if metric is not None:
+                metric.merge(values)
+
+    def _register(self, metric: M) -> M:
+        if metric.name in self._metrics:
+            raise ValueError(f"metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    @staticmethod
+    def _format_labels(labels: dict[str, str]) -> str:
+        if len(labels) == 0:
+            return ""
+        pairs = ",".join(f'{name}="{MetricsRegistry._escape_label(value)}"' for name, value in labels.items())
+        return "{" + pairs + "}"
+
+    @staticmethod
+    def _format(value: float) -> str:
+        if value == float("inf"):
+            return "+Inf"
+        if value == float("-inf"):
+            return "-Inf"
+        return repr(float(value))
+
+    @staticmethod
+    def _escape_help(text: str) -> str:
+        return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+    @staticmethod
+    def _escape_label(value: str) -> str:
+        return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
@@ -0,0 +1,71 @@
+from infrastructure.tools.metrics.metrics_registry import MetricsRegistry
+
+
+class ServiceMetrics:
+    """The service's named instruments, created once on a registry and shared by crawl, storage and HTTP."""
+
+    _PREFIX = "domain_parser_"
+
+    def __init__(self, registry: MetricsRegistry) -> None:
+        self.registry = registry
+        p = ServiceMetrics._PREFIX
+        self.pages_fetched = registry.counter(
+            f"{p}pages_fetched_total", "Result pages fetched successfully.", ("source",)
+        )
+        self.pages_failed = registry.counter(
+            f"{p}pages_failed_total", "Result page fetch attempts that failed.", ("source", "reason")
+        )
+        self.windows_failed = registry.counter(
+            f"{p}windows_failed_total", "Crawl time windows aborted by an unexpected error.", ("source",)
+        )
+        self.domains_parsed = registry.counter(
+            f"{p}domains_parsed_total", "Result items validated into insert rows.", ("source",)
+        )
+        self.validation_rejects = registry.counter(
+            f"{p}validation_rejects_total", "Result items dropped by validation.", ("source",)
+        )
+        self.rows_deduplicated = registry.counter(
+            f"{p}rows_deduplicated_total",
+            "Parsed rows dropped as already seen in the same crawl.",
+            ("source",),
+        )
+        self.browser_restarts = registry.counter(
+            f"{p}browser_restarts_total", "Browser relaunches after a crash or disconnect."
+        )
+        self.rows_inserted = registry.counter(f"{p}rows_inserted_total", "Domain rows inserted.")
+        self.rows_updated = registry.counter(f"{p}rows_updated_total", "Existing domain rows upserted.")
+        self.page_fetch_seconds = registry.histogram(
+            f"{p}page_fetch_seconds", "Latency of successful result page fetches.", ("source",)
+        )
+        self.db_commit_seconds = registry.histogram(
+            f"{p}db_commit_seconds", "Duration of a bulk upsert transaction, from write lock to commit."
+        )
+        self.http_request_seconds = registry.histogram(
+            f"{p}http_request_seconds",
+            "HTTP request latency by route template.",
+            ("method", "route", "status"),
+        )
+        self.loop_lag_seconds = registry.histogram(
+            f"{p}loop_lag_seconds",
+            "How late the event loop heartbeat wakes up.",
+            buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+        )
+        self.concurrency_backoffs = registry.counter(
+            f"{p}concurrency_backoffs_total",
+            "Backoff signals received by the AIMD concurrency limiter.",
+            ("source", "reason"),
+        )
+        self.queue_rows = registry.gauge(f"{p}queue_rows", "Rows waiting for the writer across running jobs.")
+        self.active_jobs = registry.gauge(f"{p}active_jobs", "Crawl jobs currently running.")
+        self.concurrency_limit = registry.gauge(
+            f"{p}concurrency_limit", "Current AIMD concurrency limits, summed over running jobs."
+        )
+        self.open_pages = registry.gauge(
+            f"{p}open_pages", "Browser pages open in the page pools of running jobs."
+        )
+        self.log_records_dropped = registry.gauge(
+            f"{p}log_records_dropped", "Log records dropped since start because the log queue was full."
+        )
+        self.log_records_sampled_out = registry.gauge(
+            f"{p}log_records_sampled_out", "Log records skipped since start by per-logger sampling."
+        )
@@ -0,0 +1,6 @@
+__all__ = [
+    "TimeWindow",
+    "TimeWindowPlanner",
+]
+
+from .time_window_planner import TimeWindow, TimeWindowPlanner
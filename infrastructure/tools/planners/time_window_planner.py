@@ -0,0 +1,91 @@
+import bisect
+import math
+from datetime import datetime, timedelta
+
+from pydantic import BaseModel, ConfigDict
+
+
+class TimeWindow(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    start: datetime
+    end: datetime
+
+    @property
+    def span(self) -> timedelta:
+        return self.end - self.start
+
+
+class TimeWindowPlanner:
+    """Plans consecutive auction end-time windows sized toward a target page count.
+
+    ``observe`` feeds back the ``pagination.total`` of a window's first page: the span of the
+    windows planned next is rescaled by target/total, so sparse stretches are merged into wider
+    windows and dense ones get narrower, and a window far above target is split into sub-windows.
+    ``known`` windows (e.g. from crawl checkpoints) are replayed with their exact bounds and
+    planned windows are cut short at the next known one, so checkpoints stay addressable.
+    """
+
+    _SPLIT_FACTOR = 2
+    _MAX_SPLITS = 8
+
+    def __init__(
+        self,
+        start: datetime,
+        page_size: int,
+        target_pages: int,
+        initial_span: timedelta,
+        min_span: timedelta,
+        max_span: timedelta,
+        horizon: timedelta,
+        known: list[TimeWindow] | None = None,
+    ) -> None:
+        self._cursor = start
+        self._stop = start + horizon
+        self._target_items = max(1, page_size * target_pages)
+        self._span = initial_span
+        self._min_span = min_span
+        self._max_span = max_span
+        self._known = sorted(known or [], key=lambda w: w.start)
+        self._known_starts = [w.start for w in self._known]
+
+    @property
+    def span(self) -> timedelta:
+        return self._span
+
+    def next_window(self) -> TimeWindow | None:
+        if self._cursor >= self._stop:
+            return None
+        index = bisect.bisect_right(self._known_starts, self._cursor) - 1
+        if index >= 0 and self._known[index].end > self._cursor:
+            known = self._known[index]
+            self._cursor = known.end
+            return known
+        end = min(self._cursor + self._span, self._stop)
+        if index + 1 < len(self._known):
+            end = min(end, self._known[index + 1].start)
+        window = TimeWindow(start=self._cursor, end=end)
+        self._cursor = end
+        return window
+
+    def observe(self, window: TimeWindow, total: int) -> list[TimeWindow]:
+        """Adapts the span of upcoming windows and returns sub-windows if this one is too dense."""
+        if total <= 0:
+            self._span = self._clamp(self._span * 2)
+            return []
+        self._span = self._clamp(window.span * (self._target_items / total))
+        if total <= self._target_items * TimeWindowPlanner._SPLIT_FACTOR or window.span <= self._min_span:
+            return []
+        parts = min(
+            math.ceil(total / self._target_items),
+            TimeWindowPlanner._MAX_SPLITS,
+            max(1, int(window.span / self._min_span)),
+        )
+        if parts < 2:
+            return []
+        step = window.span / parts
+        bounds = [window.start + step * i for i in range(parts)] + [window.end]
+        return [TimeWindow(start=bounds[i], end=bounds[i + 1]) for i in range(parts)]
+
+    def _clamp(self, span: timedelta) -> timedelta:
+        return max(self._min_span, min(self._max_span, span))
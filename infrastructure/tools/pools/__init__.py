@@ -0,0 +1,5 @@
+__all__ = [
+    "PagePool",
+]
+
+from .page_pool import PagePool
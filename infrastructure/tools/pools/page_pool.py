@@ -0,0 +1,112 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from playwright.async_api import BrowserContext, Page
+
+from domain.entities import PagePoolStatsDto
+
+
+class PagePool:
+    """Bounded pool of long-lived pages of one browser context.
+
+    A page is reset to a blank document when it is returned; pages that crashed, were closed
+    or were marked broken (e.g. landed on an error page) are evicted and replaced lazily.
+    """
+
+    _BLANK_URL = "about:blank"
+    _ERROR_URL_PREFIX = "chrome-error://"
+
+    def __init__(self, context: BrowserContext, size: int) -> None:
+        self._context = context
+        self._size = max(1, size)
+        self._semaphore = asyncio.Semaphore(value=self._size)
+        self._idle: list[Page] = []
+        self._broken: set[Page] = set()
+        self._open = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._resets = 0
+        self._reset_latency_ms = 0.0
+
+    @property
+    def stats(self) -> PagePoolStatsDto:
+        return PagePoolStatsDto(
+            size=self._size,
+            open_pages=self._open,
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            resets=self._resets,
+            reset_latency_ms_total=round(self._reset_latency_ms, 2),
+            reset_latency_ms_avg=round(self._reset_latency_ms / self._resets, 2) if self._resets else 0.0,
+        )
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[Page]:
+        await self._semaphore.acquire()
+        try:
+            page = await self._acquire()
+            try:
+                yield page
+            finally:
+                await self._release(page)
+        finally:
+            self._semaphore.release()
+
+    def mark_broken(self, page: Page) -> None:
+        self._broken.add(page)
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for page in idle:
+            self._open -= 1
+            await PagePool._close_page(page)
+
+    async def _acquire(self) -> Page:
+        while self._idle:
+            page = self._idle.pop()
+            if self._is_healthy(page):
+                self._hits += 1
+                return page
+            await self._evict(page)
+        self._misses += 1
+        page = await self._context.new_page()
+        page.on("crash", self.mark_broken)
+        self._open += 1
+        return page
+
+    async def _release(self, page: Page) -> None:
+        if not self._is_healthy(page):
+            await self._evict(page)
+            return
+        start_time = time.perf_counter()
+        try:
+            await page.goto(PagePool._BLANK_URL)
+        except Exception:
+            await self._evict(page)
+            return
+        self._resets += 1
+        self._reset_latency_ms += (time.perf_counter() - start_time) * 1000
+        self._idle.append(page)
+
+    async def _evict(self, page: Page) -> None:
+        self._broken.discard(page)
+        self._evictions += 1
+        self._open -= 1
+        await PagePool._close_page(page)
+
+    def _is_healthy(self, page: Page) -> bool:
+        if page in self._broken or page.is_closed():
+            return False
+        return not page.url.startswith(PagePool._ERROR_URL_PREFIX)
+
+    @staticmethod
+    async def _close_page(page: Page) -> None:
+        try:
+            if not page.is_closed():
+                await page.close()
+        except Exception:
+            pass
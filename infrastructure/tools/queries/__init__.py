@@ -0,0 +1,5 @@
+__all__ = [
+    "DomainQueryBuilder",
+]
+
+from .domain_query_builder import DomainQueryBuilder
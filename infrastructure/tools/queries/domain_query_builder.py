@@ -0,0 +1,98 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import ColumnElement, Select, and_, literal, select, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+
+from domain.entities import DomainQueryDto
+from domain.enums import DomainSortField, SortOrder
+from infrastructure.database import Domain
+
+
+class DomainQueryBuilder:
+    """Builds filtered, keyset-paginated selects over the domains table.
+
+    A cursor is the (sort value, id) pair of the last returned row, so every page is an index
+    range scan instead of an OFFSET that grows with the page number.
+    """
+
+    _SORT_COLUMNS: dict[DomainSortField, InstrumentedAttribute] = {
+        DomainSortField.ID: Domain.id,
+        DomainSortField.PRICE: Domain.price,
+        DomainSortField.BIDS: Domain.bids,
+        DomainSortField.AUCTION_ENDED_AT: Domain.auction_ended_at,
+        DomainSortField.COLLECTED_AT: Domain.collected_at,
+    }
+    _DATETIME_FIELDS = (DomainSortField.AUCTION_ENDED_AT, DomainSortField.COLLECTED_AT)
+
+    @staticmethod
+    def filters(query: DomainQueryDto) -> list[ColumnElement[bool]]:
+        conditions: list[ColumnElement[bool]] = []
+        if query.price_min is not None:
+            conditions.append(Domain.price >= query.price_min)
+        if query.price_max is not None:
+            conditions.append(Domain.price <= query.price_max)
+        if query.bids_min is not None:
+            conditions.append(Domain.bids >= query.bids_min)
+        if query.bids_max is not None:
+            conditions.append(Domain.bids <= query.bids_max)
+        if query.ended_after is not None:
+            conditions.append(Domain.auction_ended_at >= query.ended_after)
+        if query.ended_before is not None:
+            conditions.append(Domain.auction_ended_at < query.ended_before)
+        if query.source_id is not None:
+            conditions.append(Domain.domain_source_id == query.source_id)
+        if query.collected_since is not None:
+            conditions.append(Domain.collected_at >= query.collected_since)
+        return conditions
+
+    @staticmethod
+    def page(query: DomainQueryDto, limit: int) -> Select:
+        """Raises ValueError when the query carries a malformed cursor."""
+        column = DomainQueryBuilder._SORT_COLUMNS[query.sort_by]
+        conditions = DomainQueryBuilder.filters(query)
+        if query.cursor:
+            value, last_id = DomainQueryBuilder.decode_cursor(query.cursor, query.sort_by)
+            conditions.append(DomainQueryBuilder._after(column, value, last_id, query.order))
+        statement = select(Domain).where(and_(True, *conditions))
+        if query.order == SortOrder.ASC:
+            statement = statement.order_by(column.asc(), Domain.id.asc())
+        else:
+            statement = statement.order_by(column.desc(), Domain.id.desc())
+        return statement.limit(limit)
+
+    @staticmethod
+    def _after(
+        column: InstrumentedAttribute, value: Any, last_id: int, order: SortOrder
+    ) -> ColumnElement[bool]:
+        if column is Domain.id:
+            key, bound = tuple_(Domain.id), tuple_(literal(last_id))
+        else:
+            key, bound = tuple_(column, Domain.id), tuple_(literal(value, column.type), literal(last_id))
+        return key > bound if order == SortOrder.ASC else key < bound
+
+    @staticmethod
+    def encode_cursor(domain: Domain, sort_by: DomainSortField) -> str:
+        value: Any = getattr(domain, sort_by.value)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        raw = json.dumps([sort_by.value, value, domain.id]).encode()
+        return base64.urlsafe_b64encode(raw).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str, sort_by: DomainSortField) -> tuple[Any, int]:
+        try:
+            field, value, last_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as e:
+            raise ValueError("malformed cursor") from e
+        if field != sort_by.value or not isinstance(last_id, int):
+            raise ValueError("cursor does not match the requested sort")
+        if sort_by in DomainQueryBuilder._DATETIME_FIELDS:
+            try:
+                value = datetime.fromisoformat(value)
+            except (ValueError, TypeError) as e:
+                raise ValueError("malformed cursor") from e
+        return value, last_id
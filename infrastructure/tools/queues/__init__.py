@@ -0,0 +1,5 @@
+__all__ = [
+    "RowQueue",
+]
+
+from .row_queue import RowQueue
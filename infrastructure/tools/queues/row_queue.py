@@ -0,0 +1,40 @@
+import asyncio
+from collections import deque
+from typing import Any, Sized
+
+
+class RowQueue(asyncio.Queue):
+    """Queue of row batches bounded by the total number of queued rows.
+
+    ``put`` waits while ``max_rows`` or more rows are queued, so producers are slowed down by
+    what the writer has not committed yet rather than by the number of batches. An item
+    without a length (e.g. an end-of-stream sentinel) counts as zero rows.
+    """
+
+    def __init__(self, max_rows: int) -> None:
+        super().__init__()
+        self._max_rows = max(1, max_rows)
+        self._rows = 0
+
+    @property
+    def rows(self) -> int:
+        return self._rows
+
+    def full(self) -> bool:
+        return self._rows >= self._max_rows
+
+    def _init(self, maxsize: int) -> None:
+        self._queue: deque[Any] = deque()
+
+    def _put(self, item: Any) -> None:
+        self._queue.append(item)
+        self._rows += RowQueue._size_of(item)
+
+    def _get(self) -> Any:
+        item = self._queue.popleft()
+        self._rows -= RowQueue._size_of(item)
+        return item
+
+    @staticmethod
+    def _size_of(item: Any) -> int:
+        return len(item) if isinstance(item, Sized) else 0
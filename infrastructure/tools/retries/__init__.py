@@ -0,0 +1,5 @@
+__all__ = [
+    "RetryLedger",
+]
+
+from .retry_ledger import RetryLedger
@@ -0,0 +1,55 @@
+import random
+from collections import deque
+
+from domain.entities import DeadLetterDto, RetryStatsDto
+from domain.exceptions import PageFetchError
+
+
+class RetryLedger:
+    """Per-URL attempt bookkeeping with exponential backoff and full jitter.
+
+    ``on_failure`` returns how long to wait before the next attempt, or None once the URL is
+    out of attempts or failed with a status that will not change on retry; such URLs are moved
+    to the dead-letter list.
+    """
+
+    _NOT_RETRYABLE = (400, 401, 404, 410)
+
+    def __init__(
+        self, max_attempts: int, base_delay: float, max_delay: float, dead_letters_max: int = 100
+    ) -> None:
+        self._max_attempts = max(1, max_attempts)
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._attempts: dict[str, int] = {}
+        self._dead_letters: deque[DeadLetterDto] = deque(maxlen=dead_letters_max)
+        self._dead_letters_total = 0
+        self._retries = 0
+        self._recovered = 0
+
+    @property
+    def stats(self) -> RetryStatsDto:
+        return RetryStatsDto(
+            retries=self._retries,
+            recovered=self._recovered,
+            pending=len(self._attempts),
+            dead_letters_total=self._dead_letters_total,
+            dead_letters=list(self._dead_letters),
+        )
+
+    def on_success(self, url: str) -> None:
+        if self._attempts.pop(url, None) is not None:
+            self._recovered += 1
+
+    def on_failure(self, url: str, error: PageFetchError) -> float | None:
+        attempts = self._attempts.get(url, 0) + 1
+        if attempts >= self._max_attempts or error.status in RetryLedger._NOT_RETRYABLE:
+            self._attempts.pop(url, None)
+            self._dead_letters_total += 1
+            self._dead_letters.append(
+                DeadLetterDto(url=url, attempts=attempts, status=error.status, reason=error.reason)
+            )
+            return None
+        self._attempts[url] = attempts
+        self._retries += 1
+        return random.uniform(0, min(self._max_delay, self._base_delay * 2 ** (attempts - 1)))
@@ -0,0 +1,5 @@
+__all__ = [
+    "DomainRowValidator",
+]
+
+from .domain_row_validator import DomainRowValidator
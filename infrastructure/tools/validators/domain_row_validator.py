@@ -0,0 +1,27 @@
+from typing import Any
+
+from pydantic import TypeAdapter, ValidationError
+
+from domain.entities import AddDomainRow
+
+
+class DomainRowValidator:
+    """Validates a whole ``results`` array into insert rows with a single list validator call.
+
+    Invalid items are dropped: their indexes are taken from the validation error and the
+    remaining items are validated again, so a bad item costs one extra pass, not a per-item loop.
+    """
+
+    _ROWS = TypeAdapter(list[AddDomainRow])
+
+    @staticmethod
+    def validate(items: list[dict[str, Any]]) -> list[AddDomainRow]:
+        while len(items) > 0:
+            try:
+                return DomainRowValidator._ROWS.validate_python(items)
+            except ValidationError as e:
+                invalid = {error["loc"][0] for error in e.errors() if len(error["loc"]) > 0}
+                if len(invalid) == 0:
+                    return []
+                items = [item for index, item in enumerate(items) if index not in invalid]
+        return []
@@ -0,0 +1,40 @@
+"""domain query indexes
+
+Revision ID: 3c9d2e7f4a1b
+Revises: 864f580e249b
+Create Date: 2026-10-18 14:20:11.402913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9d2e7f4a1b'
+down_revision: Union[str, Sequence[str], None] = '864f580e249b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_domains_auction_ended_at_price',
+        'domains',
+        ['auction_ended_at', 'price'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_domains_domain_source_id_collected_at',
+        'domains',
+        ['domain_source_id', 'collected_at'],
+        unique=False,
+    )
+    op.create_index('ix_domains_bids', 'domains', ['bids'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_domains_bids', table_name='domains')
+    op.drop_index('ix_domains_domain_source_id_collected_at', table_name='domains')
+    op.drop_index('ix_domains_auction_ended_at_price', table_name='domains')
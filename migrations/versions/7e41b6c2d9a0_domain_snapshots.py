@@ -0,0 +1,48 @@
+"""domain snapshots
+
+Revision ID: 7e41b6c2d9a0
+Revises: 3c9d2e7f4a1b
+Create Date: 2026-10-18 17:05:42.118204
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '7e41b6c2d9a0'
+down_revision: Union[str, Sequence[str], None] = '3c9d2e7f4a1b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('domain_snapshots',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('domain_id', sa.Integer(), nullable=False),
+    sa.Column('price', sa.Integer(), nullable=False),
+    sa.Column('bids', sa.Integer(), nullable=False),
+    sa.Column('captured_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['domain_id'], ['domains.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_domain_snapshots_domain_id_captured_at',
+        'domain_snapshots',
+        ['domain_id', 'captured_at'],
+        unique=False,
+    )
+    op.create_index('ix_domain_snapshots_captured_at', 'domain_snapshots', ['captured_at'], unique=False)
+    op.execute("""
+        INSERT INTO domain_snapshots (domain_id, price, bids, captured_at)
+        SELECT id, price, bids, collected_at FROM domains
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_domain_snapshots_captured_at', table_name='domain_snapshots')
+    op.drop_index('ix_domain_snapshots_domain_id_captured_at', table_name='domain_snapshots')
+    op.drop_table('domain_snapshots')
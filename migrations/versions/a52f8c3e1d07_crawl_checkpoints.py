@@ -0,0 +1,53 @@
+"""crawl checkpoints
+
+Revision ID: a52f8c3e1d07
+Revises: 7e41b6c2d9a0
+Create Date: 2026-10-18 18:32:09.540117
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'a52f8c3e1d07'
+down_revision: Union[str, Sequence[str], None] = '7e41b6c2d9a0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('crawl_checkpoints',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('domain_source_id', sa.Integer(), nullable=False),
+    sa.Column('window_start', sa.DateTime(), nullable=False),
+    sa.Column('window_end', sa.DateTime(), nullable=False),
+    sa.Column('total', sa.Integer(), nullable=False),
+    sa.Column('next_offset', sa.Integer(), nullable=False),
+    sa.Column('completed', sa.Boolean(), nullable=False),
+    sa.Column('high_watermark', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['domain_source_id'], ['domain_sources.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_crawl_checkpoints_source_window',
+        'crawl_checkpoints',
+        ['domain_source_id', 'window_start', 'window_end'],
+        unique=True,
+    )
+    op.create_index(
+        'ix_crawl_checkpoints_domain_source_id_window_end',
+        'crawl_checkpoints',
+        ['domain_source_id', 'window_end'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_crawl_checkpoints_domain_source_id_window_end', table_name='crawl_checkpoints')
+    op.drop_index('ix_crawl_checkpoints_source_window', table_name='crawl_checkpoints')
+    op.drop_table('crawl_checkpoints')
@@ -0,0 +1,80 @@
+import os
+import pathlib
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator
+
+import pytest
+from alembic import command
+from alembic.config import Config
+
+from application.caches import ResponseCache
+from application.services import DomainService, SourceRegistry
+from domain.entities import AddDomainRow
+from domain.enums import DomainSourceType
+from infrastructure.database import DbContext
+from infrastructure.repositories import DomainRepository, DomainSnapshotRepository, DomainSourceRepository
+from infrastructure.tools.metrics import MetricsRegistry, ServiceMetrics
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+_SOURCE = DomainSourceType.AUCTIONS_GO_DADDY.value
+
+
+@pytest.fixture
+def db_path(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> str:
+    path = str(tmp_path / "test.db")
+    monkeypatch.setenv("DB__URL", path)
+    command.upgrade(Config(os.path.join(_ROOT, "alembic.ini")), "head")
+    return path
+
+
+@pytest.fixture
+async def context(db_path: str) -> AsyncIterator[DbContext]:
+    context = DbContext(url=db_path)
+    yield context
+    await context.close()
+
+
+@pytest.fixture
+async def cache() -> ResponseCache:
+    return ResponseCache(max_entries=16, ttl=60)
+
+
+@pytest.fixture
+async def service(context: DbContext, cache: ResponseCache) -> DomainService:
+    registry = SourceRegistry(source_repository=DomainSourceRepository(context=context))
+    await registry.load()
+    metrics = ServiceMetrics(registry=MetricsRegistry())
+    return DomainService(
+        domain_repository=DomainRepository(context=context, metrics=metrics),
+        snapshot_repository=DomainSnapshotRepository(context=context),
+        source_registry=registry,
+        cache=cache,
+    )
+
+
+def _rows(price: int) -> list[AddDomainRow]:
+    ended_at = datetime.now(tz=timezone.utc) + timedelta(days=1)
+    return [
+        AddDomainRow(name=f"name-{i}.com", price=price, bids=i, auction_ended_at=ended_at) for i in range(10)
+    ]
+
+
+async def test_unchanged_upsert_keeps_etag(service: DomainService, cache: ResponseCache) -> None:
+    await service.bulk_create(rows=_rows(price=10), source_name=_SOURCE)
+    etag = cache.put("key", "body", cache.version).etag
+
+    result = await service.bulk_create(rows=_rows(price=10), source_name=_SOURCE)
+
+    assert (result.inserted, result.updated, result.changed) == (0, 10, 0)
+    entry = cache.get("key")
+    assert entry is not None and entry.etag == etag
+
+
+async def test_changed_upsert_invalidates_cache(service: DomainService, cache: ResponseCache) -> None:
+    await service.bulk_create(rows=_rows(price=10), source_name=_SOURCE)
+    cache.put("key", "body", cache.version)
+
+    result = await service.bulk_create(rows=_rows(price=20), source_name=_SOURCE)
+
+    assert result.changed == 10
+    assert cache.get("key") is None